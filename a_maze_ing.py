@@ -35,6 +35,11 @@ check_env.check_process()
 from pydantic import ValidationError  # noqa: E402
 from mazegen.model import ConfigModel  # noqa: E402
 from controller import Controller  # noqa: E402
+from mazegen.MazeGenerator import MazeGenerator  # noqa: E402
+from mazegen.pathfinder import PathFinder  # noqa: E402
+from mazegen.utils.memory import (  # noqa: E402
+    estimate_stream_memory, format_bytes
+)
 
 
 print("\n===== A_maze_ing =====\n")
@@ -49,6 +54,40 @@ except ValidationError as e:
     sys.exit(1)
 
 
+if config.STREAM_OUTPUT:
+    # Eller rows go straight to the output file, the grid is never built
+    try:
+        estimate = estimate_stream_memory(config.WIDTH)
+        print(f"Streaming maze {config.WIDTH}x{config.HEIGHT}: estimated "
+              f"peak memory {format_bytes(estimate)} "
+              f"(budget {config.MEMORY_BUDGET_MB} MB)")
+        MazeGenerator.stream_output_file(config)
+    except Exception as e:
+        print("error:", {e}, file=sys.stderr)
+        sys.exit(1)
+    print(f"Maze written to {config.OUTPUT_FILE}")
+    sys.exit(0)
+
+
+if config.LARGE_MAZE:
+    # Large mazes are written straight to the output file, no rendering
+    try:
+        generator = MazeGenerator(config)
+        print(f"Large maze {config.WIDTH}x{config.HEIGHT}: estimated peak "
+              f"memory {format_bytes(generator.estimate_memory())} "
+              f"(budget {config.MEMORY_BUDGET_MB} MB)")
+        for _ in generator.generate_maze():
+            pass
+        if not generator.maze.shortest_path:
+            PathFinder().solve_shortest_path(generator.maze)
+        generator.create_output_file()
+    except Exception as e:
+        print("error:", {e}, file=sys.stderr)
+        sys.exit(1)
+    print(f"Maze written to {config.OUTPUT_FILE}")
+    sys.exit(0)
+
+
 try:
     control = Controller(config)
 except Exception as e:
@@ -2,26 +2,32 @@
 
 This module manages the interaction between the user and the maze generation
 system, handling keyboard input, animation speed control, and display updates.
+Everything runs from one event loop that sleeps in a selector until a key
+is typed or the next animation frame is due, so an idle controller does
+not wake up at all.
 
 Classes:
     Controller: Main controller orchestrating maze generation
     and user interaction
 """
 
+import selectors
 import time
 import sys
+from typing import Iterator, Optional
 from mazegen.MazeGenerator import MazeGenerator
 from keycontrol import KeyControl, TerminalManager
 from mazegen.maze.maze import Maze
 from mazegen.pathfinder.pathfinder import PathFinder
 from mazegen.model import ConfigModel
+from mazegen.utils.replay import Replay
+from mazegen.utils.timeline import Timeline
 from view import ViewFactory
 from view.tty import TtyView  # noqa F401
 from view.View import View
+from utils import FramePacer
 
 
-TIME_PAUSE = 0.05
-
 BASE_FPS = 30
 MAX_FPS = 120
 MIN_FPS = 1
@@ -31,7 +37,11 @@ class Controller:
     """
     Controls the maze generation and user interaction.
 
-    Uses KeyControl for non-blocking keyboard input via select().
+    Runs an event loop on a selector that waits for keyboard input with
+    KeyControl and for the deadline of the next animation frame. Each
+    frame runs the generation up to the next state to render, then
+    schedules the following frame; pausing or seeking away cancels the
+    deadline, so the loop only wakes up for keys.
     Manages the complete lifecycle of maze generation, display, and user input.
     """
 
@@ -41,6 +51,20 @@ class Controller:
         Args:
             config: ConfigModel with all maze generation settings
         """
+        self.__replay: Optional[Replay] = None
+        if config.REPLAY_FILE is not None:
+            # The views follow the recorded maze, not the config file
+            self.__replay = Replay.load(config.REPLAY_FILE)
+            config = config.model_copy(update={
+                "WIDTH": self.__replay.width,
+                "HEIGHT": self.__replay.height,
+                "ENTRY": self.__replay.entry,
+                "EXIT": self.__replay.exit,
+                "PERFECT": self.__replay.perfect,
+                "MODE_GEN": "animated",
+                "RECORD_FILE": None,
+            })
+            self.__replay_maze = self.__replay.build_maze()
         self.__config: ConfigModel = config
         self.__terminal_manager: TerminalManager = TerminalManager()
         self.__control: KeyControl = KeyControl(self.__terminal_manager)
@@ -49,15 +73,26 @@ class Controller:
         self.__display: View = TtyView(self.__config)
         self.__display_name = config.DISPLAY_MODE
         self.__algorithm = config.ALGORITHM
+        if self.__replay is not None and self.__replay.algorithm:
+            self.__algorithm = self.__replay.algorithm
         self.__pause = False
+        self.__skip = False
+        self.__timeline: Optional[Timeline] = None
+        self.__cursor: Optional[int] = None
         self.__restart = False  # to remove later
+        self.__selector = selectors.DefaultSelector()
+        self.__states: Optional[Iterator[Maze]] = None
+        self.__pacer: Optional[FramePacer] = None
+        self.__deadline: Optional[float] = None
+        self.__maze: Maze = self.__generator.maze
 
     def process(self) -> None:
         """Start the main event loop for maze generation and display.
 
-        Initializes the display, starts keyboard input monitoring, generates
-        the initial maze, solves it, and enters the main event loop for
-        handling user input.
+        Initializes the display, starts keyboard input monitoring, starts
+        generating the initial maze, and enters the main event loop. The
+        loop blocks until a key is typed or the next frame is due; a key
+        is handled as soon as it arrives.
         """
         try:
             self.__display = ViewFactory.create(self.__display_name,
@@ -68,123 +103,286 @@ class Controller:
         self.__control.start()
         print("\33[48;2;0;0;0m\33[2J")
         self.pathfinder = PathFinder()
+        self.__selector.register(self.__control.fileno(),
+                                 selectors.EVENT_READ)
         self.generate_and_display_maze()
-        self.solve_path()
         while True:
-            self.key_control()
-            time.sleep(0.01)
+            timeout = None
+            if self.__deadline is not None:
+                timeout = max(0.0, self.__deadline - time.monotonic())
+            if self.__selector.select(timeout):
+                keys = self.__control.read()
+                if not keys:
+                    # End of input, only the frames are left to wait for
+                    self.__selector.unregister(self.__control.fileno())
+                for key in keys:
+                    self.key_control(key)
+            if (self.__deadline is not None
+                    and time.monotonic() >= self.__deadline):
+                self.__frame()
 
-    def key_control(self) -> None:
-        """Handle keyboard input for maze control.
+    def key_control(self, key: str) -> None:
+        """Handle one key press.
 
         Processes keyboard commands:
-        - r: Regenerate maze
+        - r: Regenerate maze, or replay again
         - e: Generate new seed
+        - j: Jump to the end of the generation
+        - ,/<: Seek back in the generation
+        - ./>: Seek forward in the generation
         - p/space: Pause/unpause animation
         - +: Increase animation speed
         - -: Decrease animation speed
         - q/esc: Quit application
+
+        Args:
+            key: The pressed character
         """
-        key = self.__control.poll()
-        if key is not None:
-            if key in ("r", "R"):  # Regenerate
-                self.__maze.gen_step = 0
-                self.__restart = True
-                self.generate_and_display_maze()
-            if key in ("e", "E"):  # Regenerate
-                self.__generator.generate_new_seed()
-                self.__maze.gen_step = 0
-                self.__restart = True
-                self.generate_and_display_maze()
-                self.pathfinder.solve_shortest_path(self.__maze)
-            if key in ("p", "P", " ") and self.__maze.gen_step != 9:
-                self.__pause = not self.__pause
-                if self.__pause:
-                    self.__display.paused = True
-                    if self.__config.DISPLAY_MODE == "tty":
-                        self.__display.render(self.__maze,
-                                              self.__animation_speed,
-                                              self.__algorithm,
-                                              self.__generator.get_seed(),
-                                              count_as_step=0)
-                else:
-                    self.__display.paused = False
-            if key in ("+"):
-                self.__more_speed()
-            if key in ("-"):
-                self.__less_speed()
-            if key in ("C", "c"):
-                self.__change_color(-1)
-            if key in ("V", "v"):
-                self.__change_color(1)
-            if (key in ("F", "f") and 9 > self.__maze.gen_step >= 3):
-                if self.__maze.gen_step == 4 or self.__maze.gen_step == 5:
-                    self.__maze.gen_step = 6
-                else:
-                    self.__maze.gen_step = 4
-                self.__display.render(self.__maze, self.__animation_speed,
-                                      self.__algorithm,
-                                      self.__generator.get_seed(),
-                                      count_as_step=0)
-            if (key in ("G", "g") and self.__maze.gen_step >= 3):
-                if self.__maze.gen_step != 9:
-                    self.__maze.gen_step = 9
-                else:
-                    self.__maze.gen_step = 3
-                self.__display.render(self.__maze, self.__animation_speed,
-                                      self.__algorithm,
-                                      self.__generator.get_seed(),
-                                      count_as_step=0, key=None)
-            if (key in ("W", "w", "A", "a", "S", "s", "D", "d", "Z", "z",
-                        "Q", "q") and self.__maze.gen_step == 9):
-                self.__display.render(self.__maze, self.__animation_speed,
-                                      self.__algorithm,
-                                      self.__generator.get_seed(),
-                                      count_as_step=0, key=key.capitalize())
-            if key in ("\x1b"):  # Escape
-                if self.__config.DISPLAY_MODE != "tty":
-                    print("\nProgram stopped.")
-                self.__control.stop()
-                sys.exit(0)
+        if key in ("r", "R"):  # Regenerate
+            self.__maze.gen_step = 0
+            self.__restart = True
+            self.generate_and_display_maze()
+        if key in ("e", "E") and self.__replay is None:  # New seed
+            self.__generator.generate_new_seed()
+            self.__maze.gen_step = 0
+            self.__restart = True
+            self.generate_and_display_maze()
+        if key in ("p", "P", " ") and self.__maze.gen_step != 9:
+            self.__pause = not self.__pause
+            if self.__pause:
+                self.__display.paused = True
+                if self.__config.DISPLAY_MODE == "tty":
+                    self.__display.render(self.__maze,
+                                          self.__animation_speed,
+                                          self.__algorithm,
+                                          self.__seed(),
+                                          count_as_step=0)
+            else:
+                self.__display.paused = False
+            self.__resume()
+        if key in ("j", "J") and self.__maze.gen_step < 3:
+            if self.__cursor is not None and self.__timeline is not None:
+                self.__timeline.seek(self.__timeline.head)
+                self.__cursor = None
+            self.__skip = True
+            self.__resume()
+        if key in (",", "<"):
+            self.__seek(-self.__config.KEYFRAME_INTERVAL)
+        if key in (".", ">"):
+            self.__seek(self.__config.KEYFRAME_INTERVAL)
+        if key in ("+"):
+            self.__more_speed()
+        if key in ("-"):
+            self.__less_speed()
+        if key in ("C", "c"):
+            self.__change_color(-1)
+        if key in ("V", "v"):
+            self.__change_color(1)
+        if (key in ("F", "f") and 9 > self.__maze.gen_step >= 3):
+            if self.__maze.gen_step == 4 or self.__maze.gen_step == 5:
+                self.__maze.gen_step = 6
+            else:
+                self.__maze.gen_step = 4
+            self.__display.render(self.__maze, self.__animation_speed,
+                                  self.__algorithm,
+                                  self.__seed(),
+                                  count_as_step=0)
+        if (key in ("G", "g") and self.__maze.gen_step >= 3):
+            if self.__maze.gen_step != 9:
+                self.__maze.gen_step = 9
+            else:
+                self.__maze.gen_step = 3
+            self.__display.render(self.__maze, self.__animation_speed,
+                                  self.__algorithm,
+                                  self.__seed(),
+                                  count_as_step=0, key=None)
+        if (key in ("W", "w", "A", "a", "S", "s", "D", "d", "Z", "z",
+                    "Q", "q") and self.__maze.gen_step == 9):
+            self.__display.render(self.__maze, self.__animation_speed,
+                                  self.__algorithm,
+                                  self.__seed(),
+                                  count_as_step=0, key=key.capitalize())
+        if key in ("\x1b"):  # Escape
+            if self.__config.DISPLAY_MODE != "tty":
+                print("\nProgram stopped.")
+            self.__control.stop()
+            sys.exit(0)
 
     def generate_and_display_maze(self) -> None:
-        """Generate and display the maze with animation.
+        """Start generating and displaying the maze with animation.
 
-        Orchestrates maze generation and rendering, supporting both
-        animated and non-animated modes with pause capability.
-        Handles keyboard input during animation for speed/pause control.
+        Sets up the run and schedules its first frame; the event loop of
+        process renders the states frame by frame, see __frame. Starting
+        again while a run is going replaces it.
+        With REPLAY_FILE the states come from the replay instead of the
+        generator. Otherwise the run goes through a Timeline, so the user
+        can seek back and forth while it runs; generation waits until the
+        view is back at the last frame. With RECORD_FILE the run is also
+        saved to that file.
+        Once the user jumps to the end, the remaining states are no longer
+        rendered; a replay skips straight to its final grid.
+        With ANIMATION_RATE or ANIMATION_DURATION, a FramePacer runs as
+        many steps between two renders as the render time requires; the
+        final state is always rendered.
         """
-        result = self.__generator.generate_maze()
-
-        # Always iterate through the generator
-        for maze_state in result:
-            # Check for keyboard input during animation
-            self.key_control()
-            while self.__pause:
-                self.key_control()
-                time.sleep(TIME_PAUSE)
-            self.__maze: Maze = maze_state
+        self.__skip = False
+        self.__cursor = None
+        if self.__replay is not None:
+            self.__timeline = None
+            self.__replay.reset(self.__replay_maze)
+            self.__maze = self.__replay_maze
+            self.__states = self.__replay.play(self.__replay_maze)
+        else:
+            self.__timeline = Timeline(self.__generator.maze,
+                                       self.__config.KEYFRAME_INTERVAL,
+                                       self.__config.KEYFRAME_MB << 20)
+            self.__maze = self.__generator.maze
+            self.__states = self.__generator.generate_maze(
+                events=self.__timeline)
+        self.__pacer = self.__create_pacer()
+        self.__schedule(0.0)
+
+    def __frame(self) -> None:
+        """Run the generation up to the next state to render.
+
+        Called by the event loop when the frame deadline is reached.
+        Renders one state and schedules the next frame, or finishes the
+        run once the states are exhausted.
+        """
+        self.__deadline = None
+        states = self.__states
+        if states is None:
+            return
+        timeline = self.__timeline
+        pacer = self.__pacer
+        for maze_state in states:
+            if timeline is not None:
+                timeline.frame()
+            if self.__skip:
+                if self.__replay is not None:
+                    break
+                continue
+            if pacer is not None and not pacer.step():
+                continue
+            self.__maze = maze_state
             self.__maze.restart = self.__restart
+            start = time.perf_counter()
             self.__display.render(self.__maze, self.__animation_speed,
                                   self.__algorithm,
-                                  self.__generator.get_seed())
+                                  self.__seed())
             self.__restart = False
-            animation_speed = 1 / self.__animation_speed
-            self.__reactive_sleep(animation_speed)
+            if pacer is None:
+                self.__schedule(1 / self.__animation_speed)
+            else:
+                self.__schedule(pacer.rendered(time.perf_counter() - start))
+            return
+        self.__finish()
 
-    def __reactive_sleep(self, duration: float) -> None:
-        """Sleep while remaining responsive to keyboard input.
+    def __finish(self) -> None:
+        """Show the final state of the run, save it and solve it."""
+        pacer = self.__pacer
+        self.__states = None
+        self.__pacer = None
+        if self.__skip or (pacer is not None and pacer.pending):
+            # The final state was skipped or coalesced, show it now
+            if self.__replay is None:
+                self.__maze = self.__generator.maze
+            elif self.__skip:
+                self.__maze = self.__replay.fast_forward(self.__replay_maze)
+            else:
+                self.__maze = self.__replay_maze
+            self.__maze.restart = self.__restart
+            self.__display.render(self.__maze, self.__animation_speed,
+                                  self.__algorithm, self.__seed())
+            self.__restart = False
+            self.__skip = False
+        if (self.__timeline is not None
+                and self.__config.RECORD_FILE is not None):
+            self.__timeline.recorder.save(self.__config.RECORD_FILE,
+                                          self.__algorithm,
+                                          self.__generator.get_seed())
+        self.solve_path()
 
-        Provides a non-blocking sleep that periodically checks for keyboard
-        input to ensure responsiveness during animation delays.
+    def __schedule(self, delay: float) -> None:
+        """Set the deadline of the next frame.
+
+        No frame is scheduled once the run is over, nor while it is paused
+        or seeked away; the algorithm must not move on then.
+
+        Args:
+            delay: Seconds from now
+        """
+        if (self.__states is None or self.__pause
+                or self.__cursor is not None):
+            self.__deadline = None
+        else:
+            self.__deadline = time.monotonic() + delay
+
+    def __resume(self) -> None:
+        """Schedule the next frame now, after a pause or a seek.
+
+        Does nothing while still paused or seeked away; otherwise the
+        pacer is put back on schedule first.
+        """
+        self.__schedule(0.0)
+        if self.__deadline is not None and self.__pacer is not None:
+            self.__pacer.resync()
+
+    def __create_pacer(self) -> Optional[FramePacer]:
+        """Create the frame pacer of the configured step rate, if any.
+
+        A duration is turned into a rate with the number of recorded
+        frames of a replay, or the estimate of the algorithm.
+
+        Returns:
+            Optional[FramePacer]: The pacer, or None to render every state
+        """
+        if self.__config.ANIMATION_RATE is not None:
+            rate = float(self.__config.ANIMATION_RATE)
+        elif self.__config.ANIMATION_DURATION is not None:
+            if self.__replay is not None:
+                steps = self.__replay.frames
+            else:
+                steps = self.__generator.estimate_steps()
+            rate = max(1, steps) / self.__config.ANIMATION_DURATION
+        else:
+            return None
+        pacer = FramePacer(rate, MAX_FPS)
+        pacer.start()
+        return pacer
+
+    def __seek(self, offset: int) -> None:
+        """Move the view through the frames of the running generation.
+
+        Seeking is only possible while the maze is generated. Moving past
+        the last frame brings the view back to it and lets the generation
+        go on.
 
         Args:
-            duration: Duration to sleep in seconds
+            offset: Number of frames to move, negative to go back
+        """
+        timeline = self.__timeline
+        if timeline is None or timeline.head == 0:
+            return
+        maze = self.__generator.maze
+        if self.__cursor is None and maze.gen_step >= 3:
+            return
+        frame = timeline.seek((self.__cursor or timeline.head) + offset)
+        self.__cursor = frame if frame < timeline.head else None
+        self.__display.render(maze, self.__animation_speed,
+                              self.__algorithm, self.__seed(),
+                              count_as_step=0)
+        self.__resume()
+
+    def __seed(self) -> Optional[str]:
+        """Return the seed shown by the views.
+
+        Returns:
+            Optional[str]: Seed of the replay, or of the generator
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            self.key_control()
-            time.sleep(0.01)
+        if self.__replay is not None:
+            return self.__replay.seed
+        return self.__generator.get_seed()
 
     def __more_speed(self) -> None:
         """Increase animation speed up to maximum FPS."""
@@ -207,11 +405,12 @@ class Controller:
         self.__display.change_color(value)
         self.__display.render(self.__maze, self.__animation_speed,
                               self.__algorithm,
-                              self.__generator.get_seed(), count_as_step=0)
+                              self.__seed(), count_as_step=0)
 
     def solve_path(self) -> None:
-        """Find and store the shortest path through the maze."""
-        self.pathfinder.solve_shortest_path(self.__maze)
+        """Find and store the shortest path, unless the cache gave it."""
+        if not self.__maze.shortest_path:
+            self.pathfinder.solve_shortest_path(self.__maze)
 
     def __enter__(self) -> "Controller":
         return self
@@ -219,5 +418,7 @@ class Controller:
     def __exit__(
         self, exc_type: object, exc_val: object, exc_tb: object
     ) -> None:
+        self.__selector.close()
         self.__terminal_manager.cleanup()
-        self.__generator.create_output_file()
+        if self.__replay is None:
+            self.__generator.create_output_file()
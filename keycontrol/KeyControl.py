@@ -185,6 +185,41 @@ class KeyControl:
         except (OSError, select.error) as e:
             raise KeyControlError(f"Error during read: {e}") from e
 
+    def fileno(self) -> int:
+        """
+        Return the file descriptor keys are read from.
+
+        Lets an event loop wait for keys with select() or selectors.
+
+        Returns:
+            The file descriptor of stdin.
+        """
+        return sys.stdin.fileno()
+
+    def read(self) -> str:
+        """
+        Read every key typed so far.
+
+        Reads the file descriptor directly, so no key is left in the
+        buffer of sys.stdin where select() cannot see it. Call it once
+        the descriptor is ready, or it blocks until a key is typed.
+
+        Returns:
+            The pressed characters, oldest first.
+
+        Raises:
+            KeyControlError: If control is not enabled or the read fails.
+        """
+        if not self.enabled:
+            raise KeyControlError(
+                "KeyControl is not enabled. Call start() first."
+            )
+
+        try:
+            return os.read(self.fileno(), 1024).decode(errors="ignore")
+        except OSError as e:
+            raise KeyControlError(f"Error during read: {e}") from e
+
     def exit_program(self, code: int = 0) -> None:
         """
         Exit the program cleanly by restoring the terminal.
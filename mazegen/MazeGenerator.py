@@ -5,15 +5,35 @@ configurable algorithms. The MazeGenerator remains open for extension
 through the algorithm factory pattern.
 """
 
-import random
+import os
 import uuid
 from sys import stderr
-from typing import Generator
+from typing import (
+    Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+)
 from mazegen.error.MazeError import StampError
 from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED, HEX_TABLE
+from mazegen.maze.events import Event, EventBuffer, EventSink, Refresh
 from mazegen.stamp.Stamp import Stamp
 from mazegen.algorithms.factory import AlgorithmFactory
 from mazegen.model import ConfigModel
+from mazegen.utils.memory import estimate_peak_memory
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.algorithms.braid import Braid
+from mazegen.algorithms.eller import EllerAlgorithm
+from mazegen.algorithms.unperfect import UnPerfect
+from mazegen.pathfinder import PathFinder
+from mazegen.utils.cache import CachedMaze, KEY_FIELDS, MazeCache, cache_key
+from mazegen.utils.rng import create_rng
+from mazegen.utils.tiling import generate_tiled
+
+
+# Side of the centred square searched for the stamp in large-maze mode
+LARGE_STAMP_WINDOW = 64
+
+# Maps a flags byte to the visited byte of a finished maze
+_VISITED_TABLE = bytes(0 if flag & FLAG_LOCKED else 1 for flag in range(256))
 
 
 class MazeGenerator:
@@ -23,7 +43,8 @@ class MazeGenerator:
     - Initializing maze dimensions and entry/exit points
     - Creating the maze grid structure
     - Selecting and applying the specified generation algorithm
-    - Managing random seed for reproducible generation
+    - Seeding a private random generator for reproducible generation
+    - Reusing finished mazes from a cache for static generation
 
     Attributes:
         __width: Width of the maze
@@ -31,15 +52,26 @@ class MazeGenerator:
         __entry: Tuple of (x, y) coordinates for maze entry point
         __exit: Tuple of (x, y) coordinates for maze exit point
         __seed: Random seed for reproducible maze generation
+        __rng_engine: Name of the random number engine
         __algorithm_name: Name of the algorithm to use
+        __large: True when running in large-maze mode
+        __steps_per_yield: Steps between two states of animated runs, for
+            algorithms with batched yields
+        __tile_size: Tile size of tiled generation, or None
+        __workers: Worker processes of tiled generation
+        __config: Configuration, for the cache key
+        __cache: Cache of finished mazes, or None
         maze: The generated Maze object
     """
 
-    def __init__(self, config: ConfigModel):
+    def __init__(self, config: ConfigModel,
+                 cache: Optional[MazeCache] = None):
         """Initialize MazeGenerator with configuration.
 
         Args:
             config: ConfigModel instance with all maze generation settings
+            cache: Cache of finished mazes, e.g. shared between
+                generators; None builds one from the CACHE_* settings
 
         Raises:
             ValueError: If the specified algorithm is not registered
@@ -50,20 +82,61 @@ class MazeGenerator:
         self.__exit = config.EXIT
         self.__output_file = config.OUTPUT_FILE
         self.__seed = config.SEED
+        self.__rng_engine = config.RNG_ENGINE
         self.__algorithm_name = config.ALGORITHM
         self.__perfect = config.PERFECT
+        self.__loop_density = config.LOOP_DENSITY
+        self.__braid = config.BRAID
         self.__mode_gen = config.MODE_GEN
+        self.__steps_per_yield = config.STEPS_PER_YIELD
         self.__stamp_type = config.STAMP_TYPE
+        self.__large = config.LARGE_MAZE
+        self.__seed_compat = config.SEED_COMPAT
+        self.__policy = config.GROWING_TREE_POLICY
+        self.__ratio = config.GROWING_TREE_RATIO
+        self.__tile_size = config.TILE_SIZE
+        self.__workers = config.WORKERS or os.cpu_count() or 1
+        self.__config = config
+        # A large maze is generated once, keeping a copy would only
+        # add to its peak memory
+        memory = 0 if self.__large else config.CACHE_MB << 20
+        if cache is None and (memory or config.CACHE_DIR):
+            cache = MazeCache(memory, config.CACHE_DIR,
+                              config.CACHE_DISK_MB << 20)
+        self.__cache = cache
         self.maze: Maze = Maze(
             self.__width, self.__height, self.__entry, self.__exit,
-            self.__perfect)
-        self.stamp: Stamp = Stamp(self.maze, self.__stamp_type)
+            self.__perfect, self.__loop_density, self.__braid,
+            self.__seed_compat)
+        self.stamp: Stamp = Stamp(
+            self.maze, self.__stamp_type,
+            search_window=LARGE_STAMP_WINDOW if self.__large else None)
 
-    def generate_maze(self) -> Generator[Maze, None, None]:
+    def generate_maze(
+        self, events: Optional[EventSink] = None
+    ) -> Generator[Maze, None, None]:
         """Generate a maze using the configured algorithm.
 
-        Creates a maze grid, initializes all cells, sets the random seed,
-        and applies the selected algorithm starting from the entry point.
+        Creates a maze grid, initializes all cells, seeds a generator of
+        its own and applies the selected algorithm starting from the entry
+        point. The stamp placement and the algorithm draw from that
+        generator only, so the module-level ``random`` state is left alone
+        and a seed gives the same maze whatever else runs in the process.
+
+        With a tile size, the maze is carved tile by tile across worker
+        processes instead, see ``generate_tiled``.
+
+        Static runs go through the maze cache: a configuration already
+        generated is restored from it, after placing the stamp again, and
+        a new one is solved and stored once the last state is consumed.
+        Either way ``maze.shortest_path`` is then set; it is empty after
+        runs that skip the cache, which callers still have to solve.
+        Animated runs always carve, so every step can be shown.
+
+        Args:
+            events: Sink receiving the typed generation events of the run,
+                see ``mazegen.maze.events``; step events are only emitted
+                by animated runs
 
         Returns:
             Generator yielding Maze states. When mode_gen is 'animated',
@@ -73,25 +146,128 @@ class MazeGenerator:
         Raises:
             ValueError: If the algorithm is not found
         """
+        self.maze.events = events
         self.maze.init_grid()
+        self.maze.shortest_path = ""
         if self.__seed is None:
             self.generate_new_seed()
-        random.seed(self.__seed)
+        seed = str(self.__seed)
+        rng = create_rng(self.__rng_engine, seed)
         try:
-            self.stamp.add_stamp()
+            self.stamp.add_stamp(rng)
         except Exception:
             raise StampError()
 
         # Get algorithm from factory
+        options = {"seed_compat": self.__seed_compat,
+                   "policy": self.__policy, "ratio": self.__ratio}
         try:
-            algorithm = AlgorithmFactory.create(self.__algorithm_name)
+            algorithm = AlgorithmFactory.create(self.__algorithm_name,
+                                                **options)
         except ValueError as e:
             stderr.write(f"Error: {e}\n")
             raise
 
-        x, y = self.__entry
         animate = self.__mode_gen == "animated"
-        return algorithm.generate(self.maze, x, y, animate=animate)
+        key = None
+        if self.__cache is not None and not animate:
+            key = self.__cache_key(algorithm)
+            entry = self.__cache.get(self.__algorithm_name,
+                                     algorithm.VERSION, key)
+            if entry is not None and len(entry.walls) == len(
+                    self.maze.grid.walls):
+                return self.__restore(entry)
+
+        if self.__tile_size is not None:
+            states = generate_tiled(
+                self.maze, self.__algorithm_name, options, self.__rng_engine,
+                seed, rng, self.__tile_size, self.__workers)
+        else:
+            x, y = self.__entry
+            states = algorithm.generate(
+                self.maze, x, y, animate=animate, rng=rng,
+                steps_per_yield=self.__steps_per_yield)
+        if key is None:
+            return states
+        return self.__store(states, algorithm.VERSION, key)
+
+    def iter_events(self) -> Iterator[Event]:
+        """Generate a maze and return its events instead of its states.
+
+        The Maze states of ``generate_maze`` are consumed here; the events
+        buffered while reaching each state are handed out in order.
+
+        Returns:
+            Iterator over the typed events of the run
+        """
+        buffer = EventBuffer()
+        for _ in self.generate_maze(events=buffer):
+            yield from buffer.drain()
+        yield from buffer.drain()
+
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Return the counters of the maze cache.
+
+        Returns:
+            Optional[Dict[str, int]]: See MazeCache.stats, or None without
+            a cache
+        """
+        if self.__cache is None:
+            return None
+        return self.__cache.stats()
+
+    def __cache_key(self, algorithm: MazeAlgorithm) -> str:
+        """Hash the settings that shape the maze into a cache key.
+
+        Args:
+            algorithm: Carving algorithm of the run
+
+        Returns:
+            str: Cache key of the current configuration and seed
+        """
+        fields = {name: getattr(self.__config, name) for name in KEY_FIELDS}
+        fields["SEED"] = self.__seed
+        fields["ENGINE"] = algorithm.engine
+        versions = {self.__algorithm_name: algorithm.VERSION,
+                    "unperfect": UnPerfect.VERSION, "braid": Braid.VERSION}
+        return cache_key(fields, versions)
+
+    def __restore(self, entry: CachedMaze) -> Generator[Maze, None, None]:
+        """Yield a cached maze as the final state of a run.
+
+        Args:
+            entry: Walls and shortest path of the maze
+
+        Returns:
+            Generator yielding the finished maze once.
+        """
+        grid = self.maze.grid
+        grid.walls[:] = entry.walls
+        grid.visited[:] = grid.flags.translate(_VISITED_TABLE)
+        self.maze.shortest_path = entry.shortest_path
+        if self.maze.events is not None:
+            self.maze.events(Refresh())
+        self.maze.gen_step = 3
+        yield self.maze
+
+    def __store(self, states: Iterable[Maze], version: int,
+                key: str) -> Generator[Maze, None, None]:
+        """Pass states through, then solve and cache the finished maze.
+
+        Args:
+            states: States of the generation run
+            version: Version of the carving algorithm
+            key: Cache key of the run
+
+        Returns:
+            Generator yielding the states of the run.
+        """
+        yield from states
+        if self.__cache is None:
+            return
+        PathFinder().solve_shortest_path(self.maze)
+        self.__cache.put(self.__algorithm_name, version, key, CachedMaze(
+            bytes(self.maze.grid.walls), self.maze.shortest_path))
 
     def create_output_file(self) -> None:
         """Write the generated maze to an output file.
@@ -107,18 +283,135 @@ class MazeGenerator:
             IOError: If the file cannot be written
             (caught and printed as error)
         """
-        x, y = self.__entry
-        x1, y1 = self.__exit
+        grid = self.maze.grid
+        self._write_output(
+            self.__output_file,
+            (grid.hex_row(row) for row in range(self.__height)),
+            self.__entry, self.__exit, self.maze.shortest_path)
+
+    @classmethod
+    def stream_output_file(cls, config: ConfigModel) -> str:
+        """Generate an Eller maze straight into the output file.
+
+        Rows are written as soon as the Eller row kernel finalizes them,
+        so memory stays O(width) whatever the height. No grid is kept,
+        which means no stamp is embedded, no loops are added and the
+        solution line of the file is left empty.
+
+        Args:
+            config: ConfigModel instance with STREAM_OUTPUT enabled
+
+        Returns:
+            str: The seed used for the generation
+        """
+        seed = config.SEED if config.SEED is not None else uuid.uuid4().hex
+        rows = EllerAlgorithm().rows(config.WIDTH, config.HEIGHT,
+                                     rng=create_rng(config.RNG_ENGINE, seed))
+        cls._write_output(
+            config.OUTPUT_FILE,
+            (codes.translate(HEX_TABLE).decode() for codes in rows),
+            config.ENTRY, config.EXIT, "")
+        return seed
+
+    def output_text(self) -> str:
+        """Return the output file contents of the generated maze.
+
+        Returns:
+            str: Hex rows, entry, exit and solution in the output format
+        """
+        grid = self.maze.grid
+        return "".join(self._output_chunks(
+            (grid.hex_row(row) for row in range(self.__height)),
+            self.__entry, self.__exit, self.maze.shortest_path))
+
+    @staticmethod
+    def _output_chunks(rows: Iterable[str], entry: Tuple[int, int],
+                       exit: Tuple[int, int],
+                       solution: str) -> Iterator[str]:
+        """Yield the output format piece by piece.
+
+        Args:
+            rows: Hex strings of the maze rows, top to bottom
+            entry: Entry coordinates (x, y)
+            exit: Exit coordinates (x, y)
+            solution: Shortest path letters
+
+        Returns:
+            Iterator of strings that join into the output file contents
+        """
+        for number, row in enumerate(rows):
+            if number:
+                yield "\n"
+            yield row
+        x, y = entry
+        x1, y1 = exit
+        yield f"\n\n{x},{y}\n{x1},{y1}\n"
+        yield solution
+
+    @classmethod
+    def _write_output(cls, path: str, rows: Iterable[str],
+                      entry: Tuple[int, int], exit: Tuple[int, int],
+                      solution: str) -> None:
+        """Write hex rows, entry, exit and solution to the output file.
+
+        Rows are written one by one so large mazes never build the whole
+        hex grid as one string.
+
+        Args:
+            path: Output file path
+            rows: Hex strings of the maze rows, top to bottom
+            entry: Entry coordinates (x, y)
+            exit: Exit coordinates (x, y)
+            solution: Shortest path letters
+
+        Raises:
+            IOError: If the file cannot be written
+            (caught and printed as error)
+        """
         try:
-            with open(self.__output_file, "w") as file:
-                file.write(self.maze.__str__())
-                file.write("\n\n")
-                file.write(f"{x},{y}\n")
-                file.write(f"{x1},{y1}\n")
-                file.write(self.maze.shortest_path)
+            with open(path, "w") as file:
+                file.writelines(
+                    cls._output_chunks(rows, entry, exit, solution))
         except (FileNotFoundError, PermissionError) as e:
             stderr.write(f"Error writing file: {str(e)}\n")
 
+    def estimate_memory(self) -> int:
+        """Estimate the peak memory of a generation run.
+
+        Returns:
+            int: Estimated peak memory in bytes
+        """
+        return estimate_peak_memory(self.__width, self.__height,
+                                    self.__algorithm_name, self.__perfect,
+                                    self.__braid > 0, self.__tile_size,
+                                    self.__workers, self.__cache is not None)
+
+    def estimate_steps(self) -> int:
+        """Estimate how many states an animated run yields.
+
+        Stages with batched yields yield once per STEPS_PER_YIELD steps.
+
+        Returns:
+            int: Estimated number of states of the configured algorithm
+            and of the loop and braid stages
+
+        Raises:
+            ValueError: If the algorithm is not found
+        """
+        algorithm = AlgorithmFactory.create(self.__algorithm_name)
+        stages: List[MazeAlgorithm] = [algorithm]
+        if not self.__perfect:
+            stages.append(UnPerfect(self.__loop_density))
+        if self.__braid:
+            stages.append(Braid(self.__braid))
+        total = 0
+        for stage in stages:
+            steps = stage.estimate_steps(self.__width, self.__height)
+            if stage.BATCHED_YIELDS:
+                steps = -(-steps // self.__steps_per_yield)
+            total += steps
+        return total
+
     def generate_new_seed(self) -> None:
         """Generate a random seed as a hex string."""
         self.__seed = uuid.uuid4().hex
@@ -0,0 +1,126 @@
+"""Command line entry point of the mazegen package.
+
+Usage:
+    python -m mazegen batch --seeds 0:1000 --output fixtures/
+    python -m mazegen batch --seeds a,b,c --config base.txt --shards 4
+
+The ``batch`` command reads one base configuration file, generates and
+solves a maze per seed across a process pool and prints a progress
+summary. No terminal interface is started.
+
+Functions:
+    main: Parse the command line and run the requested command
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+from pydantic import ValidationError
+from mazegen.batch import generate_batch, parse_seeds
+from mazegen.model import ConfigModel
+
+
+def _read_seeds(args: argparse.Namespace) -> List[str]:
+    """Collect the seeds of the command line.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        List[str]: Seeds from --seeds, then from --seed-file
+    """
+    seeds = parse_seeds(args.seeds) if args.seeds else []
+    if args.seed_file:
+        with open(args.seed_file) as file:
+            seeds.extend(line.strip() for line in file if line.strip())
+    return seeds
+
+
+def _batch(args: argparse.Namespace) -> int:
+    """Run the batch command.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        int: Process exit status
+    """
+    try:
+        config = ConfigModel(_env_file=args.config)  # type: ignore[call-arg]
+    except ValidationError as e:
+        for error in e.errors():
+            field = error["loc"][0] if error["loc"] else "model"
+            sys.stderr.write(f"Field: {field}\n")
+            sys.stderr.write(f"Error: {error['msg']}\n")
+        return 1
+
+    try:
+        seeds = _read_seeds(args)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    if not seeds:
+        sys.stderr.write("Error: no seed given\n")
+        return 1
+
+    total = len(seeds)
+    step = max(1, total // 100)
+    start = time.perf_counter()
+    done = 0
+    try:
+        for done, _ in enumerate(generate_batch(
+                config, seeds, args.output, args.workers, args.shards,
+                not args.as_completed), 1):
+            if not args.quiet and (done % step == 0 or done == total):
+                sys.stderr.write(f"\r{done}/{total} mazes")
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"\nError: {e}\n")
+        return 1
+
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        sys.stderr.write("\n")
+    rate = done / elapsed if elapsed > 0 else float(done)
+    print(f"Generated {done} mazes {config.WIDTH}x{config.HEIGHT} "
+          f"({config.ALGORITHM}) in {elapsed:.2f} s, {rate:.1f} mazes/s, "
+          f"written to {args.output}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse the command line and run the requested command.
+
+    Args:
+        argv: Arguments without the program name, None for sys.argv
+
+    Returns:
+        int: Process exit status
+    """
+    parser = argparse.ArgumentParser(prog="mazegen")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch", help="generate and solve one maze per seed")
+    batch.add_argument("--config", default="config.txt",
+                       help="base configuration file (default: config.txt)")
+    batch.add_argument("--seeds",
+                       help="seed range start:stop[:step] or list a,b,c")
+    batch.add_argument("--seed-file", help="file with one seed per line")
+    batch.add_argument("--output", default="mazes",
+                       help="output directory (default: mazes)")
+    batch.add_argument("--workers", type=int,
+                       help="worker processes (default: CPU count)")
+    batch.add_argument("--shards", type=int,
+                       help="write N shard files instead of one per maze")
+    batch.add_argument("--as-completed", action="store_true",
+                       help="deliver mazes as they finish, not in order")
+    batch.add_argument("--quiet", action="store_true",
+                       help="do not print progress")
+
+    args = parser.parse_args(argv)
+    return _batch(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,8 +8,10 @@ existing code.
 
 from abc import ABC, abstractmethod
 from mazegen.maze.maze import Maze
-from mazegen.utils.utils import Direction, Wall
-from typing import Tuple, Generator
+from mazegen.maze.grid import FLAG_LOCKED
+from mazegen.utils.kernel import carve, close, direction_to
+from mazegen.utils.rng import ensure_rng
+from typing import Generator, List, Optional, Sequence, Tuple
 import random
 
 
@@ -20,13 +22,40 @@ class MazeAlgorithm(ABC):
     algorithms must follow. Implementing this allows the MazeGenerator
     to remain open for extension without modification.
 
+    Class Attributes:
+        WORKSPACE_BYTES_PER_CELL: Conservative per-cell size of the
+            algorithm's working structures, used by the memory estimate
+        VERSION: Version of the generated mazes, part of the maze cache
+            key; bump it whenever a seed gives a different maze
+        BATCHED_YIELDS: True when generate honours steps_per_yield; the
+            other algorithms yield after every step
+
+    Properties:
+        engine: Engine of static runs, part of the maze cache key
+
     Methods:
         generate: Abstract method to generate a maze
+        estimate_steps: Estimate how many states an animated run yields
     """
 
+    WORKSPACE_BYTES_PER_CELL: int = 0
+    VERSION: int = 1
+    BATCHED_YIELDS: bool = False
+
+    @property
+    def engine(self) -> str:
+        """Name of the engine static runs carve with.
+
+        Algorithms with an optional engine that gives different mazes for
+        a seed, like a NumPy one, return its name when it is in use, so
+        caches shared between environments keep their mazes apart.
+        """
+        return "python"
+
     @abstractmethod
     def generate(
-        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
     ) -> Generator[Maze, None, None]:
         """Generate a maze starting from entry coordinates.
 
@@ -36,6 +65,12 @@ class MazeAlgorithm(ABC):
             entry_y: Y coordinate of the entry point
             animate: If True, yields maze state after each step.
                     If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps carved between two yielded states when
+                animating, for algorithms with BATCHED_YIELDS; events are
+                still emitted for every step. animate=False behaves as if
+                it were infinite.
 
         Returns:
             Generator yielding Maze states. When animate=False, yields only
@@ -46,7 +81,69 @@ class MazeAlgorithm(ABC):
         """
         pass
 
-    def valid_target(self, x: int, y: int, maze: Maze) -> Tuple[int, int]:
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate how many states an animated run yields.
+
+        Used to pace animations to a duration. Algorithms that carve one
+        cell per state keep the default of one state per cell.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return width * height
+
+    def finish(
+        self, maze: Maze, animate: bool = False,
+        dead_ends: Optional[Sequence[int]] = None,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Run the steps shared by every algorithm once carving is done.
+
+        Moves the maze to generation step 2, adds loops with UnPerfect
+        when the maze is not perfect and removes dead ends with Braid when
+        a braid percentage is set, then yields the final maze.
+
+        Args:
+            maze: The carved Maze object
+            animate: If True, the stages yield after each wall removal
+            dead_ends: Dead-end cells collected while carving, if the
+                algorithm tracks them, so loop injection does not look
+                for them again
+            rng: Random number generator of the run, shared by the stages
+            steps_per_yield: Steps between two yielded states of the
+                stages when animating
+
+        Returns:
+            Generator yielding the remaining Maze states.
+        """
+        from mazegen.algorithms.unperfect import UnPerfect
+        from mazegen.algorithms.braid import Braid
+
+        maze.gen_step = 2
+        rng = ensure_rng(rng)
+        stages: List[MazeAlgorithm] = []
+        if maze.perfect is False:
+            stages.append(UnPerfect(maze.loop_density, dead_ends,
+                                    maze.seed_compat))
+        if maze.braid:
+            stages.append(Braid(maze.braid))
+        for stage in stages:
+            for state in stage.generate(maze, 0, 0, animate, rng,
+                                        steps_per_yield):
+                if animate:
+                    yield state
+
+        maze.gen_step = 3
+        yield maze
+
+    def valid_target(
+        self, x: int, y: int, maze: Maze,
+        rng: Optional[random.Random] = None
+    ) -> Tuple[int, int]:
         """Find a random unvisited neighbor of the current cell.
 
         Checks all four adjacent cells (North, South, East, West) and
@@ -57,6 +154,8 @@ class MazeAlgorithm(ABC):
             x: Current cell X coordinate
             y: Current cell Y coordinate
             maze: Maze object containing grid and dimensions
+            rng: Random number generator; None uses the module-level
+                random state
 
         Returns:
             Tuple[int, int]: Coordinates (x, y) of a random valid target cell
@@ -65,20 +164,20 @@ class MazeAlgorithm(ABC):
             IndexError: If no valid targets are available
             (all neighbors visited)
         """
-        target = [
-            (x + dx, y + dy) for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        ]
-
+        grid = maze.grid
+        width = grid.width
+        visited = grid.visited
+        flags = grid.flags
         valid_target = [
             (vx, vy)
-            for vx, vy in target
-            if 0 <= vx < maze.width
-            and 0 <= vy < maze.height
-            and not maze.maze_grid[vy][vx].visited
-            and maze.maze_grid[vy][vx].locked is False
+            for vx, vy in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+            if 0 <= vx < width
+            and 0 <= vy < grid.height
+            and not visited[vy * width + vx]
+            and not flags[vy * width + vx] & FLAG_LOCKED
         ]
 
-        return random.choice(valid_target)
+        return (rng or random).choice(valid_target)
 
     def remove_wall(
         self, x: int, y: int, x1: int, y1: int, maze: Maze
@@ -86,8 +185,8 @@ class MazeAlgorithm(ABC):
         """Remove walls between two adjacent cells to create a passage.
 
         Determines the direction from current cell to target cell and removes
-        the corresponding wall from both cells. This creates a passage between
-        the two cells.
+        the corresponding wall from both cells with the carving kernel. This
+        creates a passage between the two cells.
 
         Args:
             x: Current cell X coordinate
@@ -99,20 +198,31 @@ class MazeAlgorithm(ABC):
         Returns:
             Maze: The modified maze with walls removed
         """
-        if x + 1 == x1:
-            maze.maze_grid[y][x].remove_cell_wall(Wall.EAST)
-            maze.maze_grid[y1][x1].remove_cell_wall(
-                Direction.EAST.opposite.wall)
-        if x - 1 == x1:
-            maze.maze_grid[y][x].remove_cell_wall(Wall.WEST)
-            maze.maze_grid[y1][x1].remove_cell_wall(
-                Direction.WEST.opposite.wall)
-        if y + 1 == y1:
-            maze.maze_grid[y][x].remove_cell_wall(Wall.SOUTH)
-            maze.maze_grid[y1][x1].remove_cell_wall(
-                Direction.SOUTH.opposite.wall)
-        if y - 1 == y1:
-            maze.maze_grid[y][x].remove_cell_wall(Wall.NORTH)
-            maze.maze_grid[y1][x1].remove_cell_wall(
-                Direction.NORTH.opposite.wall)
+        width = maze.width
+        carve(maze.grid.walls, width, y * width + x,
+              direction_to(x, y, x1, y1))
+        return maze
+
+    def add_wall(
+        self, x: int, y: int, x1: int, y1: int, maze: Maze
+    ) -> Maze:
+        """Add walls between two adjacent cells to close a passage.
+
+        Counterpart of remove_wall: determines the direction from current
+        cell to target cell and sets the corresponding wall on both cells,
+        so the two sides always agree.
+
+        Args:
+            x: Current cell X coordinate
+            y: Current cell Y coordinate
+            x1: Target cell X coordinate
+            y1: Target cell Y coordinate
+            maze: Maze object containing the grid to modify
+
+        Returns:
+            Maze: The modified maze with walls added
+        """
+        width = maze.width
+        close(maze.grid.walls, width, y * width + x,
+              direction_to(x, y, x1, y1))
         return maze
@@ -5,10 +5,27 @@ for generating perfect mazes. It carves passages by removing walls
 between adjacent unvisited cells.
 """
 
-from typing import Generator
+import random
+from array import array
+from typing import Generator, Optional
 from mazegen.maze.maze import Maze
+from mazegen.maze.events import Backtrack, Carve, Visit
 from mazegen.algorithms.algorithm import MazeAlgorithm
-from mazegen.algorithms.unperfect import UnPerfect
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, EAST, LOCKED_TABLE, NORTH, SOUTH, WALL_COUNT,
+    WEST, direction_to, offsets,
+)
+from mazegen.utils.rng import ensure_rng
+
+
+# Neighbour order used by valid_target, as kernel directions
+_ORDER = (WEST, EAST, NORTH, SOUTH)
+# Kernel directions for each 4-bit mask of enterable neighbours, with
+# bit d standing for _ORDER[d], listed in valid_target order
+_OPTIONS = tuple(
+    tuple(_ORDER[d] for d in range(4) if mask >> d & 1)
+    for mask in range(16)
+)
 
 
 class BacktrackingAlgorithm(MazeAlgorithm):
@@ -16,11 +33,32 @@ class BacktrackingAlgorithm(MazeAlgorithm):
 
     Uses depth-first search with a stack to carve passages through the maze.
     Starting from entry coordinates, recursively visits unvisited neighbors
-    and removes walls between visited and current cells.
+    and removes walls between visited and current cells. Static generation
+    runs a dedicated non-generator kernel (see carve) that produces the
+    same maze as the animated path for a given seed.
     """
 
+    # Static kernel: int32 stack plus one blocked byte per cell
+    WORKSPACE_BYTES_PER_CELL = 8
+    BATCHED_YIELDS = True
+    # 2: static loops are drawn from the dead ends in grid order
+    VERSION = 2
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per carve, one per backtrack.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return 2 * width * height
+
     def generate(
-        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
     ) -> Generator[Maze, None, None]:
         """Generate a maze using the backtracking algorithm.
 
@@ -30,49 +68,170 @@ class BacktrackingAlgorithm(MazeAlgorithm):
             entry_y: Starting Y coordinate
             animate: If True, yields maze state at each step (for animation).
                     If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Carves and backtracks between two yielded
+                states when animating
 
         Returns:
             Generator yielding Maze states at each step.
+
+        Raises:
+            ValueError: If steps_per_yield is below 1
         """
+        if steps_per_yield < 1:
+            raise ValueError("Steps per yield must be at least 1")
+        rng = ensure_rng(rng)
+        if not animate:
+            return self._generate_static(maze, entry_x, entry_y, rng)
+
         stack = [(entry_x, entry_y, 0)]
+        visited = maze.grid.visited
+        width = maze.width
+        emit = maze.events
 
         def _generate() -> Generator[Maze, None, None]:
             """Internal generator that yields maze states."""
             nonlocal maze
             maze.gen_step = 1
+            # Steps left before the next yielded state
+            countdown = steps_per_yield
+            if emit is not None:
+                emit(Visit(entry_x, entry_y))
             while stack:
                 x1, y1, _ = stack[len(stack) - 1]
-                maze.maze_grid[y1][x1].visited = True
-                if animate:
-                    maze.active_cell = stack[len(stack) - 1]
+                visited[y1 * width + x1] = 1
+                maze.active_cell = stack[len(stack) - 1]
 
                 try:
-                    target = self.valid_target(x1, y1, maze)
-                    x2, y2 = target
-                    maze = self.remove_wall(x1, y1, x2, y2, maze)
-                    if animate:
-                        tx, ty = target
-                        maze.active_cell = tx, ty, 0
-                        yield maze
-                    x1, y1 = x2, y2
-                    stack.append((x1, y1, 0))
-                except Exception:
+                    x2, y2 = self.valid_target(x1, y1, maze, rng)
+                except IndexError:
+                    # Dead end: no unvisited neighbour left
                     stack.pop()
-                    if animate:
-                        try:
-                            maze.active_cell = stack[len(stack) - 1]
-                        except IndexError:
-                            maze.active_cell = (entry_x, entry_y, 0)
+                    if emit is not None:
+                        emit(Backtrack(x1, y1))
+                    if stack:
+                        maze.active_cell = stack[len(stack) - 1]
+                    else:
+                        maze.active_cell = (entry_x, entry_y, 0)
+                    countdown -= 1
+                    if not countdown:
+                        countdown = steps_per_yield
                         yield maze
+                    continue
 
-            maze.gen_step = 2
-            if maze.perfect is False:
-                algo = UnPerfect()
-                yield from algo.generate(maze, 0, 0, animate)
-            else:
-                maze.gen_step = 3
+                maze = self.remove_wall(x1, y1, x2, y2, maze)
+                if emit is not None:
+                    emit(Carve(x2, y2, direction_to(x2, y2, x1, y1)))
+                maze.active_cell = x2, y2, 0
+                countdown -= 1
+                if not countdown:
+                    countdown = steps_per_yield
+                    yield maze
+                stack.append((x2, y2, 0))
 
             # Always yield the final maze
-            yield maze
+            yield from self.finish(maze, animate, rng=rng,
+                                   steps_per_yield=steps_per_yield)
 
         return _generate()
+
+    def _generate_static(
+        self, maze: Maze, entry_x: int, entry_y: int, rng: random.Random
+    ) -> Generator[Maze, None, None]:
+        """Run the static kernel, then yield the final maze.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            rng: Random number generator
+
+        Returns:
+            Generator yielding only the completed maze.
+        """
+        maze.gen_step = 1
+        dead_ends = self.carve(maze, entry_x, entry_y, rng)
+        yield from self.finish(maze, dead_ends=dead_ends, rng=rng)
+
+    def carve(
+        self, maze: Maze, entry_x: int, entry_y: int,
+        rng: Optional[random.Random] = None
+    ) -> "array[int]":
+        """Carve the whole maze in one iterative loop.
+
+        Follows exactly the same steps and random draws as the animated
+        generator, so a given seed produces the same maze, but keeps the
+        stack as a flat array of cell indices and detects dead ends by an
+        empty candidate list instead of an exception.
+
+        A cell popped right after it was pushed carved nothing, so it is a
+        leaf of the tree: those cells are collected on the way and handed
+        to the loop injection pass.
+
+        Args:
+            maze: Maze object to carve
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            rng: Random number generator; None derives one from the
+                module-level random state
+
+        Returns:
+            array[int]: Dead-end cells found while carving
+        """
+        grid = maze.grid
+        width = grid.width
+        last_x = width - 1
+        last_row = (grid.height - 1) * width
+        walls = grid.walls
+        visited = grid.visited
+        # Cells the walk may not enter: stamp cells, then visited ones
+        blocked = grid.flags.translate(LOCKED_TABLE)
+        steps = offsets(width)
+        clear_here = CLEAR_HERE
+        clear_there = CLEAR_THERE
+        options = _OPTIONS
+        choice = ensure_rng(rng).choice
+
+        start = entry_y * width + entry_x
+        visited[start] = 1
+        blocked[start] = 1
+        stack = array("i", [start])
+        push = stack.append
+        pop = stack.pop
+        dead_ends = array("i")
+        # True while the top of the stack has not carved anything yet
+        leaf = False
+
+        while stack:
+            index = stack[-1]
+            x = index % width
+            mask = 0
+            if x > 0 and not blocked[index - 1]:
+                mask = 1
+            if x < last_x and not blocked[index + 1]:
+                mask |= 2
+            if index >= width and not blocked[index - width]:
+                mask |= 4
+            if index < last_row and not blocked[index + width]:
+                mask |= 8
+            if not mask:
+                if leaf:
+                    dead_ends.append(index)
+                    leaf = False
+                pop()
+                continue
+
+            direction = choice(options[mask])
+            target = index + steps[direction]
+            walls[index] &= clear_here[direction]
+            walls[target] &= clear_there[direction]
+            visited[target] = 1
+            blocked[target] = 1
+            push(target)
+            leaf = True
+
+        # The entry is a dead end too when it carved a single passage
+        if WALL_COUNT[walls[start]] == 3:
+            dead_ends.append(start)
+        return dead_ends
@@ -0,0 +1,194 @@
+"""Binary Tree algorithm implementation for maze generation.
+
+This module implements the Binary Tree algorithm: every cell opens its
+north or its west wall at random, which makes a perfect maze with a
+strong diagonal bias and two open corridors along the top and left
+borders. Each cell only depends on one random bit, so the whole grid is
+carved with a few NumPy array operations when NumPy is installed; a
+pure-Python engine is used otherwise and for animated runs.
+
+The NumPy engine draws its random numbers from a NumPy generator seeded
+from the ``random.Random`` of the run, so seeds stay reproducible, but the
+two engines give different mazes for the same seed.
+
+Classes:
+    BinaryTreeAlgorithm: Implementation of the Binary Tree algorithm
+"""
+
+import random
+from array import array
+from typing import Any, Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Refresh, Row
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.forest import join_trees, join_trees_numpy
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, EAST, LOCKED_TABLE, NORTH, SOUTH, WALL, WEST)
+from mazegen.utils.rng import ensure_rng
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class BinaryTreeAlgorithm(MazeAlgorithm):
+    """Binary Tree algorithm with an optional NumPy engine.
+
+    A cell whose north and west neighbours are both locked or outside
+    the grid has no wall to open and starts a separate tree; those trees
+    are joined afterwards with random walls between them.
+
+    Attributes:
+        __use_numpy: Use the vectorized engine when NumPy is available
+    """
+
+    # Boolean masks and int64 parent links of the NumPy engine
+    WORKSPACE_BYTES_PER_CELL = 40
+
+    def __init__(self, use_numpy: bool = True) -> None:
+        """Initialize the algorithm.
+
+        Args:
+            use_numpy: If False, always use the pure-Python engine
+        """
+        self.__use_numpy = use_numpy and HAS_NUMPY
+
+    @property
+    def engine(self) -> str:
+        """Name of the engine static runs carve with."""
+        return "numpy" if self.__use_numpy else "python"
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per row.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return height + 1
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using the Binary Tree algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate (unused, kept for the interface)
+            entry_y: Starting Y coordinate (unused, kept for the interface)
+            animate: If True, yields maze state after each row, using
+                    the pure-Python engine.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        maze.gen_step = 1
+        if self.__use_numpy and not animate:
+            self._carve_numpy(maze, rng)
+        else:
+            yield from self._carve_python(maze, animate, rng)
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
+
+    def _carve_python(
+        self, maze: Maze, animate: bool, rng: random.Random
+    ) -> Generator[Maze, None, None]:
+        """Carve the maze cell by cell.
+
+        Args:
+            maze: Maze object to carve
+            animate: If True, yields maze state after each row
+            rng: Random number generator
+
+        Returns:
+            Generator yielding Maze states after each row.
+        """
+        grid = maze.grid
+        width = grid.width
+        walls = grid.walls
+        visited = grid.visited
+        locked = grid.flags.translate(LOCKED_TABLE)
+        parent = array("i", range(width * grid.height))
+        getrandbits = rng.getrandbits
+        emit = maze.events if animate else None
+        open_north = CLEAR_HERE[NORTH]
+        open_south = CLEAR_THERE[NORTH]
+        open_west = CLEAR_HERE[WEST]
+        open_east = CLEAR_THERE[WEST]
+
+        for y in range(grid.height):
+            row = y * width
+            bits = getrandbits(width)
+            for x in range(width):
+                index = row + x
+                if locked[index]:
+                    continue
+                visited[index] = 1
+                north = y > 0 and not locked[index - width]
+                west = x > 0 and not locked[index - 1]
+                if north and (not west or bits >> x & 1):
+                    walls[index] &= open_north
+                    walls[index - width] &= open_south
+                    parent[index] = index - width
+                elif west:
+                    walls[index] &= open_west
+                    walls[index - 1] &= open_east
+                    parent[index] = index - 1
+            if animate:
+                if emit is not None:
+                    emit(Row(y))
+                maze.active_cell = (width - 1, y, 0)
+                yield maze
+
+        join_trees(walls, locked, width, parent, rng)
+        if emit is not None:
+            emit(Refresh())
+
+    def _carve_numpy(self, maze: Maze, rng: random.Random) -> None:
+        """Carve the whole maze with vectorized array operations.
+
+        Args:
+            maze: Maze object to carve
+            rng: Random number generator seeding the NumPy generator
+        """
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        generator: Any = np.random.default_rng(rng.getrandbits(64))
+        locked = grid.flags.translate(LOCKED_TABLE)
+        free = np.frombuffer(locked, dtype=np.uint8).reshape(height,
+                                                             width) == 0
+
+        can_north = np.zeros((height, width), dtype=bool)
+        can_north[1:] = free[1:] & free[:-1]
+        can_west = np.zeros((height, width), dtype=bool)
+        can_west[:, 1:] = free[:, 1:] & free[:, :-1]
+        coin = generator.random((height, width)) < 0.5
+        north = can_north & (coin | ~can_west)
+        west = can_west & ~north
+
+        walls = np.full((height, width), 0xF, dtype=np.uint8)
+        walls -= north.astype(np.uint8) * WALL[NORTH]
+        walls[:-1] -= north[1:].astype(np.uint8) * WALL[SOUTH]
+        walls -= west.astype(np.uint8) * WALL[WEST]
+        walls[:, :-1] -= west[:, 1:].astype(np.uint8) * WALL[EAST]
+        grid.walls[:] = walls.tobytes()
+        grid.visited[:] = free.astype(np.uint8).tobytes()
+
+        parent = np.arange(width * height)
+        parent[north.ravel()] -= width
+        parent[west.ravel()] -= 1
+        join_trees_numpy(grid.walls, free.ravel(), width, parent,
+                         generator)
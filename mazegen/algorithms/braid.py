@@ -0,0 +1,173 @@
+"""Braid post-processing stage for maze generation.
+
+This module implements the braid stage that runs after carving, next to
+UnPerfect: it removes dead ends by opening one of their walls, preferably
+towards a neighbour that is a dead end too, until the requested share of
+dead ends is gone. A fully braided maze has no dead end at all.
+
+Classes:
+    Braid: Post-processing stage that removes dead ends
+"""
+
+import random
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Carve
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.algorithms.unperfect import DEAD_END_SHARE, find_dead_ends
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, LOCKED_TABLE, PICK_TABLE, WALL_COUNT,
+    inner_walls, offsets, wall_cell,
+)
+from mazegen.utils.rng import ensure_rng
+
+
+class Braid(MazeAlgorithm):
+    """Dead-end removal driven by a work queue.
+
+    The queue is seeded with the cells that have exactly three walls, in
+    grid order. Each dead end taken from the queue opens a wall towards a
+    free neighbour, preferring one that is itself a dead end, so one
+    removal clears both. For a partial braid, a seed is only handled
+    while the seeds cleared so far stay below the percentage of the seeds
+    seen so far, which spreads the removals evenly over the grid and
+    clears the requested share even though some removals clear two dead
+    ends.
+
+    Opening a wall can only turn a neighbour into a dead end when that
+    neighbour had four walls, i.e. was cut off; such a neighbour is queued
+    again and always handled. A cell goes from four walls to three at
+    most once and seeds already have three, so every cell is queued at
+    most once and the stage is O(cells).
+
+    Attributes:
+        __percent: Share of the dead ends to remove, from 0 to 100
+    """
+
+    # Queue (int32 per cell), its random bytes, locked bytes and the
+    # inner-wall mask
+    WORKSPACE_BYTES_PER_CELL = 7
+
+    def __init__(self, percent: float = 100.0) -> None:
+        """Initialize the stage.
+
+        Args:
+            percent: Share of the dead ends to remove, from 0 to 100
+
+        Raises:
+            ValueError: If the percentage is out of range
+        """
+        if not 0.0 <= percent <= 100.0:
+            raise ValueError("Braid percentage must be between 0 and 100")
+        self.__percent = percent
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per opened wall.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return int(self.__percent / 100.0 * DEAD_END_SHARE * width * height)
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Remove dead ends from a carved maze.
+
+        Args:
+            maze: Maze object to modify
+            entry_x: Starting X coordinate (unused for this stage)
+            entry_y: Starting Y coordinate (unused for this stage)
+            animate: If True, yields maze state after each wall removal.
+                    If False, yields only the final maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Unused, this stage yields after each
+                removed dead end
+
+        Returns:
+            Generator yielding Maze states at each modification.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        walls = grid.walls
+        locked = grid.flags.translate(LOCKED_TABLE)
+        inner = inner_walls(width, grid.height)
+        wall_count = WALL_COUNT
+        pick = PICK_TABLE
+        steps = offsets(width)
+        getrandbits = rng.getrandbits
+        emit = maze.events if animate else None
+
+        queue = find_dead_ends(walls)
+        seeds = len(queue)
+        randbytes = rng.randbytes(seeds)
+        share = self.__percent / 100.0
+        partial = share < 1.0
+        # Seeds handled so far and seeds that are no dead end any more
+        seen = 0
+        cleared = 0
+
+        # The array iterator also reaches the cells appended on the way
+        for position, index in enumerate(queue):
+            code = walls[index]
+            if position < seeds:
+                seen += 1
+                if wall_count[code] != 3:
+                    continue
+                if partial and cleared >= share * seen:
+                    continue
+                byte = randbytes[position]
+            else:
+                if wall_count[code] != 3:
+                    continue
+                byte = getrandbits(8)
+
+            # Walled free neighbours, keeping only the dead ends if any
+            walled = code & inner[index]
+            mask = 0
+            ends = 0
+            if walled & 0x1 and not locked[index - width]:
+                mask = 1
+                if wall_count[walls[index - width]] == 3:
+                    ends = 1
+            if walled & 0x2 and not locked[index + 1]:
+                mask |= 2
+                if wall_count[walls[index + 1]] == 3:
+                    ends |= 2
+            if walled & 0x4 and not locked[index + width]:
+                mask |= 4
+                if wall_count[walls[index + width]] == 3:
+                    ends |= 4
+            if walled & 0x8 and not locked[index - 1]:
+                mask |= 8
+                if wall_count[walls[index - 1]] == 3:
+                    ends |= 8
+            if ends:
+                mask = ends
+                cleared += 2
+            elif mask:
+                cleared += 1
+            else:
+                continue
+
+            direction = pick[mask << 8 | byte]
+            neighbour = index + steps[direction]
+            walls[index] &= CLEAR_HERE[direction]
+            walls[neighbour] &= CLEAR_THERE[direction]
+            if wall_count[walls[neighbour]] == 3:
+                queue.append(neighbour)
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(index % width, index // width, direction))
+                maze.active_cell = wall_cell(index, direction, width)
+                yield maze
+
+        yield maze
@@ -0,0 +1,251 @@
+"""Eller's algorithm implementation for maze generation.
+
+This module implements Eller's algorithm, which builds a perfect maze one
+row at a time while only remembering which set each cell of the current
+row belongs to. The row kernel needs O(width) memory whatever the height,
+so rows can be streamed straight to the output file; ``generate`` runs
+the same kernel into a regular in-memory Maze.
+
+Classes:
+    EllerAlgorithm: Implementation of Eller's maze generation algorithm
+"""
+
+import random
+from array import array
+from typing import Generator, Iterator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Refresh, Row
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.disjoint_set import DisjointSet
+from mazegen.utils.forest import join_components
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, EAST, FREE_TABLE, LOCKED_TABLE, SOUTH)
+from mazegen.utils.rng import ensure_rng
+
+
+class EllerAlgorithm(MazeAlgorithm):
+    """Eller's algorithm for row-by-row maze generation.
+
+    Each row goes through two phases: adjacent cells of different sets
+    are randomly joined, then every set opens at least one passage down,
+    and cells reached from above carry their set into the next row. The
+    last row joins every remaining set. Set labels are renumbered into
+    [0, width) on each row, so the workspace never grows with height.
+
+    Locked cells take part in no set. A set that locked cells keep from
+    going down is first joined to a neighbour in its row; if that is not
+    possible either, ``generate`` reconnects the pieces with
+    ``join_components`` once the kernel is done.
+
+    Attributes:
+        __isolated: Number of sets the last kernel run could not carry
+            down or join to the rest of the maze
+    """
+
+    # Blocked bytes; the row kernel itself is O(width)
+    WORKSPACE_BYTES_PER_CELL = 1
+    # Labels, union-find, counters and wall buffers of the row kernel,
+    # plus the int objects of the per-row root list
+    ROW_BYTES_PER_COLUMN = 80
+
+    def __init__(self) -> None:
+        """Initialize the algorithm."""
+        self.__isolated = 0
+
+    def rows(
+        self, width: int, height: int, locked: Optional[bytearray] = None,
+        rng: Optional[random.Random] = None
+    ) -> Iterator[bytearray]:
+        """Generate the wall codes of a maze one row at a time.
+
+        Rows are yielded top to bottom once final. The yielded buffer is
+        reused for the next row, so callers must copy or consume it
+        before resuming the iterator.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+            locked: Optional flat buffer, non-zero for locked cells
+            rng: Random number generator; None derives one from the
+                module-level random state
+
+        Returns:
+            Iterator over the 4-bit wall codes of each row.
+        """
+        rng = ensure_rng(rng)
+        getrandbits = rng.getrandbits
+        uniform = rng.random
+        free_row = bytearray(width)
+        labels = array("i", range(width))
+        # Cells whose north wall was opened by the previous row
+        north = bytearray(width)
+        codes = bytearray(width)
+        row_bytes = (width + 7) // 8
+        open_east = CLEAR_HERE[EAST]
+        open_west = CLEAR_THERE[EAST]
+        open_south = CLEAR_HERE[SOUTH]
+        open_north = CLEAR_THERE[SOUTH]
+        self.__isolated = 0
+
+        for y in range(height):
+            last = y == height - 1
+            start = y * width
+            here = free_row if locked is None else locked[start:start + width]
+            below = free_row
+            if locked is not None and not last:
+                below = locked[start + width:start + 2 * width]
+
+            codes[:] = bytearray([0xF]) * width
+            for x in range(width):
+                if north[x]:
+                    codes[x] &= open_north
+            sets = DisjointSet(width)
+            union = sets.union
+            find = sets.find
+
+            # Randomly join adjacent cells of different sets; the last
+            # row joins them all. The row's random bits are unpacked to
+            # bytes, as shifting a width-bit integer per cell is O(width)
+            bits = getrandbits(width).to_bytes(row_bytes, "little")
+            for x in range(width - 1):
+                if here[x] or here[x + 1]:
+                    continue
+                if ((last or bits[x >> 3] >> (x & 7) & 1)
+                        and union(labels[x], labels[x + 1])):
+                    codes[x] &= open_east
+                    codes[x + 1] &= open_west
+
+            if last:
+                if locked is not None:
+                    pieces = {find(labels[x])
+                              for x in range(width) if not here[x]}
+                    self.__isolated += max(len(pieces) - 1, 0)
+                yield codes
+                break
+
+            # Count the cells of each set that can go down, then join a
+            # set that cannot to a neighbour in the row
+            if locked is not None and any(below):
+                exits = array("i", bytes(4 * width))
+                for x in range(width):
+                    if not here[x] and not below[x]:
+                        exits[find(labels[x])] += 1
+                for order in (range(width - 1), range(width - 2, -1, -1)):
+                    for x in order:
+                        if here[x] or here[x + 1]:
+                            continue
+                        left = find(labels[x])
+                        right = find(labels[x + 1])
+                        if left != right and not (exits[left]
+                                                  and exits[right]):
+                            union(left, right)
+                            exits[find(left)] = exits[left] + exits[right]
+                            codes[x] &= open_east
+                            codes[x + 1] &= open_west
+
+            # Open random passages down, at least one per set; a random
+            # member is kept per set by reservoir sampling
+            roots = [find(label) for label in labels]
+            down = array("i", bytes(4 * width))
+            seen = array("i", bytes(4 * width))
+            pick = array("i", bytes(4 * width))
+            bits = getrandbits(width).to_bytes(row_bytes, "little")
+            for x in range(width):
+                north[x] = 0
+                if here[x] or below[x]:
+                    continue
+                root = roots[x]
+                seen[root] += 1
+                if uniform() * seen[root] < 1.0:
+                    pick[root] = x
+                if bits[x >> 3] >> (x & 7) & 1:
+                    north[x] = 1
+                    down[root] += 1
+            for x in range(width):
+                root = roots[x]
+                if here[x] or down[root]:
+                    continue
+                down[root] = 1
+                if seen[root]:
+                    north[pick[root]] = 1
+                    codes[pick[root]] &= open_south
+                else:
+                    self.__isolated += 1
+
+            # Carry sets down and renumber labels into [0, width)
+            remap = array("i", [-1]) * width
+            fresh = 0
+            for x in range(width):
+                if north[x]:
+                    codes[x] &= open_south
+                    root = roots[x]
+                    if remap[root] < 0:
+                        remap[root] = fresh
+                        fresh += 1
+                    labels[x] = remap[root]
+            for x in range(width):
+                if not north[x]:
+                    labels[x] = fresh
+                    fresh += 1
+
+            yield codes
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per row.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return height + 1
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using Eller's algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate (unused, kept for the interface)
+            entry_y: Starting Y coordinate (unused, kept for the interface)
+            animate: If True, yields maze state after each row.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        walls = grid.walls
+        visited = grid.visited
+        locked = grid.flags.translate(LOCKED_TABLE)
+        emit = maze.events if animate else None
+
+        maze.gen_step = 1
+        rows = self.rows(width, grid.height, locked, rng)
+        for y, codes in enumerate(rows):
+            start = y * width
+            walls[start:start + width] = codes
+            visited[start:start + width] = (
+                locked[start:start + width].translate(FREE_TABLE))
+            if animate:
+                if emit is not None:
+                    emit(Row(y))
+                maze.active_cell = (width - 1, y, 0)
+                yield maze
+
+        if self.__isolated:
+            join_components(walls, locked, width, rng)
+            if emit is not None:
+                emit(Refresh())
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
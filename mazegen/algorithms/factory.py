@@ -5,6 +5,8 @@ Factory design pattern to create algorithm instances based on
 configuration, supporting the Open/Closed Principle.
 """
 
+import inspect
+from typing import Any
 from mazegen.algorithms.algorithm import MazeAlgorithm
 
 
@@ -30,9 +32,35 @@ class AlgorithmFactory:
                     BacktrackingAlgorithm,
                 )
                 from mazegen.algorithms.prim import PrimAlgorithm
+                from mazegen.algorithms.kruskal import KruskalAlgorithm
+                from mazegen.algorithms.wilson import WilsonAlgorithm
+                from mazegen.algorithms.eller import EllerAlgorithm
+                from mazegen.algorithms.binary_tree import (
+                    BinaryTreeAlgorithm,
+                )
+                from mazegen.algorithms.sidewinder import (
+                    SidewinderAlgorithm,
+                )
+                from mazegen.algorithms.growing_tree import (
+                    GrowingTreeAlgorithm,
+                )
+                from mazegen.algorithms.hunt_and_kill import (
+                    HuntAndKillAlgorithm,
+                )
+                from mazegen.algorithms.recursive_division import (
+                    RecursiveDivisionAlgorithm,
+                )
                 cls.__algorithms = {
                     "backtracking": BacktrackingAlgorithm,
                     "prim": PrimAlgorithm,
+                    "kruskal": KruskalAlgorithm,
+                    "wilson": WilsonAlgorithm,
+                    "eller": EllerAlgorithm,
+                    "binary_tree": BinaryTreeAlgorithm,
+                    "sidewinder": SidewinderAlgorithm,
+                    "growing_tree": GrowingTreeAlgorithm,
+                    "hunt_and_kill": HuntAndKillAlgorithm,
+                    "recursive_division": RecursiveDivisionAlgorithm,
                 }
             except ImportError as e:
                 raise RuntimeError(
@@ -44,12 +72,16 @@ class AlgorithmFactory:
                 ) from e
 
     @classmethod
-    def create(cls, algorithm_name: str) -> MazeAlgorithm:
+    def create(cls, algorithm_name: str, **options: Any) -> MazeAlgorithm:
         """Create an algorithm instance by name.
 
         Args:
             algorithm_name: Name of the algorithm to create
                            (case-insensitive)
+            **options: Tuning options forwarded to the algorithm
+                       constructor. Options the constructor does not
+                       accept are dropped, so callers can pass the same
+                       set whatever the algorithm.
 
         Returns:
             MazeAlgorithm: An instance of the requested algorithm
@@ -68,7 +100,11 @@ class AlgorithmFactory:
             )
 
         algorithm_class = cls.__algorithms[algo_name_lower]
-        return algorithm_class()
+        accepted = inspect.signature(algorithm_class).parameters
+        return algorithm_class(
+            **{key: value for key, value in options.items()
+               if key in accepted}
+        )
 
     @classmethod
     def register(cls, name: str,
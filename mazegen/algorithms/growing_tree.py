@@ -0,0 +1,156 @@
+"""Growing Tree algorithm implementation for maze generation.
+
+This module implements the Growing Tree algorithm. A set of active cells
+starts with the entry; at each step one active cell is selected and
+carves into a random unvisited neighbour, which becomes active, or is
+removed from the set when it has none. The selection policy sets the
+texture of the maze:
+
+- newest: long winding corridors, like backtracking
+- random: short dead ends everywhere, like Prim
+- oldest: long straight corridors radiating from the entry
+- mix: newest with probability ``ratio``, random otherwise
+
+Classes:
+    GrowingTreeAlgorithm: Implementation of the Growing Tree algorithm
+"""
+
+import random
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Backtrack, Carve, Visit
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.active_set import POLICIES, ActiveSet
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, LOCKED_TABLE, OPPOSITE, OPTIONS)
+from mazegen.utils.rng import ensure_rng
+
+
+class GrowingTreeAlgorithm(MazeAlgorithm):
+    """Growing Tree algorithm with a configurable selection policy.
+
+    Active cells are kept in an ActiveSet, so every policy selects and
+    removes its cell in O(1).
+
+    Attributes:
+        __policy: Selection policy, one of POLICIES
+        __ratio: Probability of selecting the newest cell with "mix"
+    """
+
+    # ActiveSet slots plus one blocked byte per cell
+    WORKSPACE_BYTES_PER_CELL = 5
+
+    def __init__(self, policy: str = "newest", ratio: float = 0.5) -> None:
+        """Initialize the algorithm.
+
+        Args:
+            policy: "newest", "random", "oldest" or "mix"
+            ratio: Probability of selecting the newest cell when the
+                policy is "mix", between 0 and 1
+
+        Raises:
+            ValueError: If the policy is unknown or the ratio out of range
+        """
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown growing tree policy '{policy}'. "
+                f"Available policies: {', '.join(POLICIES)}"
+            )
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError("Growing tree ratio must be between 0 and 1")
+        self.__policy = policy
+        self.__ratio = ratio
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using the Growing Tree algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            animate: If True, yields maze state after each carve.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        size = width * grid.height
+        last_x = width - 1
+        walls = grid.walls
+        visited = grid.visited
+        blocked = grid.flags.translate(LOCKED_TABLE)
+        offsets = (-width, 1, width, -1)
+        active = ActiveSet(size)
+        randrange = rng.randrange
+        uniform = rng.random
+        choice = rng.choice
+        policy = self.__policy
+        ratio = self.__ratio
+
+        emit = maze.events if animate else None
+        maze.gen_step = 1
+        start = entry_y * width + entry_x
+        visited[start] = 1
+        blocked[start] = 1
+        active.push(start)
+        if animate:
+            if emit is not None:
+                emit(Visit(entry_x, entry_y))
+            maze.active_cell = (entry_x, entry_y, 0)
+            yield maze
+
+        while active:
+            count = len(active)
+            if policy == "newest":
+                offset = count - 1
+            elif policy == "oldest":
+                offset = 0
+            elif policy == "random" or uniform() >= ratio:
+                offset = randrange(count)
+            else:
+                offset = count - 1
+            index = active.at(offset)
+
+            x = index % width
+            mask = 0
+            if index >= width and not blocked[index - width]:
+                mask = 1
+            if x < last_x and not blocked[index + 1]:
+                mask |= 2
+            if index + width < size and not blocked[index + width]:
+                mask |= 4
+            if x > 0 and not blocked[index - 1]:
+                mask |= 8
+            if not mask:
+                active.remove(offset)
+                if emit is not None:
+                    emit(Backtrack(x, index // width))
+                continue
+
+            direction = choice(OPTIONS[mask])
+            neighbour = index + offsets[direction]
+            walls[index] &= CLEAR_HERE[direction]
+            walls[neighbour] &= CLEAR_THERE[direction]
+            visited[neighbour] = 1
+            blocked[neighbour] = 1
+            active.push(neighbour)
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(neighbour % width, neighbour // width,
+                               OPPOSITE[direction]))
+                maze.active_cell = (neighbour % width, neighbour // width, 0)
+                yield maze
+
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
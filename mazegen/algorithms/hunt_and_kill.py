@@ -0,0 +1,165 @@
+"""Hunt-and-Kill algorithm implementation for maze generation.
+
+This module implements the Hunt-and-Kill algorithm: a random walk carves
+through unvisited cells until it is stuck, then a hunt looks for an
+unvisited cell next to the visited area, connects it and starts a new walk
+from there. Unlike backtracking, no stack of the walk is kept.
+
+Classes:
+    HuntAndKillAlgorithm: Implementation of the Hunt-and-Kill algorithm
+"""
+
+import random
+from array import array
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Carve, Visit
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, LOCKED_TABLE, OPPOSITE, OPTIONS)
+from mazegen.utils.rng import ensure_rng
+
+
+class HuntAndKillAlgorithm(MazeAlgorithm):
+    """Hunt-and-Kill algorithm with an indexed hunt phase.
+
+    Free unvisited cells next to a visited cell are flagged as hunt
+    candidates, and each row keeps the count of its candidates. The hunt
+    skips rows with no candidate and finds the first flagged cell of the
+    row with ``bytearray.find``, instead of rescanning the grid from the
+    top. Locked cells are never candidates.
+    """
+
+    # Blocked and candidate bytes; the per-row counters are O(height)
+    WORKSPACE_BYTES_PER_CELL = 2
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using the Hunt-and-Kill algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            animate: If True, yields maze state after each walk step, and
+                    on each hunted cell before and after connecting it.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        size = width * height
+        last_x = width - 1
+        walls = grid.walls
+        visited = grid.visited
+        # Locked or visited: cells a walk cannot enter
+        blocked = grid.flags.translate(LOCKED_TABLE)
+        candidate = bytearray(size)
+        pending = array("i", bytes(4 * height))
+        offsets = (-width, 1, width, -1)
+        choice = rng.choice
+        # Every row above this one has no candidate
+        low = height
+
+        def visit(index: int) -> None:
+            nonlocal low
+            visited[index] = 1
+            blocked[index] = 1
+            if candidate[index]:
+                candidate[index] = 0
+                pending[index // width] -= 1
+            x = index % width
+            for neighbour, inside in (
+                (index - width, index >= width),
+                (index + 1, x < last_x),
+                (index + width, index + width < size),
+                (index - 1, x > 0),
+            ):
+                if inside and not blocked[neighbour] and not (
+                        candidate[neighbour]):
+                    candidate[neighbour] = 1
+                    row = neighbour // width
+                    pending[row] += 1
+                    if row < low:
+                        low = row
+
+        emit = maze.events if animate else None
+        maze.gen_step = 1
+        current = entry_y * width + entry_x
+        visit(current)
+        if animate:
+            if emit is not None:
+                emit(Visit(entry_x, entry_y))
+            maze.active_cell = (entry_x, entry_y, 0)
+            yield maze
+
+        while True:
+            # Walk: carve into a random unvisited neighbour
+            x = current % width
+            mask = 0
+            if current >= width and not blocked[current - width]:
+                mask = 1
+            if x < last_x and not blocked[current + 1]:
+                mask |= 2
+            if current + width < size and not blocked[current + width]:
+                mask |= 4
+            if x > 0 and not blocked[current - 1]:
+                mask |= 8
+            if mask:
+                direction = choice(OPTIONS[mask])
+                neighbour = current + offsets[direction]
+                walls[current] &= CLEAR_HERE[direction]
+                walls[neighbour] &= CLEAR_THERE[direction]
+                visit(neighbour)
+                current = neighbour
+                if animate:
+                    if emit is not None:
+                        emit(Carve(current % width, current // width,
+                                   OPPOSITE[direction]))
+                    maze.active_cell = (current % width,
+                                        current // width, 0)
+                    yield maze
+                continue
+
+            # Hunt: first candidate of the first row that has one
+            while low < height and not pending[low]:
+                low += 1
+            if low == height:
+                break
+            row = low * width
+            current = candidate.find(1, row, row + width)
+            x = current - row
+            if animate:
+                maze.active_cell = (x, low, 0)
+                yield maze
+
+            mask = 0
+            if current >= width and visited[current - width]:
+                mask = 1
+            if x < last_x and visited[current + 1]:
+                mask |= 2
+            if current + width < size and visited[current + width]:
+                mask |= 4
+            if x > 0 and visited[current - 1]:
+                mask |= 8
+            direction = choice(OPTIONS[mask])
+            walls[current] &= CLEAR_HERE[direction]
+            walls[current + offsets[direction]] &= CLEAR_THERE[direction]
+            visit(current)
+            if animate:
+                if emit is not None:
+                    emit(Carve(x, low, direction))
+                yield maze
+
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
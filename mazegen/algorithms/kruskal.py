@@ -0,0 +1,105 @@
+"""Kruskal's algorithm implementation for maze generation.
+
+This module implements randomized Kruskal's algorithm. Every inner wall
+between two free cells is an edge; edges are taken in a random order and a
+wall is removed whenever it separates two cells that are not yet
+connected, as decided by a flat-array DisjointSet.
+
+Classes:
+    KruskalAlgorithm: Implementation of Kruskal's maze generation algorithm
+"""
+
+import random
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Carve
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.disjoint_set import DisjointSet
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, EAST, LOCKED_TABLE, SOUTH)
+from mazegen.utils.permutation import permuted_range
+from mazegen.utils.rng import ensure_rng
+
+
+# Edge kinds: 0 is the east wall of a cell, 1 its south wall
+_DIRECTIONS = (EAST, SOUTH)
+
+
+class KruskalAlgorithm(MazeAlgorithm):
+    """Randomized Kruskal's algorithm for maze generation.
+
+    Edges are encoded as ``index * 2 + kind`` and drawn lazily from
+    ``permuted_range``, so no edge list is stored; codes of walls on the
+    border or next to a locked cell are skipped as they come. Locked
+    cells take part in no edge and stay fully walled. The maze grows as
+    a forest that merges into one tree, so the entry point does not
+    matter.
+    """
+
+    # Union-find parents and ranks, and one blocked byte per cell
+    WORKSPACE_BYTES_PER_CELL = 6
+    # 2: edges come from permuted_range instead of a shuffled list
+    VERSION = 2
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using Kruskal's algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate (unused, kept for the interface)
+            entry_y: Starting Y coordinate (unused, kept for the interface)
+            animate: If True, yields maze state after each union.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        size = width * height
+        walls = grid.walls
+        visited = grid.visited
+        blocked = grid.flags.translate(LOCKED_TABLE)
+        offsets = (1, width)
+        clear_here = tuple(CLEAR_HERE[d] for d in _DIRECTIONS)
+        clear_there = tuple(CLEAR_THERE[d] for d in _DIRECTIONS)
+        emit = maze.events if animate else None
+
+        maze.gen_step = 1
+        sets = DisjointSet(size)
+        union = sets.union
+        for edge in permuted_range(size * 2, rng):
+            index = edge >> 1
+            kind = edge & 1
+            other = index + offsets[kind]
+            if kind:
+                if other >= size:
+                    continue
+            elif other % width == 0:
+                continue
+            if blocked[index] or blocked[other] or not union(index, other):
+                continue
+            walls[index] &= clear_here[kind]
+            walls[other] &= clear_there[kind]
+            visited[index] = 1
+            visited[other] = 1
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(index % width, index // width,
+                               _DIRECTIONS[kind]))
+                maze.active_cell = (other % width, other // width, 0)
+                yield maze
+
+        del sets
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
@@ -3,15 +3,28 @@
 This module implements Prim's algorithm for generating perfect mazes.
 It uses a frontier set approach to grow the maze from a starting point.
 
+Two frontier engines are available. The default one keeps the frontier in
+an IndexedSet with O(1) random removal and samples the connecting visited
+neighbour from a precomputed table; it draws random numbers differently
+from earlier releases, so a given seed produces a different maze. The
+seed-compatible engine keeps the original list-based frontier and
+reproduces the earlier mazes exactly.
+
 Classes:
     PrimAlgorithm: Implementation of Prim's maze generation algorithm
 """
 
 import random
-from typing import Generator
+from typing import Generator, Optional
 from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED
+from mazegen.maze.events import Carve, Visit
 from mazegen.algorithms.algorithm import MazeAlgorithm
-from mazegen.algorithms.unperfect import UnPerfect
+from mazegen.utils.indexed_set import IndexedSet
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, LOCKED_TABLE, OPTIONS, direction_to, offsets,
+)
+from mazegen.utils.rng import ensure_rng
 
 
 class PrimAlgorithm(MazeAlgorithm):
@@ -20,10 +33,29 @@ class PrimAlgorithm(MazeAlgorithm):
     Uses a frontier-set approach to progressively expand the maze by
     connecting unvisited cells to the existing maze structure.
     Creates perfect mazes with guaranteed solution paths.
+
+    Attributes:
+        __seed_compat: Use the original list-based frontier so seeds
+            give the same mazes as earlier releases
     """
 
+    # IndexedSet members and slot map plus one blocked byte per cell
+    WORKSPACE_BYTES_PER_CELL = 12
+    BATCHED_YIELDS = True
+
+    def __init__(self, seed_compat: bool = False) -> None:
+        """Initialize the algorithm.
+
+        Args:
+            seed_compat: If True, use the original O(n) frontier removal
+                to reproduce mazes generated by earlier releases. The
+                default fast engine produces different mazes.
+        """
+        self.__seed_compat = seed_compat
+
     def generate(
-        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
     ) -> Generator[Maze, None, None]:
         """Generate a maze using Prim's algorithm.
 
@@ -33,10 +65,141 @@ class PrimAlgorithm(MazeAlgorithm):
             entry_y: Starting Y coordinate
             animate: If True, yields maze state at each step.
                     If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Carved cells between two yielded states when
+                animating
+
+        Returns:
+            Generator yielding Maze states at each step.
+
+        Raises:
+            ValueError: If steps_per_yield is below 1
+        """
+        if steps_per_yield < 1:
+            raise ValueError("Steps per yield must be at least 1")
+        rng = ensure_rng(rng)
+        if self.__seed_compat:
+            return self._generate_compat(maze, entry_x, entry_y, animate,
+                                         rng, steps_per_yield)
+        return self._generate_fast(maze, entry_x, entry_y, animate, rng,
+                                   steps_per_yield)
+
+    def _generate_fast(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool,
+        rng: random.Random, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze with the O(1) IndexedSet frontier.
+
+        Locked cells never enter the frontier, and every frontier cell
+        already touches the maze, so each draw carves one passage.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            animate: If True, yields maze state at each step.
+            rng: Random number generator
+            steps_per_yield: Carved cells between two yielded states
 
         Returns:
             Generator yielding Maze states at each step.
         """
+        grid = maze.grid
+        width = grid.width
+        size = width * grid.height
+        last_x = width - 1
+        walls = grid.walls
+        visited = grid.visited
+        blocked = grid.flags.translate(LOCKED_TABLE)
+        steps = offsets(width)
+        frontier = IndexedSet(size)
+        randrange = rng.randrange
+        choice = rng.choice
+
+        def expand(index: int) -> None:
+            x = index % width
+            if index >= width and not blocked[index - width]:
+                frontier.add(index - width)
+            if x < last_x and not blocked[index + 1]:
+                frontier.add(index + 1)
+            if index + width < size and not blocked[index + width]:
+                frontier.add(index + width)
+            if x > 0 and not blocked[index - 1]:
+                frontier.add(index - 1)
+
+        emit = maze.events if animate else None
+        maze.gen_step = 1
+        start = entry_y * width + entry_x
+        visited[start] = 1
+        blocked[start] = 1
+        # Steps left before the next yielded state
+        countdown = steps_per_yield
+        if animate:
+            if emit is not None:
+                emit(Visit(entry_x, entry_y))
+            maze.active_cell = (entry_x, entry_y, 0)
+            countdown -= 1
+            if not countdown:
+                countdown = steps_per_yield
+                yield maze
+        expand(start)
+
+        while frontier:
+            index = frontier.pop_at(randrange(len(frontier)))
+            x = index % width
+            mask = 0
+            if index >= width and visited[index - width]:
+                mask = 1
+            if x < last_x and visited[index + 1]:
+                mask |= 2
+            if index + width < size and visited[index + width]:
+                mask |= 4
+            if x > 0 and visited[index - 1]:
+                mask |= 8
+            direction = choice(OPTIONS[mask])
+            walls[index] &= CLEAR_HERE[direction]
+            walls[index + steps[direction]] &= CLEAR_THERE[direction]
+            visited[index] = 1
+            blocked[index] = 1
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(x, index // width, direction))
+                maze.active_cell = (x, index // width, 0)
+                countdown -= 1
+                if not countdown:
+                    countdown = steps_per_yield
+                    yield maze
+            expand(index)
+
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
+
+    def _generate_compat(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool,
+        rng: random.Random, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze with the original list-based frontier.
+
+        Removes frontier cells with list.pop(idx), which is O(n) but
+        reproduces the mazes of earlier releases for a given seed.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate
+            entry_y: Starting Y coordinate
+            animate: If True, yields maze state at each step.
+            rng: Random number generator
+            steps_per_yield: Carved cells between two yielded states
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        grid = maze.grid
+        visited = grid.visited
+        flags = grid.flags
+        width = grid.width
 
         def in_bounds(x: int, y: int) -> bool:
             return 0 <= x < maze.width and 0 <= y < maze.height
@@ -45,20 +208,29 @@ class PrimAlgorithm(MazeAlgorithm):
             cand = [(x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)]
             return [(nx, ny) for (nx, ny) in cand if in_bounds(nx, ny)]
 
+        emit = maze.events if animate else None
+
         def _generate() -> Generator[Maze, None, None]:
             nonlocal maze
             maze.gen_step = 1
 
-            maze.maze_grid[entry_y][entry_x].visited = True
+            visited[entry_y * width + entry_x] = 1
+            # Steps left before the next yielded state
+            countdown = steps_per_yield
             if animate:
+                if emit is not None:
+                    emit(Visit(entry_x, entry_y))
                 maze.active_cell = (entry_x, entry_y, 0)
-                yield maze
+                countdown -= 1
+                if not countdown:
+                    countdown = steps_per_yield
+                    yield maze
 
             frontier: list[tuple[int, int]] = []
             in_frontier: set[tuple[int, int]] = set()
 
             def add_frontier(nx: int, ny: int) -> None:
-                if (not maze.maze_grid[ny][nx].visited
+                if (not visited[ny * width + nx]
                    and (nx, ny) not in in_frontier):
                     frontier.append((nx, ny))
                     in_frontier.add((nx, ny))
@@ -67,37 +239,36 @@ class PrimAlgorithm(MazeAlgorithm):
                 add_frontier(nx, ny)
 
             while frontier:
-                idx = random.randrange(len(frontier))
+                idx = rng.randrange(len(frontier))
                 x2, y2 = frontier.pop(idx)
                 in_frontier.discard((x2, y2))
 
-                if (maze.maze_grid[y2][x2].visited
-                   or maze.maze_grid[y2][x2].locked is True):
+                index = y2 * width + x2
+                if visited[index] or flags[index] & FLAG_LOCKED:
                     continue
 
                 visited_nbs = [(nx, ny) for (nx, ny) in neighbors(x2, y2)
-                               if maze.maze_grid[ny][nx].visited]
+                               if visited[ny * width + nx]]
                 if not visited_nbs:
                     continue
 
-                x1, y1 = random.choice(visited_nbs)
+                x1, y1 = rng.choice(visited_nbs)
 
                 maze = self.remove_wall(x1, y1, x2, y2, maze)
-                maze.maze_grid[y2][x2].visited = True
+                visited[index] = 1
 
                 if animate:
+                    if emit is not None:
+                        emit(Carve(x2, y2, direction_to(x2, y2, x1, y1)))
                     maze.active_cell = (x2, y2, 0)
-                    yield maze
+                    countdown -= 1
+                    if not countdown:
+                        countdown = steps_per_yield
+                        yield maze
                 for nx, ny in neighbors(x2, y2):
                     add_frontier(nx, ny)
 
-            maze.gen_step = 2
-            if maze.perfect is False:
-                algo = UnPerfect()
-                yield from algo.generate(maze, 0, 0, animate)
-            else:
-                maze.gen_step = 3
-
-            yield maze
+            yield from self.finish(maze, animate, rng=rng,
+                                   steps_per_yield=steps_per_yield)
 
         return _generate()
@@ -0,0 +1,153 @@
+"""Recursive Division algorithm implementation for maze generation.
+
+This module implements the Recursive Division algorithm. Unlike the
+carving algorithms, it starts from a grid with no inner wall and adds
+walls: each chamber is split by a wall with a single gap, and both halves
+are split again until chambers are one cell wide. The result is a perfect
+maze made of nested rectangular chambers.
+
+Chambers wait in an explicit work stack instead of Python recursion, so
+huge mazes cannot hit the recursion limit.
+
+Classes:
+    RecursiveDivisionAlgorithm: Implementation of Recursive Division
+"""
+
+import random
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Refresh, Wall
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.forest import join_components
+from mazegen.utils.kernel import EAST, FREE_TABLE, LOCKED_TABLE, SOUTH
+from mazegen.utils.rng import ensure_rng
+
+
+class RecursiveDivisionAlgorithm(MazeAlgorithm):
+    """Recursive Division algorithm with an explicit chamber stack.
+
+    The whole grid is divided as if no cell were locked, which gives a
+    perfect maze. Locked cells are then walled in on all four sides,
+    which can only split the maze into several trees, and those trees
+    are joined again with random walls between them.
+    """
+
+    # Blocked bytes and the pieces-joining pass after the division
+    WORKSPACE_BYTES_PER_CELL = 13
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per wall, about 3 per 7 cells.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return width * height * 3 // 7
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using the Recursive Division algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate (unused, kept for the interface)
+            entry_y: Starting Y coordinate (unused, kept for the interface)
+            animate: If True, yields maze state after each dividing wall.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        size = width * height
+        last_x = width - 1
+        walls = grid.walls
+        locked = grid.flags.translate(LOCKED_TABLE)
+        getrandbits = rng.getrandbits
+        randrange = rng.randrange
+        add_wall = self.add_wall
+        emit = maze.events if animate else None
+
+        # Open every inner wall, keep the border
+        maze.gen_step = 1
+        inner = bytearray(width)
+        inner[0] |= 0x8
+        inner[last_x] |= 0x2
+        if height == 1:
+            walls[:] = bytes(code | 0x1 | 0x4 for code in inner)
+        else:
+            walls[:] = (bytes(code | 0x1 for code in inner)
+                        + bytes(inner) * (height - 2)
+                        + bytes(code | 0x4 for code in inner))
+        grid.visited[:] = locked.translate(FREE_TABLE)
+        if animate:
+            if emit is not None:
+                emit(Refresh())
+            yield maze
+
+        # Chambers as (x, y, width, height)
+        chambers = [(0, 0, width, height)]
+        while chambers:
+            x, y, w, h = chambers.pop()
+            if w < 2 or h < 2:
+                continue
+            if h > w or (h == w and getrandbits(1)):
+                # Horizontal wall under row wy, with a gap at column gap
+                wy = y + randrange(h - 1)
+                gap = x + randrange(w)
+                for cx in range(x, x + w):
+                    if cx != gap:
+                        add_wall(cx, wy, cx, wy + 1, maze)
+                        if emit is not None:
+                            emit(Wall(cx, wy, SOUTH))
+                chambers.append((x, wy + 1, w, y + h - wy - 1))
+                chambers.append((x, y, w, wy - y + 1))
+                maze.active_cell = (gap, wy, 0)
+            else:
+                # Vertical wall east of column wx, with a gap at row gap
+                wx = x + randrange(w - 1)
+                gap = y + randrange(h)
+                for cy in range(y, y + h):
+                    if cy != gap:
+                        add_wall(wx, cy, wx + 1, cy, maze)
+                        if emit is not None:
+                            emit(Wall(wx, cy, EAST))
+                chambers.append((wx + 1, y, x + w - wx - 1, h))
+                chambers.append((x, y, wx - x + 1, h))
+                maze.active_cell = (wx, gap, 0)
+            if animate:
+                yield maze
+
+        # Wall in the locked cells, then join the pieces they cut off
+        index = locked.find(1)
+        if index >= 0:
+            while index >= 0:
+                x = index % width
+                walls[index] = 0xF
+                if index >= width:
+                    walls[index - width] |= 0x4
+                if x < last_x:
+                    walls[index + 1] |= 0x8
+                if index + width < size:
+                    walls[index + width] |= 0x1
+                if x > 0:
+                    walls[index - 1] |= 0x2
+                index = locked.find(1, index + 1)
+            join_components(walls, locked, width, rng)
+            if emit is not None:
+                emit(Refresh())
+
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
@@ -0,0 +1,244 @@
+"""Sidewinder algorithm implementation for maze generation.
+
+This module implements the Sidewinder algorithm: each row is cut into
+random runs of cells joined east to west, and every run opens one random
+north wall. The top row is a single corridor. Runs are independent of
+each other, so the whole grid is carved with NumPy array operations
+(run segmentation by cumulative sums, one grouped random choice per run)
+when NumPy is installed; a pure-Python engine is used otherwise and for
+animated runs.
+
+The NumPy engine draws its random numbers from a NumPy generator seeded
+from the ``random.Random`` of the run, so seeds stay reproducible, but the
+two engines give different mazes for the same seed.
+
+Classes:
+    SidewinderAlgorithm: Implementation of the Sidewinder algorithm
+"""
+
+import random
+from array import array
+from typing import Any, Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Refresh, Row
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.forest import join_trees, join_trees_numpy
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, EAST, LOCKED_TABLE, NORTH, SOUTH, WALL,
+    WEST)
+from mazegen.utils.rng import ensure_rng
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class SidewinderAlgorithm(MazeAlgorithm):
+    """Sidewinder algorithm with an optional NumPy engine.
+
+    Locked cells end a run. A run with no free cell above it, such as a
+    top-row run cut by the stamp, starts a separate tree; those trees
+    are joined afterwards with random walls between them.
+
+    Attributes:
+        __use_numpy: Use the vectorized engine when NumPy is available
+    """
+
+    # Boolean masks, run ids, random keys and parent links (int64) of
+    # the NumPy engine
+    WORKSPACE_BYTES_PER_CELL = 48
+
+    def __init__(self, use_numpy: bool = True) -> None:
+        """Initialize the algorithm.
+
+        Args:
+            use_numpy: If False, always use the pure-Python engine
+        """
+        self.__use_numpy = use_numpy and HAS_NUMPY
+
+    @property
+    def engine(self) -> str:
+        """Name of the engine static runs carve with."""
+        return "numpy" if self.__use_numpy else "python"
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per row.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        return height + 1
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using the Sidewinder algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate (unused, kept for the interface)
+            entry_y: Starting Y coordinate (unused, kept for the interface)
+            animate: If True, yields maze state after each row, using
+                    the pure-Python engine.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        maze.gen_step = 1
+        if self.__use_numpy and not animate:
+            self._carve_numpy(maze, rng)
+        else:
+            yield from self._carve_python(maze, animate, rng)
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
+
+    def _carve_python(
+        self, maze: Maze, animate: bool, rng: random.Random
+    ) -> Generator[Maze, None, None]:
+        """Carve the maze run by run.
+
+        Args:
+            maze: Maze object to carve
+            animate: If True, yields maze state after each row
+            rng: Random number generator
+
+        Returns:
+            Generator yielding Maze states after each row.
+        """
+        grid = maze.grid
+        width = grid.width
+        walls = grid.walls
+        visited = grid.visited
+        locked = grid.flags.translate(LOCKED_TABLE)
+        parent = array("i", range(width * grid.height))
+        getrandbits = rng.getrandbits
+        emit = maze.events if animate else None
+        randrange = rng.randrange
+        open_east = CLEAR_HERE[EAST]
+        open_west = CLEAR_THERE[EAST]
+        open_north = CLEAR_HERE[NORTH]
+        open_south = CLEAR_THERE[NORTH]
+
+        for y in range(grid.height):
+            row = y * width
+            bits = getrandbits(width)
+            start = -1
+            seen = 0
+            pick = -1
+            for x in range(width):
+                index = row + x
+                if locked[index]:
+                    continue
+                visited[index] = 1
+                if start < 0:
+                    start, seen, pick = index, 0, -1
+                if y > 0 and not locked[index - width]:
+                    seen += 1
+                    if randrange(seen) == 0:
+                        pick = index
+                if (x < width - 1 and not locked[index + 1]
+                        and (y == 0 or bits >> x & 1)):
+                    walls[index] &= open_east
+                    walls[index + 1] &= open_west
+                    continue
+
+                # Close the run: link every cell towards the north exit
+                if pick >= 0:
+                    walls[pick] &= open_north
+                    walls[pick - width] &= open_south
+                    parent[pick] = pick - width
+                    for cell in range(start, pick):
+                        parent[cell] = cell + 1
+                    for cell in range(pick + 1, index + 1):
+                        parent[cell] = cell - 1
+                else:
+                    for cell in range(start + 1, index + 1):
+                        parent[cell] = cell - 1
+                start = -1
+            if animate:
+                if emit is not None:
+                    emit(Row(y))
+                maze.active_cell = (width - 1, y, 0)
+                yield maze
+
+        join_trees(walls, locked, width, parent, rng)
+        if emit is not None:
+            emit(Refresh())
+
+    def _carve_numpy(self, maze: Maze, rng: random.Random) -> None:
+        """Carve the whole maze with vectorized array operations.
+
+        Args:
+            maze: Maze object to carve
+            rng: Random number generator seeding the NumPy generator
+        """
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        size = width * height
+        generator: Any = np.random.default_rng(rng.getrandbits(64))
+        locked = grid.flags.translate(LOCKED_TABLE)
+        free = np.frombuffer(locked, dtype=np.uint8).reshape(height,
+                                                             width) == 0
+
+        # A free cell joins its east neighbour unless the run closes there
+        close = generator.random((height, width)) < 0.5
+        close[0] = False
+        close[:, -1] = True
+        close[:, :-1] |= ~free[:, 1:]
+        east = free & ~close
+        start = free.copy()
+        start[:, 1:] &= ~east[:, :-1]
+
+        # Runs are contiguous in flat order: the largest random key of
+        # each run picks its north exit among the cells with a free cell
+        # above
+        can_north = np.zeros((height, width), dtype=bool)
+        can_north[1:] = free[1:] & free[:-1]
+        flat_start = start.ravel()
+        flat_north = can_north.ravel()
+        starts = np.flatnonzero(flat_start)
+        cells = np.arange(size)
+        parent = cells.copy()
+        north = np.zeros(size, dtype=bool)
+        if starts.size:
+            run = np.cumsum(flat_start) - 1
+            keys = generator.permutation(size)
+            keys[~flat_north] = -1
+            best = np.maximum.reduceat(keys, starts)
+            north = flat_north & (keys == best[run])
+            exit_cell = np.full(starts.size, -1)
+            exit_cell[run[north]] = cells[north]
+            target = exit_cell[run]
+            parent = np.where(
+                target < 0,
+                np.where(flat_start, cells, cells - 1),
+                np.where(cells < target, cells + 1,
+                         np.where(cells > target, cells - 1,
+                                  cells - width)))
+            parent = np.where(free.ravel(), parent, cells)
+        north_grid = north.reshape(height, width)
+
+        walls = np.full((height, width), 0xF, dtype=np.uint8)
+        walls -= north_grid.astype(np.uint8) * WALL[NORTH]
+        walls[:-1] -= north_grid[1:].astype(np.uint8) * WALL[SOUTH]
+        walls -= east.astype(np.uint8) * WALL[EAST]
+        walls[:, 1:] -= east[:, :-1].astype(np.uint8) * WALL[WEST]
+        grid.walls[:] = walls.tobytes()
+        grid.visited[:] = free.astype(np.uint8).tobytes()
+
+        join_trees_numpy(grid.walls, free.ravel(), width, parent,
+                         generator)
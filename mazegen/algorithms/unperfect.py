@@ -1,18 +1,68 @@
 """Unperfect maze generation algorithm.
 
 This module implements an algorithm that adds loops and cycles to a perfect
-maze, creating multiple paths and solutions. It removes walls selectively
-while maintaining maze connectivity.
+maze, creating multiple paths and solutions. It opens walls of dead ends,
+which always closes a loop since the maze is already connected.
+
+Dead ends are read straight from the wall bytes of the grid. Carving
+algorithms that see their dead ends while carving can hand them over, so
+no second pass over the grid is needed; otherwise they are found with one
+``bytes.translate`` of the walls. Handed-over dead ends are sorted into
+grid order first, so a seed gives the same loops either way.
+
+The seed-compatible engine keeps the original pass instead: it shuffles
+every closed inner wall and opens the ones between two cells with fewer
+than two openings, which reproduces the loops of earlier releases.
+
+Constants:
+    DEAD_END_SHARE: Rough share of dead ends among the cells of a perfect
+        maze, for step estimates
 
 Classes:
     UnPerfect: Algorithm for generating mazes with loops and multiple paths
+
+Functions:
+    find_dead_ends: Indices of the cells with exactly three walls
 """
 
 import math
 import random
-from typing import Generator
+from array import array
+from itertools import compress
+from typing import Generator, Iterable, List, Optional, Sequence, Tuple
 from mazegen.maze.maze import Maze
+from mazegen.maze.events import Carve
 from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.kernel import (
+    CLEAR_HERE, CLEAR_THERE, DEAD_END_TABLE, EAST, LOCKED_TABLE, PICK_TABLE,
+    SOUTH, WALL_COUNT, carve, inner_walls, offsets, wall_cell,
+)
+from mazegen.utils.rng import ensure_rng
+
+
+DEAD_END_SHARE = 0.2
+
+# Openings as counted by the original pass, which tests the north and
+# east walls together instead of the west wall; kept for its loops
+_LEGACY_OPENINGS = bytes(
+    (not code & 0x1) + (not code & 0x2) + (not code & 0x3) + (not code & 0x4)
+    for code in range(16)
+)
+
+
+def find_dead_ends(walls: bytearray) -> "array[int]":
+    """Return the indices of the cells with exactly three walls.
+
+    Locked cells have four walls, so they are never returned.
+
+    Args:
+        walls: Flat wall buffer of the grid
+
+    Returns:
+        array[int]: Dead-end cell indices in increasing order
+    """
+    return array("i", compress(range(len(walls)),
+                               walls.translate(DEAD_END_TABLE)))
 
 
 class UnPerfect(MazeAlgorithm):
@@ -20,10 +70,72 @@ class UnPerfect(MazeAlgorithm):
 
     Transforms a perfect maze by adding loops through selective wall removal.
     This creates mazes with multiple paths between entry and exit points.
+
+    Each dead end that is tried opens one of its walls towards a free
+    neighbour, preferably a neighbour that is a dead end too, so one
+    removal can clear two dead ends. Without a loop density, dead ends
+    are drawn at random until about sqrt(width * height) walls are
+    removed. With a density, every dead end is tried once, in grid order,
+    with that probability, so a density of 1 leaves no dead end.
+
+    The direction is picked with one random byte per dead end, drawn in
+    bulk, which is uniform up to a bias below 1% between three options.
+
+    Attributes:
+        __loop_density: Fraction of dead ends to try, or None
+        __dead_ends: Dead ends collected by the carving pass, or None
+        __seed_compat: Use the original pass when no density is set, so
+            seeds give the same loops as earlier releases
     """
 
+    # Dead-end index array (int32 at most per cell), its random bytes
+    # and the inner-wall mask
+    WORKSPACE_BYTES_PER_CELL = 6
+    BATCHED_YIELDS = True
+    # 2: seed-compatible loops come from the original pass again
+    VERSION = 2
+
+    def __init__(self, loop_density: Optional[float] = None,
+                 dead_ends: Optional[Sequence[int]] = None,
+                 seed_compat: bool = False) -> None:
+        """Initialize the algorithm.
+
+        Args:
+            loop_density: Fraction of dead ends to try, between 0 and 1,
+                or None for about sqrt(width * height) loops
+            dead_ends: Dead ends collected while carving, in any order.
+                They are drawn from in grid order, so they give the same
+                loops as None, which finds them from the wall bytes.
+            seed_compat: If True and no density is set, use the original
+                pass over every inner wall to reproduce the loops of
+                earlier releases
+
+        Raises:
+            ValueError: If the density is out of range
+        """
+        if loop_density is not None and not 0.0 <= loop_density <= 1.0:
+            raise ValueError("Loop density must be between 0 and 1")
+        self.__loop_density = loop_density
+        self.__dead_ends = dead_ends
+        self.__seed_compat = seed_compat
+
+    def estimate_steps(self, width: int, height: int) -> int:
+        """Estimate the yielded states: one per opened wall.
+
+        Args:
+            width: Maze width in cells
+            height: Maze height in cells
+
+        Returns:
+            int: Estimated number of yielded states
+        """
+        if self.__loop_density is None:
+            return int(math.sqrt(width * height))
+        return int(self.__loop_density * DEAD_END_SHARE * width * height)
+
     def generate(
-        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
     ) -> Generator[Maze, None, None]:
         """Generate loops in a maze by removing selected walls.
 
@@ -33,78 +145,179 @@ class UnPerfect(MazeAlgorithm):
             entry_y: Starting Y coordinate (unused for this algorithm)
             animate: If True, yields maze state after each wall removal.
                     If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Wall removals between two yielded states
+                when animating
 
         Returns:
             Generator yielding Maze states at each modification.
+
+        Raises:
+            ValueError: If steps_per_yield is below 1
         """
+        if steps_per_yield < 1:
+            raise ValueError("Steps per yield must be at least 1")
+        rng = ensure_rng(rng)
+        if self.__seed_compat and self.__loop_density is None:
+            yield from self._generate_compat(maze, animate, rng,
+                                             steps_per_yield)
+            return
+        grid = maze.grid
+        width = grid.width
+        height = grid.height
+        size = width * height
+        walls = grid.walls
+        wall_count = WALL_COUNT
+        pick = PICK_TABLE
+        steps = offsets(width)
+        emit = maze.events if animate else None
+
+        inner = inner_walls(width, height)
 
-        def in_bounds(x: int, y: int) -> bool:
-            return 0 <= x < maze.width and 0 <= y < maze.height
-
-        def _generate() -> Generator[Maze, None, None]:
-            nonlocal maze
-
-            def count_openings(code: int) -> int:
-                count = 0
-                if not code & 1:
-                    count += 1
-                if not code & 2:
-                    count += 1
-                if not code & 3:
-                    count += 1
-                if not code & 4:
-                    count += 1
-                return count
-
-            width = maze.width
-            height = maze.height
-
-            targets = int(math.sqrt(width * height))
-            removed = 0
-            candidates = []
-
-            for y in range(height):
-                for x in range(width):
-
-                    if maze.maze_grid[y][x].locked:
-                        continue
-
-                    cell = f"{maze.maze_grid[y][x].view_cell()}"
-                    code = int(cell, 16)
-                    if x + 1 < width:
-                        if not maze.maze_grid[y][x + 1].locked:
-                            if code & 2:
-                                candidates.append((x, y, x + 1, y, 2))
-                    if y + 1 < height:
-                        if not maze.maze_grid[y + 1][x].locked:
-                            if code & 4:
-                                candidates.append((x, y, x, y + 1, 4))
-
-            random.shuffle(candidates)
-
-            for x1, y1, x2, y2, code in candidates:
-
-                if removed >= targets:
-                    break
-
-                c1 = maze.maze_grid[y1][x1]
-                c2 = maze.maze_grid[y2][x2]
-
-                if c1.locked or c2.locked:
-                    continue
-                if count_openings(int(f"{c1.view_cell()}", 16)) >= 2:
-                    continue
-                if count_openings(int(f"{c2.view_cell()}", 16)) >= 2:
-                    continue
-
-                maze = self.remove_wall(x1, y1, x2, y2, maze)
-                removed += 1
-
-                if animate:
-                    maze.active_cell = (x1, y1, code)
+        dead_ends = self.__dead_ends
+        if dead_ends is None:
+            dead_ends = find_dead_ends(walls)
+        else:
+            # Draw from the order of find_dead_ends, not the carving order
+            dead_ends = sorted(dead_ends)
+        count = len(dead_ends)
+        density = self.__loop_density
+        if density is None:
+            limit = int(math.sqrt(size))
+            randrange = rng.randrange
+            order: Iterable[int] = (
+                dead_ends[randrange(count)] for _ in range(count))
+        elif density < 1.0:
+            limit = count
+            uniform = rng.random
+            order = (index for index in dead_ends if uniform() < density)
+        else:
+            limit = count
+            order = dead_ends
+
+        removed = 0
+        # Removals left before the next yielded state
+        countdown = steps_per_yield
+        for index, byte in zip(order, rng.randbytes(count)):
+            if removed >= limit:
+                break
+            code = walls[index]
+            if wall_count[code] != 3:
+                continue
+
+            # Walled free neighbours, keeping only the dead ends if any;
+            # locked cells have four walls
+            walled = code & inner[index]
+            mask = 0
+            ends = 0
+            if walled & 0x1:
+                around = wall_count[walls[index - width]]
+                if around < 4:
+                    mask = 1
+                    if around == 3:
+                        ends = 1
+            if walled & 0x2:
+                around = wall_count[walls[index + 1]]
+                if around < 4:
+                    mask |= 2
+                    if around == 3:
+                        ends |= 2
+            if walled & 0x4:
+                around = wall_count[walls[index + width]]
+                if around < 4:
+                    mask |= 4
+                    if around == 3:
+                        ends |= 4
+            if walled & 0x8:
+                around = wall_count[walls[index - 1]]
+                if around < 4:
+                    mask |= 8
+                    if around == 3:
+                        ends |= 8
+            if ends:
+                mask = ends
+            elif not mask:
+                continue
+
+            direction = pick[mask << 8 | byte]
+            walls[index] &= CLEAR_HERE[direction]
+            walls[index + steps[direction]] &= CLEAR_THERE[direction]
+            removed += 1
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(index % width, index // width, direction))
+                maze.active_cell = wall_cell(index, direction, width)
+                countdown -= 1
+                if not countdown:
+                    countdown = steps_per_yield
                     yield maze
 
-            maze.gen_step = 3
-            yield maze
+        yield maze
+
+    def _generate_compat(
+        self, maze: Maze, animate: bool, rng: random.Random,
+        steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Add loops with the original pass over every inner wall.
+
+        Lists the closed east and south walls between free cells in grid
+        order, shuffles them and opens them in turn while both cells have
+        fewer than two openings, until about sqrt(width * height) walls
+        are removed. This draws the same random numbers as earlier
+        releases.
+
+        Args:
+            maze: Maze object to modify
+            animate: If True, yields maze state after each wall removal
+            rng: Random number generator
+            steps_per_yield: Wall removals between two yielded states
+
+        Returns:
+            Generator yielding Maze states at each modification.
+        """
+        grid = maze.grid
+        width = grid.width
+        size = width * grid.height
+        walls = grid.walls
+        locked = grid.flags.translate(LOCKED_TABLE)
+        openings = _LEGACY_OPENINGS
+        emit = maze.events if animate else None
+
+        candidates: List[Tuple[int, int]] = []
+        for index in range(size):
+            if locked[index]:
+                continue
+            code = walls[index]
+            if (index % width + 1 < width and not locked[index + 1]
+                    and code & 0x2):
+                candidates.append((index, EAST))
+            if (index + width < size and not locked[index + width]
+                    and code & 0x4):
+                candidates.append((index, SOUTH))
+        rng.shuffle(candidates)
+
+        limit = int(math.sqrt(size))
+        steps = offsets(width)
+        removed = 0
+        countdown = steps_per_yield
+        for index, direction in candidates:
+            if removed >= limit:
+                break
+            if (openings[walls[index]] >= 2
+                    or openings[walls[index + steps[direction]]] >= 2):
+                continue
+            carve(walls, width, index, direction)
+            removed += 1
+
+            if animate:
+                if emit is not None:
+                    emit(Carve(index % width, index // width, direction))
+                maze.active_cell = wall_cell(index, direction, width)
+                countdown -= 1
+                if not countdown:
+                    countdown = steps_per_yield
+                    yield maze
 
-        return _generate()
+        yield maze
@@ -0,0 +1,142 @@
+"""Wilson's algorithm implementation for maze generation.
+
+This module implements Wilson's algorithm, which builds a uniform
+spanning tree out of loop-erased random walks: every perfect maze over
+the free cells is equally likely, without the long-corridor bias of
+backtracking or the short-dead-end bias of Prim.
+
+Classes:
+    WilsonAlgorithm: Implementation of Wilson's maze generation algorithm
+"""
+
+import random
+from array import array
+from typing import Generator, Optional
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Carve, Visit
+from mazegen.algorithms.algorithm import MazeAlgorithm
+from mazegen.utils.indexed_set import IndexedSet
+from mazegen.utils.kernel import CLEAR_HERE, CLEAR_THERE, LOCKED_TABLE, OPTIONS
+from mazegen.utils.rng import ensure_rng
+
+
+class WilsonAlgorithm(MazeAlgorithm):
+    """Wilson's algorithm for uniform spanning tree mazes.
+
+    A walk starts from a random cell outside the tree and wanders until
+    it hits the tree. Only the last direction taken from each cell is
+    kept in a flat next-direction bytearray, so retracing the walk from
+    its start follows the loop-erased path, which is then carved. Cells
+    outside the tree live in an IndexedSet for O(1) random selection.
+
+    Locked cells are never entered, and free cells that locked cells cut
+    off from the entry are left untouched, as the other algorithms do.
+    """
+
+    # Next-direction, move-mask and blocked bytes, IndexedSet members and
+    # slot map, and the flood-fill stack
+    WORKSPACE_BYTES_PER_CELL = 15
+
+    def generate(
+        self, maze: Maze, entry_x: int, entry_y: int, animate: bool = False,
+        rng: Optional[random.Random] = None, steps_per_yield: int = 1
+    ) -> Generator[Maze, None, None]:
+        """Generate a maze using Wilson's algorithm.
+
+        Args:
+            maze: Maze object to generate
+            entry_x: Starting X coordinate, the first cell of the tree
+            entry_y: Starting Y coordinate, the first cell of the tree
+            animate: If True, yields maze state after each carved cell.
+                    If False, yields only the final completed maze.
+            rng: Random number generator; None derives one from the
+                module-level random state
+            steps_per_yield: Steps between two yielded states of the
+                loop stage; carving yields after every step
+
+        Returns:
+            Generator yielding Maze states at each step.
+        """
+        rng = ensure_rng(rng)
+        grid = maze.grid
+        width = grid.width
+        size = width * grid.height
+        last_x = width - 1
+        walls = grid.walls
+        visited = grid.visited
+        locked = grid.flags.translate(LOCKED_TABLE)
+        offsets = (-width, 1, width, -1)
+        randrange = rng.randrange
+        choice = rng.choice
+
+        maze.gen_step = 1
+        start = entry_y * width + entry_x
+        # Doubles as the "seen" marker of the flood fill below
+        next_dir = bytearray(size)
+        moves = bytearray(size)
+        unvisited = IndexedSet(size)
+
+        # Only cells reachable from the entry can join the tree, else a
+        # walk starting in an enclosed pocket would never end
+        next_dir[start] = 1
+        stack = array("i", [start])
+        while stack:
+            index = stack.pop()
+            x = index % width
+            mask = 0
+            if index >= width and not locked[index - width]:
+                mask = 1
+            if x < last_x and not locked[index + 1]:
+                mask |= 2
+            if index + width < size and not locked[index + width]:
+                mask |= 4
+            if x > 0 and not locked[index - 1]:
+                mask |= 8
+            moves[index] = mask
+            for direction in OPTIONS[mask]:
+                neighbour = index + offsets[direction]
+                if not next_dir[neighbour]:
+                    next_dir[neighbour] = 1
+                    unvisited.add(neighbour)
+                    stack.append(neighbour)
+        del stack, locked
+        unvisited.remove(start)
+
+        visited[start] = 1
+        emit = maze.events if animate else None
+        if animate:
+            if emit is not None:
+                emit(Visit(entry_x, entry_y))
+            maze.active_cell = (entry_x, entry_y, 0)
+            yield maze
+
+        while unvisited:
+            origin = unvisited.at(randrange(len(unvisited)))
+
+            # Random walk; revisiting a cell overwrites its direction,
+            # which erases the loop closed since the previous visit
+            index = origin
+            while not visited[index]:
+                direction = choice(OPTIONS[moves[index]])
+                next_dir[index] = direction
+                index += offsets[direction]
+
+            # Carve the loop-erased path into the tree
+            index = origin
+            while not visited[index]:
+                direction = next_dir[index]
+                neighbour = index + offsets[direction]
+                walls[index] &= CLEAR_HERE[direction]
+                walls[neighbour] &= CLEAR_THERE[direction]
+                visited[index] = 1
+                unvisited.remove(index)
+
+                if animate:
+                    if emit is not None:
+                        emit(Carve(index % width, index // width, direction))
+                    maze.active_cell = (index % width, index // width, 0)
+                    yield maze
+                index = neighbour
+
+        yield from self.finish(maze, animate, rng=rng,
+                               steps_per_yield=steps_per_yield)
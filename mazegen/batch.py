@@ -0,0 +1,224 @@
+"""Batch generation of many mazes across a worker pool.
+
+Generating test fixtures one ``a_maze_ing.py`` run at a time pays for the
+terminal interface and a config file read per maze. This module takes one
+validated base configuration and a list of seeds instead, fans generation
+and solving out to a process pool, and writes each maze either to a file
+of its own or to a few shard files.
+
+Each worker receives the base configuration once, when it starts, and
+then only seeds. Workers return the output file contents and the main
+process does all the writing, so files never interleave.
+
+A shard file holds one record per maze: a ``SEED <seed>`` line followed
+by the usual output file contents and a newline. No line of the output
+format starts with ``SEED``, so records split unambiguously.
+
+Classes:
+    BatchResult: Outcome of one maze of a batch
+
+Functions:
+    parse_seeds: Expand a seed specification into seeds
+    render_maze: Generate and solve one maze, return its output text
+    generate_batch: Generate many mazes across worker processes
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    IO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+)
+from mazegen.model import ConfigModel
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.pathfinder import PathFinder
+
+
+# Characters kept as is in per-maze file names
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+# Base configuration of the current worker process, under "config"
+_worker: Dict[str, ConfigModel] = {}
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one maze of a batch.
+
+    Attributes:
+        position: Position of the seed in the batch
+        seed: Seed of the maze
+        path: File the maze was written to
+        solution: Shortest path letters from entry to exit
+    """
+
+    position: int
+    seed: str
+    path: str
+    solution: str
+
+
+def parse_seeds(spec: str) -> List[str]:
+    """Expand a seed specification into seeds.
+
+    ``start:stop[:step]`` is a range of integer seeds, anything else a
+    comma-separated list of seeds.
+
+    Args:
+        spec: Seed specification, e.g. ``"0:1000"`` or ``"a,b,c"``
+
+    Returns:
+        List[str]: The seeds, in order
+
+    Raises:
+        ValueError: If a range bound is not an integer
+    """
+    if ":" in spec:
+        bounds = [int(part) for part in spec.split(":")]
+        if not 2 <= len(bounds) <= 3:
+            raise ValueError(f"Invalid seed range: {spec}")
+        return [str(seed) for seed in range(*bounds)]
+    return [seed.strip() for seed in spec.split(",") if seed.strip()]
+
+
+def _init_worker(config: ConfigModel) -> None:
+    """Store the base configuration in a worker process.
+
+    Args:
+        config: Base configuration of the batch
+    """
+    _worker["config"] = config
+
+
+def render_maze(config: ConfigModel, seed: str) -> Tuple[str, str]:
+    """Generate and solve one maze.
+
+    Generation is always static, and tiled generation carves in the
+    calling process, since batch workers are already spread over the CPUs.
+    Every seed is generated once, so only the disk level of the maze
+    cache is used.
+
+    Args:
+        config: Base configuration of the batch
+        seed: Seed of the maze
+
+    Returns:
+        Tuple[str, str]: Output file contents and shortest path letters
+    """
+    config = config.model_copy(update={
+        "SEED": seed, "MODE_GEN": "static", "WORKERS": 1, "CACHE_MB": 0})
+    generator = MazeGenerator(config)
+    for _ in generator.generate_maze():
+        pass
+    if not generator.maze.shortest_path:
+        PathFinder().solve_shortest_path(generator.maze)
+    return generator.output_text(), generator.maze.shortest_path
+
+
+def _render_task(task: Tuple[int, str]) -> Tuple[int, str, str, str]:
+    """Render one seed with the configuration of the worker.
+
+    Args:
+        task: Position and seed of the maze
+
+    Returns:
+        Tuple[int, str, str, str]: Position, seed, output text and solution
+    """
+    index, seed = task
+    text, solution = render_maze(_worker["config"], seed)
+    return index, seed, text, solution
+
+
+def generate_batch(
+    config: ConfigModel, seeds: Iterable[Union[str, int]], output: str,
+    workers: Optional[int] = None, shards: Optional[int] = None,
+    ordered: bool = True
+) -> Iterator[BatchResult]:
+    """Generate many mazes across worker processes.
+
+    Every maze uses the base configuration with its own seed. Without
+    shards, maze ``seed`` goes to ``<output>/maze_<seed>.txt``, with
+    characters outside ``[A-Za-z0-9_.-]`` replaced by ``_``. With shards,
+    the maze at position ``i`` goes to ``<output>/shard_<i % shards>.txt``,
+    so each shard holds the same mazes whatever the delivery order.
+
+    Results are yielded as mazes are written, in seed order when
+    ``ordered`` is set and as soon as each worker finishes otherwise. The
+    batch runs while the iterator is consumed.
+
+    Args:
+        config: Validated base configuration; its OUTPUT_FILE is ignored
+        seeds: Seeds of the mazes
+        output: Output directory, created if missing
+        workers: Number of worker processes, None for the CPU count;
+            1 generates in this process
+        shards: Number of shard files, None for one file per maze
+        ordered: Deliver results in seed order instead of completion order
+
+    Returns:
+        Iterator yielding a BatchResult per maze.
+
+    Raises:
+        ValueError: If the configuration streams its output or the number
+            of workers or shards is below 1
+    """
+    if config.STREAM_OUTPUT:
+        raise ValueError("Batch generation does not support STREAM_OUTPUT")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Batch needs at least one worker")
+    if shards is not None and shards < 1:
+        raise ValueError("Batch needs at least one shard")
+
+    tasks = [(index, str(seed)) for index, seed in enumerate(seeds)]
+    os.makedirs(output, exist_ok=True)
+    files: Dict[int, IO[str]] = {}
+    try:
+        for index, seed, text, solution in _run(config, tasks, workers,
+                                                ordered):
+            if shards is None:
+                path = os.path.join(
+                    output, f"maze_{_UNSAFE.sub('_', seed)}.txt")
+                with open(path, "w") as file:
+                    file.write(text)
+            else:
+                shard = index % shards
+                path = os.path.join(output, f"shard_{shard:04d}.txt")
+                if shard not in files:
+                    files[shard] = open(path, "w")
+                files[shard].write(f"SEED {seed}\n{text}\n")
+            yield BatchResult(index, seed, path, solution)
+    finally:
+        for shard_file in files.values():
+            shard_file.close()
+
+
+def _run(
+    config: ConfigModel, tasks: List[Tuple[int, str]], workers: int,
+    ordered: bool
+) -> Iterator[Tuple[int, str, str, str]]:
+    """Render tasks in this process or across a process pool.
+
+    Args:
+        config: Base configuration of the batch
+        tasks: Positions and seeds of the mazes
+        workers: Number of worker processes
+        ordered: Deliver results in task order
+
+    Returns:
+        Iterator yielding position, seed, output text and solution.
+    """
+    if workers == 1 or len(tasks) < 2:
+        _init_worker(config)
+        yield from map(_render_task, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(config,)) as executor:
+        if ordered:
+            chunk = max(1, min(64, len(tasks) // (workers * 4)))
+            yield from executor.map(_render_task, tasks, chunksize=chunk)
+        else:
+            futures = [executor.submit(_render_task, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
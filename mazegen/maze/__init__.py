@@ -1,10 +1,12 @@
 """Maze module for complete maze grid management.
 
 Provides the Maze class for representing the complete maze structure
-with all cells and coordinates.
+with all cells and coordinates, and the MazeGrid flat-buffer storage
+backing it.
 """
 
 from mazegen.maze.maze import Maze
+from mazegen.maze.grid import MazeGrid, GridCell
 
 
-__all__ = ["Maze"]
+__all__ = ["Maze", "MazeGrid", "GridCell"]
@@ -0,0 +1,203 @@
+"""Typed generation events.
+
+Animated algorithms yield the whole mutable Maze after each step, which
+leaves consumers to find out what changed. When an event sink is attached
+to the maze (``Maze.events``), the algorithms also describe each step
+with a small typed event, so views, recorders and metrics can follow a
+run incrementally. Step events come from the animated code paths only;
+static runs report their phase changes.
+
+Directions are the kernel indices: 0 North, 1 East, 2 South, 3 West.
+
+Events:
+    Phase: The generation step of the maze changed
+    Visit: A cell was reached without carving, e.g. the start cell
+    Carve: A wall was opened between a cell and its neighbour
+    Wall: A wall was added between two cells
+    Backtrack: A cell has no way left and was dropped by the walk
+    Row: A row was carved in one go
+    Refresh: Walls changed all over the grid
+
+Constants:
+    EVENT_TYPES: Event class of each event code
+
+Classes:
+    EventBuffer: Compact event sink that stores events in an int array
+
+Functions:
+    pack_event: Encode an event as four integers
+    unpack_event: Decode four integers into an event
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Tuple, Union
+
+
+class Phase(NamedTuple):
+    """The generation step of the maze changed.
+
+    Attributes:
+        step: New value of Maze.gen_step
+    """
+
+    step: int
+
+
+class Visit(NamedTuple):
+    """A cell was reached without carving, e.g. the start cell.
+
+    Attributes:
+        x: Column of the cell
+        y: Row of the cell
+    """
+
+    x: int
+    y: int
+
+
+class Carve(NamedTuple):
+    """A wall was opened between a cell and its neighbour.
+
+    Walking algorithms report the cell they just reached; Kruskal reports
+    the west or north cell of the wall, and the loop and braid stages the
+    dead end that opens it.
+
+    Attributes:
+        x: Column of the cell
+        y: Row of the cell
+        direction: Direction of the neighbour behind the opened wall
+    """
+
+    x: int
+    y: int
+    direction: int
+
+
+class Wall(NamedTuple):
+    """A wall was added between two cells.
+
+    Attributes:
+        x: Column of the cell
+        y: Row of the cell
+        direction: Direction of the neighbour behind the new wall
+    """
+
+    x: int
+    y: int
+    direction: int
+
+
+class Backtrack(NamedTuple):
+    """A cell has no way left and was dropped by the walk.
+
+    Attributes:
+        x: Column of the cell
+        y: Row of the cell
+    """
+
+    x: int
+    y: int
+
+
+class Row(NamedTuple):
+    """A row was carved in one go.
+
+    The cells of the row may also have opened the south walls of the row
+    above, so both rows should be read again.
+
+    Attributes:
+        y: Row index
+    """
+
+    y: int
+
+
+class Refresh(NamedTuple):
+    """Walls changed all over the grid, e.g. when pieces are joined."""
+
+
+Event = Union[Phase, Visit, Carve, Wall, Backtrack, Row, Refresh]
+EventSink = Callable[[Event], None]
+
+EVENT_TYPES: Tuple[Any, ...] = (
+    Phase, Visit, Carve, Wall, Backtrack, Row, Refresh)
+# Event code of each event class
+_CODES: Dict[type, int] = {kind: code for code, kind in enumerate(EVENT_TYPES)}
+
+
+def pack_event(event: Event) -> Tuple[int, int, int, int]:
+    """Encode an event as four integers.
+
+    Args:
+        event: Event to encode
+
+    Returns:
+        Tuple[int, int, int, int]: Event code and up to three fields,
+        padded with zeros
+    """
+    fields = tuple(event) + (0, 0, 0)
+    return _CODES[type(event)], fields[0], fields[1], fields[2]
+
+
+def unpack_event(code: int, a: int, b: int, c: int) -> Event:
+    """Decode four integers into an event.
+
+    Args:
+        code: Event code
+        a: First field
+        b: Second field
+        c: Third field
+
+    Returns:
+        Event: The decoded event
+
+    Raises:
+        ValueError: If the code is unknown
+    """
+    if not 0 <= code < len(EVENT_TYPES):
+        raise ValueError(f"Unknown event code: {code}")
+    kind = EVENT_TYPES[code]
+    event: Event = kind(*(a, b, c)[:len(kind._fields)])
+    return event
+
+
+class EventBuffer:
+    """Compact event sink that stores events in an int array.
+
+    Each event takes four 32-bit integers instead of a Python object, so
+    a long run can be buffered cheaply and read back in order.
+
+    Attributes:
+        __data: Packed events, four integers each
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.__data = array("i")
+
+    def __call__(self, event: Event) -> None:
+        """Append an event.
+
+        Args:
+            event: Event to store
+        """
+        self.__data.extend(pack_event(event))
+
+    def __len__(self) -> int:
+        return len(self.__data) // 4
+
+    def __iter__(self) -> Iterator[Event]:
+        data = self.__data
+        for start in range(0, len(data), 4):
+            yield unpack_event(*data[start:start + 4])
+
+    def drain(self) -> Iterator[Event]:
+        """Return the buffered events and empty the buffer.
+
+        Returns:
+            Iterator over the events, oldest first
+        """
+        data = self.__data
+        self.__data = array("i")
+        return (unpack_event(*data[start:start + 4])
+                for start in range(0, len(data), 4))
@@ -0,0 +1,270 @@
+"""Compact array-backed storage for the maze grid.
+
+This module stores every per-cell attribute of the maze in flat buffers
+indexed by ``y * width + x`` instead of one Python object per cell. Walls,
+visited marks and the locked/entry/exit flags each take a single byte per
+cell, which keeps memory proportional to the cell count and lets algorithms
+test walls with a plain index lookup.
+
+Classes:
+    MazeGrid: Flat buffer storage for walls and per-cell flags
+    GridCell: Thin Cell-compatible accessor over one grid index
+    GridRow: Sequence view of one grid row, yielding GridCell accessors
+"""
+
+from array import array
+from typing import Iterator, Optional
+from mazegen.utils.utils import Wall
+
+
+ALL_WALLS = 0xF
+
+FLAG_LOCKED = 0x1
+FLAG_ENTRY = 0x2
+FLAG_EXIT = 0x4
+
+HEX_TABLE = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+
+class MazeGrid:
+    """Flat buffer storage for the cells of a maze.
+
+    Each attribute lives in its own buffer so hot loops only touch the data
+    they need. The ``visited_since`` counters are only used by the TTY
+    animations and are allocated on first write.
+
+    Attributes:
+        walls: One byte per cell holding the 4-bit wall code
+        visited: One byte per cell, non-zero once the cell is visited
+        flags: One byte per cell combining FLAG_LOCKED/ENTRY/EXIT bits
+        lock_codes: Stamp characters of locked cells, keyed by index
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Allocate buffers for a grid with all walls closed.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+        """
+        self.__width: int = width
+        self.__height: int = height
+        size = width * height
+        self.walls: bytearray = bytearray([ALL_WALLS]) * size
+        self.visited: bytearray = bytearray(size)
+        self.flags: bytearray = bytearray(size)
+        self.lock_codes: dict[int, str] = {}
+        self.__visited_since: Optional[array[int]] = None
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    def reset(self) -> None:
+        """Close every wall and clear all flags in place."""
+        size = self.__width * self.__height
+        self.walls[:] = bytearray([ALL_WALLS]) * size
+        self.visited[:] = bytearray(size)
+        self.flags[:] = bytearray(size)
+        self.lock_codes.clear()
+        self.__visited_since = None
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat buffer index of cell (x, y)."""
+        return y * self.__width + x
+
+    def is_locked(self, index: int) -> bool:
+        return bool(self.flags[index] & FLAG_LOCKED)
+
+    def set_flag(self, index: int, flag: int, value: bool) -> None:
+        """Set or clear one of the FLAG_* bits of a cell.
+
+        Args:
+            index: Flat cell index
+            flag: FLAG_LOCKED, FLAG_ENTRY or FLAG_EXIT
+            value: True to set the flag, False to clear it
+        """
+        if value:
+            self.flags[index] |= flag
+        else:
+            self.flags[index] &= ~flag
+
+    def get_visited_since(self, index: int) -> int:
+        if self.__visited_since is None:
+            return 0
+        return self.__visited_since[index]
+
+    def set_visited_since(self, index: int, value: int) -> None:
+        if self.__visited_since is None:
+            if value == 0:
+                return
+            size = self.__width * self.__height
+            self.__visited_since = array("I", bytes(4 * size))
+        self.__visited_since[index] = value
+
+    def hex_row(self, y: int) -> str:
+        """Return the hexadecimal wall codes of one row.
+
+        Args:
+            y: Row index
+
+        Returns:
+            str: One uppercase hex digit per cell
+        """
+        start = y * self.__width
+        row = self.walls[start:start + self.__width]
+        return row.translate(HEX_TABLE).decode("ascii")
+
+    def cell(self, x: int, y: int) -> "GridCell":
+        """Return a Cell-compatible accessor for (x, y)."""
+        return GridCell(self, y * self.__width + x)
+
+    def row(self, y: int) -> "GridRow":
+        """Return a sequence view over row y."""
+        return GridRow(self, y)
+
+    def __getitem__(self, y: int) -> "GridRow":
+        if not 0 <= y < self.__height:
+            raise IndexError("grid row out of range")
+        return GridRow(self, y)
+
+    def __iter__(self) -> Iterator["GridRow"]:
+        for y in range(self.__height):
+            yield GridRow(self, y)
+
+    def __len__(self) -> int:
+        return self.__height
+
+
+class GridRow:
+    """Sequence view of one grid row.
+
+    Supports ``row[x]``, ``len(row)`` and iteration so code written for
+    ``list[list[Cell]]`` keeps working on top of MazeGrid.
+    """
+
+    __slots__ = ("__grid", "__y")
+
+    def __init__(self, grid: MazeGrid, y: int) -> None:
+        self.__grid = grid
+        self.__y = y
+
+    def __getitem__(self, x: int) -> "GridCell":
+        width = self.__grid.width
+        if not 0 <= x < width:
+            raise IndexError("grid column out of range")
+        return GridCell(self.__grid, self.__y * width + x)
+
+    def __iter__(self) -> Iterator["GridCell"]:
+        start = self.__y * self.__grid.width
+        for index in range(start, start + self.__grid.width):
+            yield GridCell(self.__grid, index)
+
+    def __len__(self) -> int:
+        return self.__grid.width
+
+
+class GridCell:
+    """Thin Cell-compatible accessor over a single grid index.
+
+    Exposes the same properties and methods as ``mazegen.cell.Cell`` but
+    reads and writes the shared MazeGrid buffers, so views keep working
+    without one Python object living per cell.
+    """
+
+    __slots__ = ("__grid", "__index")
+
+    def __init__(self, grid: MazeGrid, index: int) -> None:
+        self.__grid = grid
+        self.__index = index
+
+    def remove_cell_wall(self, wall: Wall) -> None:
+        """Remove a wall from the cell.
+
+        Args:
+            wall: Wall enum value (NORTH, EAST, SOUTH, or WEST)
+        """
+        self.__grid.walls[self.__index] &= ~wall
+
+    @property
+    def wall(self) -> int:
+        return self.__grid.walls[self.__index]
+
+    @property
+    def x(self) -> int:
+        return self.__index % self.__grid.width
+
+    @property
+    def y(self) -> int:
+        return self.__index // self.__grid.width
+
+    @property
+    def visited(self) -> bool:
+        return bool(self.__grid.visited[self.__index])
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self.__grid.visited[self.__index] = 1 if value else 0
+
+    @property
+    def visited_since(self) -> int:
+        return self.__grid.get_visited_since(self.__index)
+
+    @visited_since.setter
+    def visited_since(self, value: int) -> None:
+        self.__grid.set_visited_since(self.__index, value)
+
+    @property
+    def locked(self) -> bool:
+        return self.__grid.is_locked(self.__index)
+
+    @locked.setter
+    def locked(self, value: bool) -> None:
+        self.__grid.set_flag(self.__index, FLAG_LOCKED, value)
+
+    @property
+    def lock_code(self) -> str:
+        if not self.locked:
+            return " "
+        return self.__grid.lock_codes.get(self.__index, " ")
+
+    @lock_code.setter
+    def lock_code(self, code: str) -> None:
+        if code != " ":
+            self.__grid.set_flag(self.__index, FLAG_LOCKED, True)
+            self.__grid.lock_codes[self.__index] = code
+        else:
+            self.__grid.set_flag(self.__index, FLAG_LOCKED, False)
+            self.__grid.lock_codes.pop(self.__index, None)
+
+    @property
+    def is_entry(self) -> bool:
+        return bool(self.__grid.flags[self.__index] & FLAG_ENTRY)
+
+    @is_entry.setter
+    def is_entry(self, value: bool) -> None:
+        self.__grid.set_flag(self.__index, FLAG_ENTRY, value)
+
+    @property
+    def is_exit(self) -> bool:
+        return bool(self.__grid.flags[self.__index] & FLAG_EXIT)
+
+    @is_exit.setter
+    def is_exit(self, value: bool) -> None:
+        self.__grid.set_flag(self.__index, FLAG_EXIT, value)
+
+    def __str__(self) -> str:
+        wall = self.wall
+        return (
+            f"Cell: {wall:2}  {wall:04b}  {wall:X}"
+            f" is visited: {self.visited} "
+            f"position in maze: {self.x}, {self.y}"
+        )
+
+    def view_cell(self) -> str:
+        """Return hexadecimal representation of the cell's wall state."""
+        return f"{self.wall:X}"
@@ -6,24 +6,31 @@ initialization and text-based visualization.
 """
 
 from typing import Optional, Tuple
-from mazegen.cell.cell import Cell
+from mazegen.maze.grid import MazeGrid, FLAG_ENTRY, FLAG_EXIT
+from mazegen.maze.events import EventSink, Phase
 
 
 class Maze:
     """A maze grid consisting of cells with walls.
 
     This class represents the entire maze structure, managing:
-    - A 2D grid of Cell objects
+    - A flat MazeGrid holding walls and per-cell flags
     - Maze dimensions (width and height)
     - Entry and exit point coordinates
     - Text-based visualization with colored entry/exit points
 
     Attributes:
-        maze_grid: 2D list of Cell objects representing the maze
+        grid: MazeGrid storing walls and flags in flat buffers
+        maze_grid: Row/cell view of the grid (Cell-compatible accessors)
         __width: Width (number of columns) of the maze
         __height: Height (number of rows) of the maze
         entry: Tuple (x, y) for the entry point
         exit: Tuple (x, y) for the exit point
+        __loop_density: Fraction of dead ends turned into loops, or None
+        __braid: Percentage of dead ends removed after carving
+        __seed_compat: Add loops with the original pass, like earlier
+            releases
+        events: Sink receiving the generation events, or None
     """
 
     def __init__(
@@ -33,6 +40,9 @@ class Maze:
         entry: Tuple[int, int],
         exit: Tuple[int, int],
         perfect: bool,
+        loop_density: Optional[float] = None,
+        braid: float = 0.0,
+        seed_compat: bool = False,
     ):
         """Initialize a maze with given dimensions and entry/exit points.
 
@@ -41,18 +51,38 @@ class Maze:
             height: Height of the maze (number of rows)
             entry: Tuple (x, y) specifying the entry point coordinates
             exit: Tuple (x, y) specifying the exit point coordinates
+            perfect: False to add loops once the maze is carved
+            loop_density: Fraction of dead ends turned into loops when the
+                maze is not perfect, or None for the default amount
+            braid: Percentage of dead ends removed once the maze is
+                carved, 0 to keep them all
+            seed_compat: Add loops with the original pass, so seeds give
+                the loops of earlier releases
         """
-        self.maze_grid: list[list[Cell]] = []
+        self.grid: MazeGrid = MazeGrid(width, height)
         self.__width: int = width
         self.__height: int = height
         self.entry: Tuple[int, int] = entry
         self.exit: Tuple[int, int] = exit
         self.__perfect = perfect
+        self.__loop_density = loop_density
+        self.__braid = braid
+        self.__seed_compat = seed_compat
         self.__active_cell: Optional[Tuple[int, int, int]] = None
         self.__gen_step: int = 0
         self.shortest_path: str = ""
+        self.events: Optional[EventSink] = None
         self.__restart: bool = False  # Logique à déplacer dans controler
 
+    @property
+    def maze_grid(self) -> MazeGrid:
+        """Get the grid as rows of Cell-compatible accessors.
+
+        Returns:
+            MazeGrid: Indexable as ``maze_grid[y][x]`` like a 2D list
+        """
+        return self.grid
+
     @property
     def restart(self) -> bool:
         return self.__restart
@@ -97,6 +127,34 @@ class Maze:
         """
         self.__perfect = value
 
+    @property
+    def loop_density(self) -> Optional[float]:
+        """Get the loop density used when the maze is not perfect.
+
+        Returns:
+            Fraction of dead ends turned into loops, or None for the
+            default amount
+        """
+        return self.__loop_density
+
+    @property
+    def braid(self) -> float:
+        """Get the braid percentage.
+
+        Returns:
+            Percentage of dead ends removed once the maze is carved
+        """
+        return self.__braid
+
+    @property
+    def seed_compat(self) -> bool:
+        """Get whether loops are added like earlier releases.
+
+        Returns:
+            True to add loops with the original pass
+        """
+        return self.__seed_compat
+
     @property
     def active_cell(self) -> Optional[Tuple[int, int, int]]:
         """Get the currently active cell coordinates.
@@ -130,29 +188,28 @@ class Maze:
     def gen_step(self, value: int) -> None:
         """Mark generation as complete or incomplete.
 
+        Reports a Phase event when an event sink is attached.
+
         Args:
             value: Whether generation is complete
         """
         self.__done_gen = value
+        if self.events is not None:
+            self.events(Phase(value))
 
     def init_grid(self) -> None:
-        """Initialize the maze grid with Cell objects.
+        """Reset the maze grid to its initial state.
 
-        Creates a 2D grid of Cell objects with dimensions matching
-        the maze width and height. Each cell is initialized with its
-        coordinates and all walls intact.
+        Closes every wall, clears visited and locked flags and marks the
+        entry and exit cells. The underlying buffers are reused, so
+        regenerating a maze does not reallocate them.
         """
-        self.maze_grid = [
-            [Cell(x, y) for x in range(self.__width)]
-            for y in range(self.__height)
-        ]
-        for row in self.maze_grid:
-            for cell in row:
-                coord_cell = (cell.x, cell.y)
-                if coord_cell == self.entry:
-                    cell.is_entry = True
-                elif coord_cell == self.exit:
-                    cell.is_exit = True
+        self.grid.reset()
+        ex, ey = self.entry
+        self.grid.set_flag(self.grid.index(ex, ey), FLAG_ENTRY, True)
+        if self.exit != self.entry:
+            xx, xy = self.exit
+            self.grid.set_flag(self.grid.index(xx, xy), FLAG_EXIT, True)
 
     def __str__(self) -> str:
         """Return a text-based visualization of the maze.
@@ -165,14 +222,9 @@ class Maze:
                  separated by spaces and rows separated by newlines
         """
 
-        result = []
-        for y, row in enumerate(self.maze_grid):
-            row_str = []
-            for x, cell in enumerate(row):
-                cell_view = cell.view_cell()
-                row_str.append(cell_view)
-            result.append("".join(row_str))
-        return "\n".join(result)
+        return "\n".join(
+            self.grid.hex_row(y) for y in range(self.__height)
+        )
 
     def __len__(self) -> int:
         return self.__width * self.__height
@@ -5,7 +5,8 @@ This module defines the Pydantic configuration model that validates
 maze generation parameters from the config.txt file.
 
 The model ensures:
-- Valid maze dimensions (width and height)
+- Valid maze dimensions (width and height), with a large-maze mode
+  guarded by a peak memory budget
 - Valid entry and exit coordinates within bounds
 - Entry and exit are different points
 - Output file name is valid
@@ -15,9 +16,18 @@ Classes:
     ConfigModel: Pydantic BaseSettings model for maze configuration
 """
 
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, model_validator, field_validator
 from typing import Optional, Tuple
+from mazegen.utils.active_set import POLICIES
+from mazegen.utils.rng import ENGINES
+from mazegen.utils.memory import (
+    estimate_peak_memory, estimate_stream_memory, format_bytes
+)
+
+
+MAX_SIZE = 200
 
 
 class ConfigModel(BaseSettings):
@@ -28,29 +38,88 @@ class ConfigModel(BaseSettings):
     coordinates are consistent.
 
     Attributes:
-        WIDTH: Width of the maze (2-200)
-        HEIGHT: Height of the maze (2-200)
+        WIDTH: Width of the maze (2-200, unbounded with LARGE_MAZE)
+        HEIGHT: Height of the maze (2-200, unbounded with LARGE_MAZE)
         ENTRY: Entry point coordinates (x, y)
         EXIT: Exit point coordinates (x, y)
         OUTPUT_FILE: Path to output file for generated maze (4-15 chars)
         PERFECT: Whether to generate a perfect maze (no loops, default: True)
-        ALGORITHM: Maze generation algorithm name ("backtracking" or "prim")
+        LOOP_DENSITY: Fraction of dead ends turned into loops when PERFECT
+                      is false (0 to 1, default: about
+                      sqrt(WIDTH * HEIGHT) loops)
+        BRAID: Percentage of dead ends removed after carving; needs
+               PERFECT false (0 to 100, default: 0)
+        ALGORITHM: Maze generation algorithm name ("backtracking", "prim",
+                   "kruskal", "wilson", "eller", "binary_tree",
+                   "sidewinder", "growing_tree", "hunt_and_kill" or
+                   "recursive_division")
         SEED: Random seed for reproducible generation (optional, max 100 chars)
+        RNG_ENGINE: Random number engine ("mt" or "pcg", default: "mt");
+                    a seed gives different mazes on each engine
         MODE_GEN: Generation mode ("static" or "animated", default: "static")
         DISPLAY_MODE: Display mode ("basic", "tty", or "mlx", default: "basic")
         STAMP_TYPE: Stamp design type ("42vanilla" or "42custom",
                     default: "42vanilla")
+        LARGE_MAZE: Lift the 200x200 limit and use memory-lean
+                    internals (default: False)
+        MEMORY_BUDGET_MB: Peak memory budget checked in large-maze mode
+                          (default: 2048)
+        SEED_COMPAT: Use the original Prim frontier and loop pass so
+                     seeds reproduce mazes from earlier releases, perfect
+                     or not; LOOP_DENSITY and BRAID have no earlier
+                     equivalent (default: False)
+        GROWING_TREE_POLICY: Cell selection policy of growing_tree
+                             ("newest", "random", "oldest" or "mix",
+                             default: "newest")
+        GROWING_TREE_RATIO: Probability of selecting the newest cell with
+                            the "mix" policy (0 to 1, default: 0.5)
+        STREAM_OUTPUT: Write Eller rows straight to OUTPUT_FILE without
+                       keeping the grid; needs LARGE_MAZE, ALGORITHM=eller
+                       and PERFECT (default: False)
+        TILE_SIZE: Carve the maze in tiles of this side across worker
+                   processes; needs LARGE_MAZE (optional, at least 16)
+        WORKERS: Worker processes of tiled generation (optional, default:
+                 number of CPUs); the maze does not depend on it
+        CACHE_MB: Memory cap of the maze cache in MB, 0 to disable it;
+                  not used by large-maze and batch runs, which generate
+                  each maze once (default: 64)
+        CACHE_DIR: Directory of the on-disk maze cache (optional)
+        CACHE_DISK_MB: Disk cap of the maze cache in MB (default: 1024)
+        RECORD_FILE: Record each generation shown by the terminal
+                     interface to this replay file (optional)
+        REPLAY_FILE: Play this replay file instead of generating
+                     (optional)
+        KEYFRAME_INTERVAL: Frames between two grid snapshots of the
+                           generation timeline, and frames moved by one
+                           seek (default: 256)
+        KEYFRAME_MB: Memory cap of the timeline snapshots in MB
+                     (default: 32)
+        ANIMATION_RATE: Animate at this many algorithm steps per second,
+                        rendering as often as the display allows
+                        (optional)
+        ANIMATION_DURATION: Animate the whole generation in about this
+                            many seconds (optional)
+        STEPS_PER_YIELD: Steps carved between two animated states by the
+                         backtracking, prim and loop stages (default: 1)
     """
     model_config = SettingsConfigDict(env_file="config.txt")
 
-    WIDTH: int = Field(..., ge=2, le=200, description="Width of the maze")
-    HEIGHT: int = Field(..., ge=2, le=200, description="Height of the maze")
+    WIDTH: int = Field(..., ge=2, description="Width of the maze")
+    HEIGHT: int = Field(..., ge=2, description="Height of the maze")
     ENTRY: Tuple[int, int] = Field(..., description="Entry coordinates (x, y)")
     EXIT: Tuple[int, int] = Field(..., description="Exit coordinates (x, y)")
     OUTPUT_FILE: str = Field(
         ..., min_length=4, max_length=15, description="Output file name"
     )
     PERFECT: bool = Field(default=True, description="Generate a perfect maze")
+    LOOP_DENSITY: Optional[float] = Field(
+        default=None, ge=0.0, le=1.0,
+        description="Fraction of dead ends turned into loops"
+    )
+    BRAID: float = Field(
+        default=0.0, ge=0.0, le=100.0,
+        description="Percentage of dead ends removed after carving"
+    )
     ALGORITHM: str = Field(
         default="backtracking", description="Maze generation algorithm to use"
     )
@@ -60,6 +129,9 @@ class ConfigModel(BaseSettings):
         max_length=100,
         description="Seed generation",
     )
+    RNG_ENGINE: str = Field(
+        default="mt", description="Random number engine (mt, pcg)"
+    )
     MODE_GEN: str = Field(
         default="static",
         description="Generation mode: " "'static' or 'animated'",
@@ -71,9 +143,73 @@ class ConfigModel(BaseSettings):
         default="42vanilla",
         description="Stamp design type (42vanilla, 42custom)"
     )
+    LARGE_MAZE: bool = Field(
+        default=False, description="Allow mazes above 200x200"
+    )
+    MEMORY_BUDGET_MB: int = Field(
+        default=2048, ge=1,
+        description="Peak memory budget in MB for large-maze mode"
+    )
+    SEED_COMPAT: bool = Field(
+        default=False,
+        description="Reproduce mazes of earlier releases for a given seed"
+    )
+    GROWING_TREE_POLICY: str = Field(
+        default="newest",
+        description="Growing tree selection policy "
+                    "(newest, random, oldest, mix)"
+    )
+    GROWING_TREE_RATIO: float = Field(
+        default=0.5, ge=0.0, le=1.0,
+        description="Newest-cell probability of the mix policy"
+    )
+    STREAM_OUTPUT: bool = Field(
+        default=False,
+        description="Stream Eller rows to the output file in O(width) memory"
+    )
+    TILE_SIZE: Optional[int] = Field(
+        default=None, ge=16,
+        description="Tile side of tiled parallel generation"
+    )
+    WORKERS: Optional[int] = Field(
+        default=None, ge=1,
+        description="Worker processes of tiled generation"
+    )
+    CACHE_MB: int = Field(
+        default=64, ge=0, description="Memory cap of the maze cache in MB"
+    )
+    CACHE_DIR: Optional[str] = Field(
+        default=None, description="Directory of the on-disk maze cache"
+    )
+    CACHE_DISK_MB: int = Field(
+        default=1024, ge=1, description="Disk cap of the maze cache in MB"
+    )
+    RECORD_FILE: Optional[str] = Field(
+        default=None, description="Replay file recording each generation"
+    )
+    REPLAY_FILE: Optional[str] = Field(
+        default=None, description="Replay file played instead of generating"
+    )
+    KEYFRAME_INTERVAL: int = Field(
+        default=256, ge=1,
+        description="Frames between two snapshots of the generation timeline"
+    )
+    KEYFRAME_MB: int = Field(
+        default=32, ge=1, description="Memory cap of the timeline snapshots"
+    )
+    ANIMATION_RATE: Optional[int] = Field(
+        default=None, ge=1, description="Algorithm steps per second"
+    )
+    ANIMATION_DURATION: Optional[float] = Field(
+        default=None, gt=0, description="Duration of the animation in seconds"
+    )
+    STEPS_PER_YIELD: int = Field(
+        default=1, ge=1, description="Steps between two animated states"
+    )
 
-    @field_validator("ALGORITHM", "MODE_GEN",
-                     "DISPLAY_MODE", "STAMP_TYPE", mode="before")
+    @field_validator("ALGORITHM", "MODE_GEN", "DISPLAY_MODE",
+                     "STAMP_TYPE", "GROWING_TREE_POLICY", "RNG_ENGINE",
+                     mode="before")
     @classmethod
     def lowercase_fields(cls, v: str) -> str:
         """Convert string fields to lowercase."""
@@ -81,6 +217,116 @@ class ConfigModel(BaseSettings):
             return v.lower()
         return v
 
+    @field_validator("GROWING_TREE_POLICY")
+    @classmethod
+    def validate_growing_tree_policy(cls, v: str) -> str:
+        """Check the growing tree policy name."""
+        if v not in POLICIES:
+            raise ValueError(
+                f"GROWING_TREE_POLICY must be one of {', '.join(POLICIES)}"
+            )
+        return v
+
+    @field_validator("RNG_ENGINE")
+    @classmethod
+    def validate_rng_engine(cls, v: str) -> str:
+        """Check the random number engine name."""
+        if v not in ENGINES:
+            raise ValueError(
+                f"RNG_ENGINE must be one of {', '.join(ENGINES)}"
+            )
+        return v
+
+    @model_validator(mode="after")
+    def validate_maze_size(self) -> "ConfigModel":
+        """Validate the maze dimensions against the selected mode.
+
+        Without LARGE_MAZE, width and height are capped at MAX_SIZE.
+        With LARGE_MAZE, any size is accepted as long as the generation is
+        static and its estimated peak memory fits in MEMORY_BUDGET_MB.
+        STREAM_OUTPUT additionally needs the eller algorithm and a perfect
+        maze, and its estimate only depends on the width. TILE_SIZE also
+        needs LARGE_MAZE and cannot be combined with STREAM_OUTPUT. BRAID
+        adds loops, so it cannot be combined with a perfect maze.
+
+        Returns:
+            ConfigModel: The validated configuration model
+
+        Raises:
+            ValueError: If the size is not allowed in the selected mode
+        """
+        if self.BRAID and self.PERFECT:
+            raise ValueError("BRAID requires PERFECT=false")
+        if not self.LARGE_MAZE:
+            if self.STREAM_OUTPUT:
+                raise ValueError("STREAM_OUTPUT requires LARGE_MAZE=true")
+            if self.TILE_SIZE is not None:
+                raise ValueError("TILE_SIZE requires LARGE_MAZE=true")
+            if self.WIDTH > MAX_SIZE or self.HEIGHT > MAX_SIZE:
+                raise ValueError(
+                    f"Width and height must be at most {MAX_SIZE} "
+                    "(set LARGE_MAZE=true for bigger mazes)"
+                )
+            return self
+
+        if self.MODE_GEN != "static":
+            raise ValueError("LARGE_MAZE requires MODE_GEN=static")
+        if self.STREAM_OUTPUT:
+            if self.TILE_SIZE is not None:
+                raise ValueError(
+                    "TILE_SIZE cannot be combined with STREAM_OUTPUT"
+                )
+            if self.ALGORITHM != "eller" or not self.PERFECT:
+                raise ValueError(
+                    "STREAM_OUTPUT requires ALGORITHM=eller and PERFECT=true"
+                )
+            estimate = estimate_stream_memory(self.WIDTH)
+        else:
+            estimate = estimate_peak_memory(
+                self.WIDTH, self.HEIGHT, self.ALGORITHM, self.PERFECT,
+                self.BRAID > 0, self.TILE_SIZE,
+                self.WORKERS or os.cpu_count() or 1,
+                self.CACHE_DIR is not None)
+        budget = self.MEMORY_BUDGET_MB * 1024 * 1024
+        if estimate > budget:
+            raise ValueError(
+                f"Estimated peak memory {format_bytes(estimate)} exceeds "
+                f"MEMORY_BUDGET_MB={self.MEMORY_BUDGET_MB}"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_replay(self) -> "ConfigModel":
+        """Check that a run is not recorded and replayed at once.
+
+        Returns:
+            ConfigModel: The validated configuration model
+
+        Raises:
+            ValueError: If both RECORD_FILE and REPLAY_FILE are set
+        """
+        if self.RECORD_FILE is not None and self.REPLAY_FILE is not None:
+            raise ValueError(
+                "RECORD_FILE cannot be combined with REPLAY_FILE")
+        return self
+
+    @model_validator(mode="after")
+    def validate_pacing(self) -> "ConfigModel":
+        """Check that the animation is paced by one setting only.
+
+        Returns:
+            ConfigModel: The validated configuration model
+
+        Raises:
+            ValueError: If both ANIMATION_RATE and ANIMATION_DURATION are
+                set
+        """
+        if (self.ANIMATION_RATE is not None
+                and self.ANIMATION_DURATION is not None):
+            raise ValueError(
+                "ANIMATION_RATE cannot be combined with ANIMATION_DURATION")
+        return self
+
     @model_validator(mode="after")
     def validate_entry_exit(self) -> "ConfigModel":
         """
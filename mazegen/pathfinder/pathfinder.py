@@ -1,6 +1,15 @@
 from collections import deque
-from typing import Deque, Dict, Optional, Tuple
+from typing import Deque
 from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED
+
+
+_START = 5
+_NORTH = 1
+_EAST = 2
+_SOUTH = 3
+_WEST = 4
+_LETTERS = {_NORTH: "N", _EAST: "E", _SOUTH: "S", _WEST: "W"}
 
 
 class PathFinder:
@@ -14,8 +23,9 @@ class PathFinder:
     def solve_shortest_path(self, maze: Maze) -> None:
         """Find and store the shortest path from entry to exit.
 
-        Runs BFS from maze.entry to maze.exit, reconstructing the path
-        by backtracking through visited nodes. The result is stored as
+        Runs BFS from maze.entry to maze.exit over the flat wall buffer,
+        recording for each reached cell the move that reached it, then
+        walks those moves back from the exit. The result is stored as
         a string of directions (N/E/S/W) in maze.shortest_path.
         Locked cells (stamp pattern) are treated as impassable.
 
@@ -25,58 +35,52 @@ class PathFinder:
         Returns:
             None. Result is written directly to maze.shortest_path.
         """
-        start = maze.entry
-        goal = maze.exit
+        grid = maze.grid
+        width = grid.width
+        size = width * grid.height
+        walls = grid.walls
+        flags = grid.flags
+        sx, sy = maze.entry
+        gx, gy = maze.exit
+        start = sy * width + sx
+        goal = gy * width + gx
 
-        prev: Dict[Tuple[int, int], Tuple[Tuple[int, int], str]] = {}
-        q: Deque[Tuple[int, int]] = deque()
+        # came_from[i] is the move that first reached cell i, 0 if unseen
+        came_from = bytearray(size)
+        came_from[start] = _START
+        back = {_NORTH: width, _EAST: -1, _SOUTH: -width, _WEST: 1}
+        q: Deque[int] = deque()
         q.append(start)
-        visited = set([start])
-
-        def can_go(x: int, y: int, nx: int, ny: int) -> Optional[str]:
-            if not (0 <= nx < maze.width and 0 <= ny < maze.height):
-                return None
-            if maze.maze_grid[ny][nx].locked:
-                return None
-
-            cell = maze.maze_grid[y][x]
-            code = int(f"{cell.view_cell()}", 16)
-            dx = nx - x
-            dy = ny - y
 
-            if dx == 0 and dy == -1:
-                return None if code & 1 else "N"
-            if dx == 1 and dy == 0:
-                return None if code & 2 else "E"
-            if dx == 0 and dy == 1:
-                return None if code & 4 else "S"
-            if dx == -1 and dy == 0:
-                return None if code & 8 else "W"
-            return None
+        def visit(target: int, move: int) -> None:
+            if not came_from[target] and not flags[target] & FLAG_LOCKED:
+                came_from[target] = move
+                q.append(target)
 
         while q:
-            x, y = q.popleft()
-            if (x, y) == goal:
+            index = q.popleft()
+            if index == goal:
                 break
-            for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
-                if (nx, ny) in visited:
-                    continue
-                step = can_go(x, y, nx, ny)
-                if step is None:
-                    continue
-                visited.add((nx, ny))
-                prev[(nx, ny)] = ((x, y), step)
-                q.append((nx, ny))
+            code = walls[index]
+            x = index % width
+            if index >= width and not code & 1:
+                visit(index - width, _NORTH)
+            if x + 1 < width and not code & 2:
+                visit(index + 1, _EAST)
+            if index + width < size and not code & 4:
+                visit(index + width, _SOUTH)
+            if x > 0 and not code & 8:
+                visit(index - 1, _WEST)
 
-        if goal not in visited:
+        if not came_from[goal]:
             return
 
         moves = []
         cur = goal
         while cur != start:
-            p, move = prev[cur]
-            moves.append(move)
-            cur = p
+            move = came_from[cur]
+            moves.append(_LETTERS[move])
+            cur += back[move]
 
         moves.reverse()
         maze.shortest_path = "".join(moves)
@@ -8,9 +8,10 @@ Classes:
     Stamp: Manages logo placement and embedding in mazes using StampDesign
 """
 
-from typing import Iterable, Tuple, List
+from typing import Iterable, Tuple, List, Optional
 from mazegen.maze.maze import Maze
 from mazegen.stamp.stamp_factory import StampFactory
+from mazegen.utils.rng import ensure_rng
 import random
 
 
@@ -25,20 +26,27 @@ class Stamp:
     Attributes:
         __maze: The Maze object to stamp
         __design: The StampDesign instance to use for logos
+        __search_window: Side of the centred square searched for a
+            placement, or None to search the whole maze
     """
 
-    def __init__(self, maze: Maze, logo_type: str) -> None:
+    def __init__(self, maze: Maze, logo_type: str,
+                 search_window: Optional[int] = None) -> None:
         """Initialize the Stamp with a maze and logo type.
 
         Args:
             maze: The Maze object to stamp
             logo_type: Logo type identifier (e.g., "42", "vanilla", "custom")
+            search_window: Restrict the placement search to a centred
+                square of this side. Used for large mazes, where scanning
+                every cell would cost memory and time for no better spot.
 
         Raises:
             ValueError: If logo_type is not registered with StampFactory
         """
         self.__maze = maze
         self.__design = StampFactory.create(logo_type)
+        self.__search_window = search_window
 
     def add_stamp_block(
         self,
@@ -72,22 +80,37 @@ class Stamp:
                     self.__maze.maze_grid[gy][gx].lock_code = ch
                 gx += 1
 
-    def stamp_bsq(self) -> Tuple[int, int, int]:
+    def stamp_bsq(
+        self, rng: Optional[random.Random] = None
+    ) -> Tuple[int, int, int]:
         """Find the largest square available for stamp placement.
 
         Uses dynamic programming to find the largest square region in the maze
         where a logo can be placed without overlapping entry/exit points or
-        existing locked cells.
+        existing locked cells. When a search window is set, only the centred
+        window is scanned.
+
+        Args:
+            rng: Random number generator picking among equal squares;
+                None derives one from the module-level random state
 
         Returns:
             Tuple[int, int, int]: (x, y, size) coordinates and size of the
                                  largest available square, or (0, 0, 0) if
                                  no suitable space found.
         """
+        x0, y0 = 0, 0
         xdim = self.__maze.width
         ydim = self.__maze.height
+        if self.__search_window is not None:
+            side = self.__search_window
+            x0 = max(0, (xdim - side) // 2)
+            y0 = max(0, (ydim - side) // 2)
+            xdim = min(xdim, side)
+            ydim = min(ydim, side)
         xin, yin = self.__maze.entry
         xout, yout = self.__maze.exit
+        xin, yin, xout, yout = xin - x0, yin - y0, xout - x0, yout - y0
         win = 0
         best: List[Tuple[int, int, int]] = []
         matrix: List[List[int]] = [[0] * xdim for _ in range(ydim)]
@@ -102,29 +125,36 @@ class Stamp:
                     ul_cell = matrix[y - 1][x - 1] if (x > 0 and y > 0) else 0
                     matrix[y][x] = min(l_cell, u_cell, ul_cell) + 1
                     value = matrix[y][x]
+                    sx, sy = x0 + x, y0 + y
                     if value > win and win < 18:
                         win = value
-                        best = [(x - (win - 1), y - (win - 1), win)]
+                        best = [(sx - (win - 1), sy - (win - 1), win)]
                     elif value == win and win > 0:
-                        best.append((x - (win - 1), y - (win - 1), win))
+                        best.append((sx - (win - 1), sy - (win - 1), win))
                     elif value >= 18:
-                        best.append((x - (value - 1), y - (value - 1), value))
+                        best.append((sx - (value - 1), sy - (value - 1),
+                                     value))
 
         if win == 0:
             return 0, 0, 0
 
-        idx = random.randrange(len(best))
+        idx = ensure_rng(rng).randrange(len(best))
         return best[idx]
 
-    def add_stamp(self) -> None:
+    def add_stamp(self, rng: Optional[random.Random] = None) -> None:
         """Embed a logo into the maze at the optimal location.
 
         Finds the largest available square in the maze, uses the StampDesign
         to select an appropriate logo size based on available space, and
         randomly positions the logo within that space while keeping it away
         from entry/exit points.
+
+        Args:
+            rng: Random number generator for the placement; None derives
+                one from the module-level random state
         """
-        x, y, bsq_size = self.stamp_bsq()
+        rng = ensure_rng(rng)
+        x, y, bsq_size = self.stamp_bsq(rng)
         if bsq_size == 0:
             return
 
@@ -136,8 +166,8 @@ class Stamp:
         logo_size = len(logo)
         diff_size = bsq_size - logo_size + 1
         if diff_size > 0:
-            x_var = random.randrange(diff_size)
-            y_var = random.randrange(diff_size)
+            x_var = rng.randrange(diff_size)
+            y_var = rng.randrange(diff_size)
         else:
             x_var = 0
             y_var = 0
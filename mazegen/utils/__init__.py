@@ -1,10 +1,12 @@
 """Utility enumerations for maze representation.
 
 Provides Wall and Direction enums for bitwise wall representation
-and directional operations.
+and directional operations, and the peak memory estimate used by the
+large-maze mode.
 """
 
 from mazegen.utils.utils import Wall, Direction
+from mazegen.utils.memory import estimate_peak_memory, format_bytes
 
 
-__all__ = ["Wall", "Direction"]
+__all__ = ["Wall", "Direction", "estimate_peak_memory", "format_bytes"]
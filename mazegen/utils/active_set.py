@@ -0,0 +1,74 @@
+"""Array-backed active cell set for the Growing Tree algorithm.
+
+This module provides the ActiveSet used to hold the cells that can still
+grow the maze. Members live in one preallocated ``array('i')`` between a
+head and a tail index, so the newest member, the oldest member and a
+member at any offset are read and removed in O(1).
+
+Constants:
+    POLICIES: Names of the Growing Tree selection policies
+
+Classes:
+    ActiveSet: Active cells with O(1) access at both ends and at random
+"""
+
+from array import array
+
+
+# Selection policies of the Growing Tree algorithm
+POLICIES = ("newest", "random", "oldest", "mix")
+
+
+class ActiveSet:
+    """Cells between a head and a tail index of a flat array.
+
+    New members are appended at the tail, so the newest member is last
+    and the oldest one first. Removing the newest or the oldest member
+    moves the tail or the head. Removing any other member fills its slot
+    with the oldest member and moves the head, which keeps the newest end
+    in order. Every cell is pushed at most once during a generation, so
+    the capacity is the number of cells and the array never grows.
+
+    Attributes:
+        __items: Preallocated storage of the members
+        __head: Offset of the oldest member
+        __tail: Offset one past the newest member
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Create an empty set able to receive ``capacity`` pushes.
+
+        Args:
+            capacity: Maximum number of pushes
+        """
+        self.__items: array[int] = array("i", bytes(4 * capacity))
+        self.__head = 0
+        self.__tail = 0
+
+    def push(self, value: int) -> None:
+        """Append a value as the newest member."""
+        self.__items[self.__tail] = value
+        self.__tail += 1
+
+    def at(self, offset: int) -> int:
+        """Return the member at an offset, 0 being the oldest."""
+        return self.__items[self.__head + offset]
+
+    def remove(self, offset: int) -> None:
+        """Remove the member at an offset, 0 being the oldest.
+
+        Args:
+            offset: Position in [0, len(self))
+        """
+        if offset == self.__tail - self.__head - 1:
+            self.__tail -= 1
+            return
+        head = self.__head
+        self.__items[head + offset] = self.__items[head]
+        self.__head = head + 1
+
+    def __len__(self) -> int:
+        return self.__tail - self.__head
+
+    def __bool__(self) -> bool:
+        return self.__tail > self.__head
@@ -0,0 +1,374 @@
+"""Content-addressed cache of generated mazes.
+
+A maze is fully determined by its configuration, its seed and the code of
+the algorithms that carve it, including which of their engines ran, so a
+finished maze can be stored under a hash of those and reused instead of
+being carved again. The cache has two levels: an in-memory LRU bounded in
+bytes, and an optional directory on disk bounded in bytes too, shared
+between processes and runs.
+
+Only the wall codes and the shortest path are stored. The stamp is placed
+again on a hit, which is cheap and also restores the locked flags, lock
+codes and visited marks.
+
+On disk, entries live in ``<directory>/<algorithm>-v<version>/`` as zlib
+compressed files. The first access to an algorithm removes the folders of
+its other versions, so entries of older algorithm code are dropped as
+soon as the version is bumped.
+
+Constants:
+    CACHE_VERSION: Version of the entry format and of the shared pipeline
+        (stamp placement, loop and braid stages, tiling)
+    KEY_FIELDS: Configuration fields that change the generated maze
+
+Classes:
+    CachedMaze: Stored result of one generation
+    MazeCache: Two-level LRU cache of generated mazes
+
+Functions:
+    cache_key: Hash a configuration into a cache key
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import zlib
+from collections import OrderedDict
+from typing import (
+    Any, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+)
+
+
+CACHE_VERSION = 1
+
+KEY_FIELDS = (
+    "WIDTH", "HEIGHT", "ENTRY", "EXIT", "PERFECT", "LOOP_DENSITY", "BRAID",
+    "ALGORITHM", "SEED", "RNG_ENGINE", "STAMP_TYPE", "LARGE_MAZE",
+    "SEED_COMPAT", "GROWING_TREE_POLICY", "GROWING_TREE_RATIO", "TILE_SIZE",
+)
+
+# Magic, wall byte count and path length of a disk entry
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"MZC1"
+_SUFFIX = ".maze"
+
+
+class CachedMaze(NamedTuple):
+    """Stored result of one generation.
+
+    Attributes:
+        walls: Wall codes of the maze, in row-major order
+        shortest_path: Shortest path letters from entry to exit
+    """
+
+    walls: bytes
+    shortest_path: str
+
+
+def cache_key(fields: Mapping[str, Any], versions: Mapping[str, int]) -> str:
+    """Hash a configuration into a cache key.
+
+    The fields are normalized through JSON with sorted keys, so tuples
+    and lists or the order of the mapping do not change the key.
+
+    Args:
+        fields: Value of each of KEY_FIELDS, and the engine of the
+            algorithm under ENGINE
+        versions: Version of each algorithm and stage taking part
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    payload = json.dumps(
+        {"cache": CACHE_VERSION, "fields": dict(fields),
+         "versions": dict(versions)},
+        sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class MazeCache:
+    """Two-level LRU cache of generated mazes.
+
+    Lookups try memory first, then the disk directory when there is one;
+    a disk hit is promoted to memory. Stores go to both levels. Each level
+    evicts its least recently used entries once it exceeds its byte cap,
+    and an entry larger than a cap is simply not kept at that level.
+
+    Attributes:
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from disk
+        misses: Lookups answered by neither level
+        evictions: Entries evicted from either level
+        __memory_bytes: Byte cap of the memory level
+        __directory: Disk directory, or None
+        __disk_bytes: Byte cap of the disk level
+        __entries: Memory entries as key -> (algorithm, entry), oldest first
+        __size: Bytes held by the memory level
+        __disk_size: Bytes held on disk, None until first measured
+        __checked: Algorithms whose stale disk versions were removed
+    """
+
+    def __init__(self, memory_bytes: int = 64 << 20,
+                 directory: Optional[str] = None,
+                 disk_bytes: int = 1 << 30) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            memory_bytes: Byte cap of the memory level, 0 to disable it
+            directory: Disk directory, created on first store, or None to
+                keep entries in memory only
+            disk_bytes: Byte cap of the disk level
+
+        Raises:
+            ValueError: If a cap is negative
+        """
+        if memory_bytes < 0 or disk_bytes < 0:
+            raise ValueError("Cache size must not be negative")
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__memory_bytes = memory_bytes
+        self.__directory = directory
+        self.__disk_bytes = disk_bytes
+        self.__entries: "OrderedDict[str, Tuple[str, CachedMaze]]" = \
+            OrderedDict()
+        self.__size = 0
+        self.__disk_size: Optional[int] = None
+        self.__checked: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters and the memory usage of the cache.
+
+        Returns:
+            Dict[str, int]: hits, disk_hits, misses, evictions, entries
+            and bytes of the memory level
+        """
+        return {"hits": self.hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.__entries), "bytes": self.__size}
+
+    def get(self, algorithm: str, version: int,
+            key: str) -> Optional[CachedMaze]:
+        """Look a maze up.
+
+        Args:
+            algorithm: Name of the carving algorithm
+            version: Version of the carving algorithm
+            key: Cache key of the configuration
+
+        Returns:
+            Optional[CachedMaze]: The stored maze, or None on a miss
+        """
+        found = self.__entries.get(key)
+        if found is not None:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return found[1]
+        entry = self.__load(algorithm, version, key)
+        if entry is not None:
+            self.disk_hits += 1
+            self.__remember(algorithm, key, entry)
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, algorithm: str, version: int, key: str,
+            entry: CachedMaze) -> None:
+        """Store a maze at both levels.
+
+        Args:
+            algorithm: Name of the carving algorithm
+            version: Version of the carving algorithm
+            key: Cache key of the configuration
+            entry: Maze to store
+        """
+        self.__remember(algorithm, key, entry)
+        if self.__directory is not None:
+            self.__save(self.__directory, algorithm, version, key, entry)
+
+    def invalidate(self, algorithm: Optional[str] = None) -> None:
+        """Drop the entries of one algorithm, or every entry.
+
+        Args:
+            algorithm: Name of the algorithm, or None for all of them
+        """
+        for key, (owner, entry) in list(self.__entries.items()):
+            if algorithm is None or owner == algorithm:
+                del self.__entries[key]
+                self.__size -= _entry_size(entry)
+        if self.__directory is None or not os.path.isdir(self.__directory):
+            return
+        for name in os.listdir(self.__directory):
+            if algorithm is None or name.rpartition("-v")[0] == algorithm:
+                shutil.rmtree(os.path.join(self.__directory, name),
+                              ignore_errors=True)
+        self.__disk_size = None
+        self.__checked.clear()
+
+    def __remember(self, algorithm: str, key: str,
+                   entry: CachedMaze) -> None:
+        """Insert an entry in the memory level and evict as needed.
+
+        Args:
+            algorithm: Name of the carving algorithm
+            key: Cache key of the configuration
+            entry: Maze to keep
+        """
+        size = _entry_size(entry)
+        if size > self.__memory_bytes:
+            return
+        previous = self.__entries.pop(key, None)
+        if previous is not None:
+            self.__size -= _entry_size(previous[1])
+        self.__entries[key] = (algorithm, entry)
+        self.__size += size
+        while self.__size > self.__memory_bytes:
+            _, (_, oldest) = self.__entries.popitem(last=False)
+            self.__size -= _entry_size(oldest)
+            self.evictions += 1
+
+    def __folder(self, directory: str, algorithm: str, version: int) -> str:
+        """Return the disk folder of an algorithm version.
+
+        The first call for an algorithm removes the folders of its other
+        versions.
+
+        Args:
+            directory: Disk directory of the cache
+            algorithm: Name of the carving algorithm
+            version: Version of the carving algorithm
+
+        Returns:
+            str: Path of the folder, which may not exist yet
+        """
+        current = f"{algorithm}-v{version}"
+        if algorithm not in self.__checked:
+            self.__checked.add(algorithm)
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    if (name != current
+                            and name.rpartition("-v")[0] == algorithm):
+                        shutil.rmtree(os.path.join(directory, name),
+                                      ignore_errors=True)
+                        self.__disk_size = None
+        return os.path.join(directory, current)
+
+    def __load(self, algorithm: str, version: int,
+               key: str) -> Optional[CachedMaze]:
+        """Read an entry from disk.
+
+        Unreadable or damaged files count as misses.
+
+        Args:
+            algorithm: Name of the carving algorithm
+            version: Version of the carving algorithm
+            key: Cache key of the configuration
+
+        Returns:
+            Optional[CachedMaze]: The stored maze, or None
+        """
+        directory = self.__directory
+        if directory is None:
+            return None
+        path = os.path.join(self.__folder(directory, algorithm, version),
+                            key + _SUFFIX)
+        try:
+            with open(path, "rb") as file:
+                data = zlib.decompress(file.read())
+            magic, walls, letters = _HEADER.unpack_from(data)
+            if (magic != _MAGIC
+                    or len(data) != _HEADER.size + walls + letters):
+                return None
+            os.utime(path)
+        except (OSError, zlib.error, struct.error):
+            return None
+        start = _HEADER.size
+        return CachedMaze(data[start:start + walls],
+                          data[start + walls:].decode("ascii"))
+
+    def __save(self, directory: str, algorithm: str, version: int,
+               key: str, entry: CachedMaze) -> None:
+        """Write an entry to disk and evict the oldest files as needed.
+
+        Files are written under a temporary name and renamed, so readers
+        in other processes never see half a file. Write errors only skip
+        the disk level.
+
+        Args:
+            directory: Disk directory of the cache
+            algorithm: Name of the carving algorithm
+            version: Version of the carving algorithm
+            key: Cache key of the configuration
+            entry: Maze to store
+        """
+        folder = self.__folder(directory, algorithm, version)
+        path = os.path.join(folder, key + _SUFFIX)
+        data = zlib.compress(
+            _HEADER.pack(_MAGIC, len(entry.walls), len(entry.shortest_path))
+            + entry.walls + entry.shortest_path.encode("ascii"))
+        if len(data) > self.__disk_bytes:
+            return
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(folder, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            return
+
+        if self.__disk_size is None:
+            self.__disk_size = sum(
+                size for _, size, _ in _list_files(directory))
+        else:
+            self.__disk_size += len(data)
+        if self.__disk_size <= self.__disk_bytes:
+            return
+        for _, size, name in sorted(_list_files(directory)):
+            if self.__disk_size <= self.__disk_bytes:
+                break
+            try:
+                os.remove(name)
+            except OSError:
+                continue
+            self.__disk_size -= size
+            self.evictions += 1
+
+
+def _list_files(directory: str) -> List[Tuple[float, int, str]]:
+    """List the entry files of a cache directory.
+
+    Args:
+        directory: Disk directory of the cache
+
+    Returns:
+        List[Tuple[float, int, str]]: Modification time, size and path of
+        each file
+    """
+    files = []
+    for folder in os.scandir(directory):
+        if not folder.is_dir():
+            continue
+        for item in os.scandir(folder.path):
+            if item.name.endswith(_SUFFIX):
+                stat = item.stat()
+                files.append((stat.st_mtime, stat.st_size, item.path))
+    return files
+
+
+def _entry_size(entry: CachedMaze) -> int:
+    """Return the bytes an entry holds in memory.
+
+    Args:
+        entry: Cached maze
+
+    Returns:
+        int: Wall bytes plus path letters
+    """
+    return len(entry.walls) + len(entry.shortest_path)
@@ -0,0 +1,74 @@
+"""Flat-array disjoint-set (union-find) structure.
+
+This module provides the DisjointSet used to merge cell sets during
+generation. Parents are stored in one ``array('i')`` and ranks in a
+``bytearray``, so the structure costs five bytes per element and no
+Python object per set.
+
+Classes:
+    DisjointSet: Union-find with path halving and union by rank
+"""
+
+from array import array
+
+
+class DisjointSet:
+    """Union-find over the integers [0, size).
+
+    ``find`` uses path halving: every visited node is re-pointed to its
+    grandparent, which keeps trees shallow without recursion. ``union``
+    attaches the root of lower rank under the other one.
+
+    Attributes:
+        __parent: Parent of each element, roots point to themselves
+        __rank: Upper bound of the height of each root's tree
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create ``size`` singleton sets.
+
+        Args:
+            size: Number of elements
+        """
+        self.__parent: array[int] = array("i", range(size))
+        self.__rank: bytearray = bytearray(size)
+
+    def find(self, element: int) -> int:
+        """Return the representative of the set holding ``element``."""
+        parent = self.__parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, first: int, second: int) -> bool:
+        """Merge the sets holding two elements.
+
+        Args:
+            first: Element of the first set
+            second: Element of the second set
+
+        Returns:
+            bool: True if the sets were merged, False if the elements
+                  were already in the same set
+        """
+        parent = self.__parent
+        while parent[first] != first:
+            parent[first] = parent[parent[first]]
+            first = parent[first]
+        while parent[second] != second:
+            parent[second] = parent[parent[second]]
+            second = parent[second]
+        if first == second:
+            return False
+
+        rank = self.__rank
+        if rank[first] < rank[second]:
+            first, second = second, first
+        parent[second] = first
+        if rank[first] == rank[second]:
+            rank[first] += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self.__parent)
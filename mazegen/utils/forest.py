@@ -0,0 +1,195 @@
+"""Join the trees of a carved forest into one spanning tree.
+
+Locked stamp cells can split a maze into several trees: Binary Tree and
+Sidewinder leave some cells without any possible parent, Eller can strand
+a set, and Recursive Division loses the passages through locked cells.
+The functions below knock down random walls between different trees
+until no two adjacent free cells are apart.
+
+When the algorithm links every cell to a parent cell, the root of each
+cell is found by pointer jumping, with a NumPy engine and a pure-Python
+one (NumPy is optional). Otherwise the trees are found with a
+DisjointSet over the open walls.
+
+Functions:
+    join_trees: Join a forest given as a flat parent sequence
+    join_trees_numpy: Same, with the parent links in a NumPy array
+    join_components: Join the pieces of any carved grid
+"""
+
+import random
+from array import array
+from typing import Any, Sequence
+from mazegen.utils.disjoint_set import DisjointSet
+from mazegen.utils.kernel import CLEAR_HERE, CLEAR_THERE, EAST, SOUTH, WALL
+
+
+# Edge kinds: 0 is the east wall of a cell, 1 its south wall
+_DIRECTIONS = (EAST, SOUTH)
+
+
+def _join(walls: bytearray, width: int, edges: Sequence[int],
+          heads: Sequence[int], tails: Sequence[int], trees: int) -> None:
+    """Knock down walls along shuffled edges until the trees are joined.
+
+    Args:
+        walls: Flat wall buffer of the maze
+        width: Number of columns
+        edges: Shuffled edges between different trees, encoded as
+            ``index * 2`` for an east wall and ``index * 2 + 1`` for a
+            south wall
+        heads: Root of the tree holding the first cell of each edge
+        tails: Root of the tree holding the second cell of each edge
+        trees: Number of trees to join
+    """
+    offsets = (1, width)
+    clear_here = tuple(CLEAR_HERE[d] for d in _DIRECTIONS)
+    clear_there = tuple(CLEAR_THERE[d] for d in _DIRECTIONS)
+    union = DisjointSet(len(walls)).union
+
+    for edge, head, tail in zip(edges, heads, tails):
+        if trees <= 1:
+            break
+        if not union(head, tail):
+            continue
+        index = edge >> 1
+        kind = edge & 1
+        walls[index] &= clear_here[kind]
+        walls[index + offsets[kind]] &= clear_there[kind]
+        trees -= 1
+
+
+def join_trees(walls: bytearray, locked: bytearray, width: int,
+               parent: Sequence[int], rng: random.Random) -> None:
+    """Join a forest of carved trees into one tree.
+
+    Args:
+        walls: Flat wall buffer of the maze, updated in place
+        locked: Flat buffer, non-zero for locked cells
+        width: Number of columns
+        parent: Parent of each cell, roots and locked cells point to
+            themselves
+        rng: Random number generator used to shuffle the edges
+    """
+    # Without locked cells Binary Tree and Sidewinder carve a single tree
+    if not any(locked):
+        return
+    size = len(parent)
+    roots = list(parent)
+    while True:
+        jumped = [roots[link] for link in roots]
+        if jumped == roots:
+            break
+        roots = jumped
+
+    trees = sum(1 for index in range(size)
+                if roots[index] == index and not locked[index])
+    if trees <= 1:
+        return
+
+    edges: list[int] = []
+    for index in range(size):
+        if locked[index]:
+            continue
+        if ((index + 1) % width and not locked[index + 1]
+                and roots[index] != roots[index + 1]):
+            edges.append(index * 2)
+        if (index + width < size and not locked[index + width]
+                and roots[index] != roots[index + width]):
+            edges.append(index * 2 + 1)
+    rng.shuffle(edges)
+    offsets = (1, width)
+    heads = [roots[edge >> 1] for edge in edges]
+    tails = [roots[(edge >> 1) + offsets[edge & 1]] for edge in edges]
+    _join(walls, width, edges, heads, tails, trees)
+
+
+def join_trees_numpy(walls: bytearray, free: Any, width: int,
+                     parent: Any, rng: Any) -> None:
+    """Join a forest of carved trees into one tree with NumPy.
+
+    Args:
+        walls: Flat wall buffer of the maze, updated in place
+        free: Flat boolean ndarray, True for cells that are not locked
+        width: Number of columns
+        parent: Flat integer ndarray of parent links, roots and locked
+            cells point to themselves
+        rng: numpy.random.Generator used to shuffle the edges
+    """
+    import numpy as np
+
+    # Without locked cells Binary Tree and Sidewinder carve a single tree
+    if free.all():
+        return
+    size = parent.size
+    roots = parent
+    while True:
+        jumped = roots[roots]
+        if np.array_equal(jumped, roots):
+            break
+        roots = jumped
+
+    cells = np.arange(size)
+    trees = int(np.count_nonzero(free & (roots == cells)))
+    if trees <= 1:
+        return
+
+    east = np.zeros(size, dtype=bool)
+    east[:-1] = free[:-1] & free[1:] & (roots[:-1] != roots[1:])
+    east[width - 1::width] = False
+    south = np.zeros(size, dtype=bool)
+    south[:-width] = (free[:-width] & free[width:]
+                      & (roots[:-width] != roots[width:]))
+    edges = np.concatenate((np.flatnonzero(east) * 2,
+                            np.flatnonzero(south) * 2 + 1))
+    rng.shuffle(edges)
+    cells = edges >> 1
+    others = cells + np.where(edges & 1, width, 1)
+    _join(walls, width, edges.tolist(), roots[cells].tolist(),
+          roots[others].tolist(), trees)
+
+
+def join_components(walls: bytearray, locked: bytearray, width: int,
+                    rng: random.Random) -> None:
+    """Join the pieces of a carved grid into one.
+
+    Unites the cells along every open wall, then knocks down walls
+    between different pieces in random order until no two adjacent free
+    cells are apart, as Kruskal's algorithm would.
+
+    Args:
+        walls: Flat wall buffer of the maze, updated in place
+        locked: Flat buffer, non-zero for locked cells
+        width: Number of columns
+        rng: Random number generator used to shuffle the edges
+    """
+    size = len(walls)
+    offsets = (1, width)
+    clear_here = tuple(CLEAR_HERE[d] for d in _DIRECTIONS)
+    clear_there = tuple(CLEAR_THERE[d] for d in _DIRECTIONS)
+    sets = DisjointSet(size)
+    union = sets.union
+
+    edges = array("i")
+    for index in range(size):
+        if locked[index]:
+            continue
+        if (index + 1) % width and not locked[index + 1]:
+            if walls[index] & WALL[EAST]:
+                edges.append(index * 2)
+            else:
+                union(index, index + 1)
+        if index + width < size and not locked[index + width]:
+            if walls[index] & WALL[SOUTH]:
+                edges.append(index * 2 + 1)
+            else:
+                union(index, index + width)
+    rng.shuffle(edges)
+
+    for edge in edges:
+        index = edge >> 1
+        kind = edge & 1
+        other = index + offsets[kind]
+        if union(index, other):
+            walls[index] &= clear_here[kind]
+            walls[other] &= clear_there[kind]
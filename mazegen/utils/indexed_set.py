@@ -0,0 +1,78 @@
+"""Array-backed set of cell indices with O(1) random removal.
+
+This module provides the IndexedSet used by the generation algorithms to
+keep frontiers and pools of cells. Members are stored densely in one
+``array('i')`` and an index map gives the slot of each member, so adding,
+removing a given cell and removing the member at a slot are all O(1):
+the removed slot is filled with the last member (swap-with-last).
+
+Classes:
+    IndexedSet: Set of integers in [0, capacity) with O(1) operations
+"""
+
+from array import array
+
+
+class IndexedSet:
+    """Set of cell indices supporting O(1) add, remove and pop by slot.
+
+    Removing a member moves the last member into its slot, so the order
+    of members is not preserved. Callers draw a random slot with
+    ``randrange(len(s))`` and remove it with ``pop_at``.
+
+    Attributes:
+        __items: Dense array of members
+        __slots: Slot of each possible member, -1 when absent
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Create an empty set for values in [0, capacity).
+
+        Args:
+            capacity: Exclusive upper bound of the stored values
+        """
+        self.__items: array[int] = array("i")
+        self.__slots: array[int] = array("i", [-1]) * capacity
+
+    def add(self, value: int) -> None:
+        """Add a value, doing nothing if it is already present."""
+        if self.__slots[value] < 0:
+            self.__slots[value] = len(self.__items)
+            self.__items.append(value)
+
+    def remove(self, value: int) -> None:
+        """Remove a value, doing nothing if it is absent."""
+        slot = self.__slots[value]
+        if slot >= 0:
+            self.pop_at(slot)
+
+    def pop_at(self, slot: int) -> int:
+        """Remove and return the member stored at a slot.
+
+        Args:
+            slot: Position in [0, len(self))
+
+        Returns:
+            int: The removed member
+        """
+        items = self.__items
+        value = items[slot]
+        last = items.pop()
+        if last != value:
+            items[slot] = last
+            self.__slots[last] = slot
+        self.__slots[value] = -1
+        return value
+
+    def at(self, slot: int) -> int:
+        """Return the member stored at a slot without removing it."""
+        return self.__items[slot]
+
+    def __contains__(self, value: int) -> bool:
+        return self.__slots[value] >= 0
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __bool__(self) -> bool:
+        return len(self.__items) > 0
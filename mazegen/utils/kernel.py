@@ -0,0 +1,183 @@
+"""Carving kernel shared by the maze algorithms.
+
+This module holds the lookup tables and primitives that algorithms use to
+work on the raw wall storage of a MazeGrid: one byte per cell in grid
+order, with the wall bits N=1, E=2, S=4 and W=8. Directions are small
+integers indexing the tables, in the order North, East, South, West, so
+the hot loops only do tuple lookups and byte operations instead of going
+through the Wall and Direction enums.
+
+Tables:
+    NORTH, EAST, SOUTH, WEST: Direction indices
+    DX, DY: Column and row step of each direction
+    WALL: Wall bit of each direction
+    OPPOSITE: Opposite direction of each direction
+    OPPOSITE_WALL: Wall bit of the neighbour facing each direction
+    CLEAR_HERE, CLEAR_THERE: Masks opening a direction on the cell and
+        on its neighbour
+    OPTIONS: Directions set in each 4-bit direction mask
+    PICK_TABLE: Direction picked in a mask by a random byte
+    WALL_COUNT: Number of walls of each wall code
+    DEAD_END_TABLE: Maps a wall code to 1 for a dead end
+    LOCKED_TABLE: Maps a flags byte to 1 for a locked cell
+    FREE_TABLE: Maps a locked byte to the visited byte of the cell
+
+Functions:
+    offsets: Flat index step of each direction
+    direction_to: Direction from a cell to an adjacent cell
+    carve: Open the wall between a cell and its neighbour
+    close: Close the wall between a cell and its neighbour
+    wall_cell: A removed wall as the east or south wall of a cell
+    inner_walls: Wall bits of each cell that are not on the border
+"""
+
+from typing import Tuple
+from mazegen.maze.grid import FLAG_LOCKED
+
+
+NORTH = 0
+EAST = 1
+SOUTH = 2
+WEST = 3
+
+DX = (0, 1, 0, -1)
+DY = (-1, 0, 1, 0)
+WALL = (0x1, 0x2, 0x4, 0x8)
+OPPOSITE = (SOUTH, WEST, NORTH, EAST)
+OPPOSITE_WALL = (0x4, 0x8, 0x1, 0x2)
+CLEAR_HERE = tuple(0xF & ~bit for bit in WALL)
+CLEAR_THERE = tuple(0xF & ~bit for bit in OPPOSITE_WALL)
+OPTIONS = tuple(
+    tuple(d for d in range(4) if mask >> d & 1) for mask in range(16)
+)
+# Indexed by mask << 8 | byte; uniform up to a bias below 1% between
+# three options
+PICK_TABLE = bytes(
+    options[byte * len(options) >> 8] if options else 0
+    for options in OPTIONS for byte in range(256)
+)
+WALL_COUNT = bytes(bin(code & 0xF).count("1") for code in range(256))
+DEAD_END_TABLE = bytes(1 if count == 3 else 0 for count in WALL_COUNT)
+LOCKED_TABLE = bytes(1 if flag & FLAG_LOCKED else 0 for flag in range(256))
+FREE_TABLE = bytes((1, 0)) + bytes(254)
+
+# Direction of each (dx, dy) step
+_DIRECTION_OF = {(DX[d], DY[d]): d for d in range(4)}
+
+
+def offsets(width: int) -> Tuple[int, int, int, int]:
+    """Return the flat index step of each direction.
+
+    Args:
+        width: Maze width in cells
+
+    Returns:
+        Tuple[int, int, int, int]: Steps to the North, East, South and
+        West neighbours
+    """
+    return (-width, 1, width, -1)
+
+
+def direction_to(x: int, y: int, x1: int, y1: int) -> int:
+    """Return the direction from a cell to an adjacent cell.
+
+    Args:
+        x: Current cell X coordinate
+        y: Current cell Y coordinate
+        x1: Adjacent cell X coordinate
+        y1: Adjacent cell Y coordinate
+
+    Returns:
+        int: Direction index
+
+    Raises:
+        KeyError: If the cells are not adjacent
+    """
+    return _DIRECTION_OF[(x1 - x, y1 - y)]
+
+
+def carve(walls: bytearray, width: int, index: int, direction: int) -> int:
+    """Open the wall between a cell and its neighbour.
+
+    Both sides of the wall are cleared, so the two cells always agree.
+    The neighbour must be inside the grid.
+
+    Args:
+        walls: Flat wall buffer of the grid
+        width: Maze width in cells
+        index: Flat index of the cell
+        direction: Direction of the neighbour
+
+    Returns:
+        int: Flat index of the neighbour
+    """
+    target = index + (-width, 1, width, -1)[direction]
+    walls[index] &= CLEAR_HERE[direction]
+    walls[target] &= CLEAR_THERE[direction]
+    return target
+
+
+def close(walls: bytearray, width: int, index: int, direction: int) -> int:
+    """Close the wall between a cell and its neighbour.
+
+    Counterpart of carve: both sides of the wall are set.
+
+    Args:
+        walls: Flat wall buffer of the grid
+        width: Maze width in cells
+        index: Flat index of the cell
+        direction: Direction of the neighbour
+
+    Returns:
+        int: Flat index of the neighbour
+    """
+    target = index + (-width, 1, width, -1)[direction]
+    walls[index] |= WALL[direction]
+    walls[target] |= OPPOSITE_WALL[direction]
+    return target
+
+
+def wall_cell(index: int, direction: int,
+              width: int) -> Tuple[int, int, int]:
+    """Describe a wall as the east or south wall of a cell.
+
+    This is the ``active_cell`` form the views expect for a removed wall:
+    the cell coordinates and the wall bit, 2 for east or 4 for south.
+
+    Args:
+        index: Flat index of one cell of the wall
+        direction: Direction of the other cell
+        width: Maze width in cells
+
+    Returns:
+        Tuple[int, int, int]: (x, y, wall bit)
+    """
+    if direction == NORTH:
+        index -= width
+    elif direction == WEST:
+        index -= 1
+    return (index % width, index // width,
+            0x2 if direction == EAST or direction == WEST else 0x4)
+
+
+def inner_walls(width: int, height: int) -> bytes:
+    """Return, for each cell, the wall bits that are not on the border.
+
+    ANDed with a wall code, it keeps the walls that have a neighbour
+    behind them, which saves the bounds checks in the hot loops.
+
+    Args:
+        width: Maze width in cells
+        height: Maze height in cells
+
+    Returns:
+        bytes: One 4-bit mask per cell, in grid order
+    """
+    row = bytearray(b"\x0f" * width)
+    row[0] &= ~0x8
+    row[width - 1] &= ~0x2
+    if height == 1:
+        return bytes(code & ~0x5 for code in row)
+    return (bytes(code & ~0x1 for code in row)
+            + bytes(row) * (height - 2)
+            + bytes(code & ~0x4 for code in row))
@@ -0,0 +1,120 @@
+"""Peak memory estimation for maze generation.
+
+This module estimates how much memory a generation run needs before any
+buffer is allocated, so oversized configurations can be refused up front
+instead of failing halfway through. The estimate assumes the memory-lean
+internals used by the large-maze mode: flat grid buffers, a flat BFS in
+the pathfinder, a windowed stamp search and a row-streamed output file.
+
+Functions:
+    estimate_peak_memory: Estimated peak bytes for a generation run
+    estimate_stream_memory: Estimated peak bytes for a row-streamed run
+    format_bytes: Human readable size string
+"""
+
+from typing import Optional
+
+# walls + visited + flags buffers of MazeGrid
+GRID_BYTES_PER_CELL = 3
+# came_from buffer plus the BFS queue of PathFinder
+PATHFINDER_BYTES_PER_CELL = 2
+# Interpreter, imports and fixed-size buffers
+BASE_OVERHEAD_BYTES = 64 * 1024 * 1024
+# Carved tiles waiting to be pasted, at most one wall byte per cell
+TILE_RESULT_BYTES_PER_CELL = 1
+# Wall copy stored by the maze cache, plus its compressed disk entry
+CACHE_BYTES_PER_CELL = 2
+# Largest tile, in nominal tiles: corner tiles take the remainder of
+# the division and the stamp block spans up to two tiles each way
+LARGEST_TILE = 4
+
+
+def estimate_peak_memory(width: int, height: int, algorithm: str,
+                         perfect: bool, braid: bool = False,
+                         tile_size: Optional[int] = None,
+                         workers: int = 1, cached: bool = False) -> int:
+    """Estimate the peak memory of one generation run.
+
+    The grid buffers live for the whole run, while the algorithm
+    workspace, the loop injection and braid passes and the pathfinder
+    run one after the other, so only the largest of them counts towards
+    the peak.
+
+    A cached run also copies the walls once solved, to store them; the
+    memory level of the cache is off in large-maze mode, so only that
+    copy counts.
+
+    With tiled generation, the algorithm workspace is only needed per
+    tile, in each worker process, while the carved tiles wait in the main
+    process. Every tile is counted at the size of the largest one.
+
+    Args:
+        width: Maze width in cells
+        height: Maze height in cells
+        algorithm: Registered algorithm name
+        perfect: False if loops are added after carving
+        braid: True if dead ends are removed after carving
+        tile_size: Tile size of tiled generation, or None
+        workers: Worker processes of tiled generation
+        cached: True if the finished maze is stored in a maze cache
+
+    Returns:
+        int: Estimated peak memory in bytes
+
+    Raises:
+        ValueError: If the algorithm is not registered
+    """
+    from mazegen.algorithms.factory import AlgorithmFactory
+    from mazegen.algorithms.unperfect import UnPerfect
+    from mazegen.algorithms.braid import Braid
+
+    cells = width * height
+    algo = AlgorithmFactory.create(algorithm)
+    phases = [PATHFINDER_BYTES_PER_CELL]
+    if tile_size is None:
+        phases.append(algo.WORKSPACE_BYTES_PER_CELL)
+    else:
+        phases.append(TILE_RESULT_BYTES_PER_CELL)
+    if not perfect:
+        phases.append(UnPerfect.WORKSPACE_BYTES_PER_CELL)
+    if braid:
+        phases.append(Braid.WORKSPACE_BYTES_PER_CELL)
+    if cached:
+        phases.append(CACHE_BYTES_PER_CELL)
+    per_cell = GRID_BYTES_PER_CELL + max(phases)
+    estimate = BASE_OVERHEAD_BYTES + cells * per_cell
+    if tile_size is not None:
+        tile_cells = min(cells, LARGEST_TILE * tile_size * tile_size)
+        estimate += workers * (
+            BASE_OVERHEAD_BYTES + tile_cells
+            * (GRID_BYTES_PER_CELL + algo.WORKSPACE_BYTES_PER_CELL))
+    return estimate
+
+
+def estimate_stream_memory(width: int) -> int:
+    """Estimate the peak memory of a row-streamed Eller run.
+
+    Only the Eller row kernel is alive, so the estimate grows with the
+    width and does not depend on the height.
+
+    Args:
+        width: Maze width in cells
+
+    Returns:
+        int: Estimated peak memory in bytes
+    """
+    from mazegen.algorithms.eller import EllerAlgorithm
+
+    return BASE_OVERHEAD_BYTES + width * EllerAlgorithm.ROW_BYTES_PER_COLUMN
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count as a human readable string.
+
+    Args:
+        size: Number of bytes
+
+    Returns:
+        str: Size in MB with one decimal, e.g. "512.0 MB"
+    """
+    return f"{size / (1024 * 1024):.1f} MB"
@@ -0,0 +1,69 @@
+"""Random permutation of a range drawn one value at a time.
+
+This module provides ``permuted_range``, which walks [0, count) in a
+random order without storing it. Each value goes through a keyed
+four-round Feistel network over the smallest power of two holding the
+range, and values that land outside the range are fed through the
+network again (cycle walking) until they land inside. Every round is a
+bijection, so the whole walk visits each value exactly once, and the
+memory cost is a handful of integers whatever the count.
+
+The round function is multiply-shift hashing with keys drawn from the
+run's ``random.Random``, so a seed always gives the same order. The order
+is pseudo-random, not uniform over all permutations like
+``random.shuffle``, which is enough to pick the next wall of a maze.
+
+Functions:
+    permuted_range: Values of [0, count) in a random order
+"""
+
+import random
+from typing import Generator
+
+
+def permuted_range(count: int,
+                   rng: random.Random) -> Generator[int, None, None]:
+    """Yield the values of [0, count) in a random order.
+
+    The halves of a value are ``high`` and ``low`` bits wide, and swap at
+    every round, so an odd bit count works as well.
+
+    Args:
+        count: Number of values
+        rng: Random number generator drawing the round keys
+
+    Returns:
+        Generator yielding each value of [0, count) once.
+    """
+    bits = max(2, (count - 1).bit_length())
+    high = (bits + 1) // 2
+    low = bits - high
+    mask_high = (1 << high) - 1
+    mask_low = (1 << low) - 1
+    shift_high = 32 - high
+    shift_low = 32 - low
+    # Odd multipliers and offsets of the four rounds
+    mul1, add1, mul2, add2, mul3, add3, mul4, add4 = (
+        rng.getrandbits(32) | 1 for _ in range(8))
+
+    for value in range(count):
+        while True:
+            left = value >> low
+            right = value & mask_low
+            value = right << high | left ^ (
+                (right * mul1 + add1) & 0xFFFFFFFF) >> shift_high
+            left = value >> high
+            right = value & mask_high
+            value = right << low | left ^ (
+                (right * mul2 + add2) & 0xFFFFFFFF) >> shift_low
+            left = value >> low
+            right = value & mask_low
+            value = right << high | left ^ (
+                (right * mul3 + add3) & 0xFFFFFFFF) >> shift_high
+            left = value >> high
+            right = value & mask_high
+            value = right << low | left ^ (
+                (right * mul4 + add4) & 0xFFFFFFFF) >> shift_low
+            if value < count:
+                break
+        yield value
@@ -0,0 +1,514 @@
+"""Binary replay files of animated generation runs.
+
+A recorder listens to the generation events of a run (see
+``mazegen.maze.events``) and the yielded states, and writes them to a
+compact file. A replay then drives the same Maze states from the file at
+any speed, without running the algorithm again, or jumps straight to the
+final grid with a few buffer copies.
+
+Each step is one unsigned LEB128 varint holding ``payload << 4 | code``:
+
+    code 0-3    Carve, payload cell index, code the direction
+    code 4-7    Wall, payload cell index, code - 4 the direction
+    code 8      Visit, payload cell index
+    code 9      Row, payload row; followed by the wall codes of the row
+                above (when there is one) and of the row
+    code 10     Refresh; followed by a varint length and the zlib
+                compressed wall codes of the whole grid
+    code 11     Phase, payload generation step
+    code 12     Frame, one yielded state; payload 0 without active cell,
+                else 1 + (cell index << 2 | wall), wall 0, 1 or 2 for the
+                wall bit 0, 2 or 4
+
+The header stores the size, entry and exit, the algorithm and seed, the
+grid as the algorithm found it (walls, flags, visited marks, stamp
+characters) and the
+final walls and shortest path, so a fast-forward never reads the steps.
+
+Constants:
+    MAGIC: First bytes of a replay file
+
+Classes:
+    ReplayRecorder: Event sink writing a run to a replay file
+    Replay: Replay file loaded in memory
+
+Functions:
+    play_steps: Apply encoded steps to a maze, pausing at each frame
+    record_replay: Run a generator and record it to a replay file
+"""
+
+import json
+import zlib
+from typing import (
+    TYPE_CHECKING, Dict, Generator, Optional, Set, Tuple, Union)
+from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED
+from mazegen.maze.events import (
+    Backtrack, Carve, Event, Phase, Refresh, Row, Visit, Wall,
+)
+from mazegen.pathfinder import PathFinder
+from mazegen.utils.kernel import carve, close, offsets
+
+if TYPE_CHECKING:
+    from mazegen.MazeGenerator import MazeGenerator
+
+
+MAGIC = b"MZR1"
+
+_CARVE = 0
+_WALL = 4
+_VISIT = 8
+_ROW = 9
+_REFRESH = 10
+_PHASE = 11
+_FRAME = 12
+
+# Wall bit of an active cell to its 2-bit code, and back
+_WALL_CODE = {0: 0, 2: 1, 4: 2}
+_WALL_BIT = (0, 2, 4)
+# Visited byte of a cell for each flags byte, locked cells stay unvisited
+_VISITED_TABLE = bytes(0 if flag & FLAG_LOCKED else 1 for flag in range(256))
+
+
+def _varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint.
+
+    Args:
+        out: Buffer to append to
+        value: Non-negative integer
+    """
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: Union[bytes, memoryview],
+                 position: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint.
+
+    Args:
+        data: Encoded bytes
+        position: Offset of the varint
+
+    Returns:
+        Tuple[int, int]: The value and the offset after it
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _blob(out: bytearray, data: bytes) -> None:
+    """Append a length-prefixed byte string.
+
+    Args:
+        out: Buffer to append to
+        data: Bytes to append
+    """
+    _varint(out, len(data))
+    out += data
+
+
+def play_steps(maze: Maze, data: Union[bytes, memoryview],
+               position: int = 0) -> Generator[int, None, None]:
+    """Apply encoded steps to a maze, pausing at each frame.
+
+    Args:
+        maze: Maze in the state the steps start from
+        data: Encoded steps, or a view of them
+        position: Offset of the first step to apply
+
+    Returns:
+        Generator yielding the offset after each frame step, with the
+        maze in the state of that frame.
+    """
+    grid = maze.grid
+    width = grid.width
+    walls = grid.walls
+    visited = grid.visited
+    end = len(data)
+    while position < end:
+        # Inline varint read, the hot path of a replay
+        value = data[position]
+        position += 1
+        if value > 0x7F:
+            value &= 0x7F
+            shift = 7
+            while True:
+                byte = data[position]
+                position += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+        code = value & 0xF
+        payload = value >> 4
+        if code < _WALL:
+            carve(walls, width, payload, code)
+        elif code < _VISIT:
+            close(walls, width, payload, code - _WALL)
+        elif code == _VISIT:
+            visited[payload] = 1
+        elif code == _FRAME:
+            if payload:
+                payload -= 1
+                index = payload >> 2
+                maze.active_cell = (index % width, index // width,
+                                    _WALL_BIT[payload & 0x3])
+            else:
+                maze.active_cell = None
+            yield position
+        elif code == _PHASE:
+            maze.gen_step = payload
+        elif code == _ROW:
+            start = max(payload - 1, 0) * width
+            stop = (payload + 1) * width
+            walls[start:stop] = data[position:position + stop - start]
+            position += stop - start
+            visited[start:stop] = grid.flags[start:stop].translate(
+                _VISITED_TABLE)
+        elif code == _REFRESH:
+            size, position = _read_varint(data, position)
+            walls[:] = zlib.decompress(data[position:position + size])
+            position += size
+            visited[:] = grid.flags.translate(_VISITED_TABLE)
+
+
+class ReplayRecorder:
+    """Event sink writing a run to a replay file.
+
+    Pass the recorder as the ``events`` sink of ``generate_maze`` and
+    call ``frame`` for each yielded state. The grid is captured when the
+    first event arrives, that is once the stamp is placed.
+
+    Algorithms differ in when they mark cells visited, so the events do
+    not carry visited marks. The recorder keeps a copy of the marks
+    instead, and at each frame writes a Visit step for every cell touched
+    since then that the run has marked meanwhile.
+
+    Attributes:
+        __maze: Maze being generated
+        __steps: Encoded steps so far, copied out by ``steps`` or shared
+            by ``steps_view``
+        __frames: Number of recorded frames
+        __start: Walls, flags, visited marks and stamp characters at the
+            first event
+        __seen: Visited marks as the replay will know them
+        __touched: Cells touched by events and not yet seen visited
+        __finished: Whether the final grid was recorded
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """Initialize an empty recording.
+
+        Args:
+            maze: Maze the recorded run generates
+        """
+        self.__maze = maze
+        self.__steps = bytearray()
+        self.__frames = 0
+        self.__start: Optional[
+            Tuple[bytes, bytes, bytes, Dict[int, str]]] = None
+        self.__seen = bytearray()
+        self.__touched: Set[int] = set()
+        self.__finished = False
+
+    @property
+    def frames(self) -> int:
+        return self.__frames
+
+    @property
+    def steps(self) -> bytes:
+        return bytes(self.__steps)
+
+    @property
+    def steps_view(self) -> memoryview:
+        """Encoded steps so far, without copying them.
+
+        The recording cannot grow while the view is alive, so release it
+        (or use it as a context manager) before the next event.
+        """
+        return memoryview(self.__steps)
+
+    @property
+    def steps_size(self) -> int:
+        return len(self.__steps)
+
+    def __call__(self, event: Event) -> None:
+        """Encode one event.
+
+        Args:
+            event: Event of the run
+        """
+        grid = self.__maze.grid
+        width = grid.width
+        steps = self.__steps
+        if self.__start is None:
+            self.__start = (bytes(grid.walls), bytes(grid.flags),
+                            bytes(grid.visited), dict(grid.lock_codes))
+            self.__seen = bytearray(grid.visited)
+        if isinstance(event, (Carve, Wall)):
+            index = event.y * width + event.x
+            code = _CARVE if isinstance(event, Carve) else _WALL
+            _varint(steps, index << 4 | code + event.direction)
+            self.__touched.add(index)
+            self.__touched.add(index + offsets(width)[event.direction])
+        elif isinstance(event, (Visit, Backtrack)):
+            self.__touched.add(event.y * width + event.x)
+        elif isinstance(event, Row):
+            _varint(steps, event.y << 4 | _ROW)
+            start = max(event.y - 1, 0) * width
+            stop = (event.y + 1) * width
+            steps += grid.walls[start:stop]
+            self.__seen[start:stop] = grid.flags[start:stop].translate(
+                _VISITED_TABLE)
+        elif isinstance(event, Refresh):
+            _varint(steps, _REFRESH)
+            _blob(steps, zlib.compress(grid.walls))
+            self.__seen[:] = grid.flags.translate(_VISITED_TABLE)
+        elif isinstance(event, Phase):
+            _varint(steps, event.step << 4 | _PHASE)
+
+    def frame(self) -> None:
+        """Mark the end of one yielded state, with its active cell.
+
+        The first final state (step 3) also records the whole grid, so a
+        replay ends on the finished maze even when the run, static for
+        instance, did not report every change.
+        """
+        maze = self.__maze
+        steps = self.__steps
+        if maze.gen_step == 3 and not self.__finished:
+            self.__finished = True
+            self(Refresh())
+        if self.__touched:
+            visited = maze.grid.visited
+            seen = self.__seen
+            for index in sorted(self.__touched):
+                if visited[index]:
+                    if not seen[index]:
+                        seen[index] = 1
+                        _varint(steps, index << 4 | _VISIT)
+                    self.__touched.discard(index)
+        active = maze.active_cell
+        payload = 0
+        if active is not None:
+            x, y, wall = active
+            index = y * maze.width + x
+            payload = 1 + (index << 2 | _WALL_CODE.get(wall, 0))
+        _varint(steps, payload << 4 | _FRAME)
+        self.__frames += 1
+
+    def save(self, path: str, algorithm: str = "",
+             seed: Optional[str] = None) -> None:
+        """Write the recording of the finished run.
+
+        The maze is solved here so the file carries its shortest path.
+
+        Args:
+            path: Replay file path
+            algorithm: Algorithm name shown by the views
+            seed: Seed shown by the views
+
+        Raises:
+            ValueError: If nothing was recorded
+            OSError: If the file cannot be written
+        """
+        if self.__start is None:
+            raise ValueError("Nothing was recorded")
+        maze = self.__maze
+        grid = maze.grid
+        if not maze.shortest_path:
+            PathFinder().solve_shortest_path(maze)
+        walls, flags, visited, lock_codes = self.__start
+
+        out = bytearray(MAGIC)
+        for value in (grid.width, grid.height,
+                      grid.index(*maze.entry), grid.index(*maze.exit),
+                      int(maze.perfect), self.__frames):
+            _varint(out, value)
+        _blob(out, algorithm.encode())
+        _blob(out, (seed or "").encode())
+        _blob(out, zlib.compress(walls))
+        _blob(out, zlib.compress(flags))
+        _blob(out, zlib.compress(visited))
+        _blob(out, json.dumps(lock_codes).encode())
+        _blob(out, zlib.compress(grid.walls))
+        _blob(out, maze.shortest_path.encode())
+        _blob(out, bytes(self.__steps))
+        with open(path, "wb") as file:
+            file.write(out)
+
+
+def record_replay(generator: "MazeGenerator", path: str,
+                  algorithm: str = "") -> int:
+    """Run a generator and record it to a replay file.
+
+    Only animated configurations record steps; static ones give a replay
+    of a single frame.
+
+    Args:
+        generator: Generator to run
+        path: Replay file path
+        algorithm: Algorithm name shown by the views
+
+    Returns:
+        int: Number of recorded frames
+    """
+    recorder = ReplayRecorder(generator.maze)
+    for _ in generator.generate_maze(events=recorder):
+        recorder.frame()
+    recorder.save(path, algorithm, generator.get_seed())
+    return recorder.frames
+
+
+class Replay:
+    """Replay file loaded in memory.
+
+    Attributes:
+        width: Maze width in cells
+        height: Maze height in cells
+        entry: Entry coordinates (x, y)
+        exit: Exit coordinates (x, y)
+        perfect: Whether the recorded maze was perfect
+        frames: Number of recorded frames
+        algorithm: Algorithm name of the run
+        seed: Seed of the run
+        shortest_path: Shortest path of the final maze
+        __walls: Walls as the algorithm found them
+        __flags: Flags as the algorithm found them
+        __visited: Visited marks as the algorithm found them
+        __lock_codes: Stamp characters of the locked cells
+        __final: Walls of the final maze
+        __steps: Encoded steps
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """Decode a replay file.
+
+        Args:
+            data: Contents of the file
+
+        Raises:
+            ValueError: If the data is not a replay file
+        """
+        if data[:4] != MAGIC:
+            raise ValueError("Not a maze replay file")
+        try:
+            position = 4
+            header = []
+            for _ in range(6):
+                value, position = _read_varint(data, position)
+                header.append(value)
+            blobs = []
+            for _ in range(9):
+                size, position = _read_varint(data, position)
+                blobs.append(data[position:position + size])
+                position += size
+            self.width, self.height, entry, exit, perfect, self.frames = (
+                header)
+            self.entry = (entry % self.width, entry // self.width)
+            self.exit = (exit % self.width, exit // self.width)
+            self.perfect = bool(perfect)
+            self.algorithm = blobs[0].decode()
+            self.seed = blobs[1].decode()
+            self.__walls = zlib.decompress(blobs[2])
+            self.__flags = zlib.decompress(blobs[3])
+            self.__visited = zlib.decompress(blobs[4])
+            self.__lock_codes = {int(index): code for index, code
+                                 in json.loads(blobs[5]).items()}
+            self.__final = zlib.decompress(blobs[6])
+            self.shortest_path = blobs[7].decode()
+            self.__steps = blobs[8]
+        except (IndexError, ValueError, zlib.error) as e:
+            raise ValueError(f"Damaged maze replay file: {e}") from e
+        size = self.width * self.height
+        if not (len(self.__walls) == len(self.__flags)
+                == len(self.__visited)
+                == len(self.__final) == size):
+            raise ValueError("Damaged maze replay file: wrong grid size")
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """Read a replay file.
+
+        Args:
+            path: Replay file path
+
+        Returns:
+            Replay: The decoded replay
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a replay file
+        """
+        with open(path, "rb") as file:
+            return cls(file.read())
+
+    def build_maze(self) -> Maze:
+        """Create a maze in the state the recorded algorithm started from.
+
+        Returns:
+            Maze: Maze with the recorded starting grid
+        """
+        maze = Maze(self.width, self.height, self.entry, self.exit,
+                    self.perfect)
+        self.reset(maze)
+        return maze
+
+    def reset(self, maze: Maze) -> None:
+        """Put a maze back in the recorded starting state.
+
+        Args:
+            maze: Maze of the replay size
+        """
+        grid = maze.grid
+        grid.reset()
+        grid.walls[:] = self.__walls
+        grid.flags[:] = self.__flags
+        grid.visited[:] = self.__visited
+        grid.lock_codes.update(self.__lock_codes)
+        maze.shortest_path = ""
+        maze.active_cell = None
+        maze.gen_step = 0
+
+    def play(self, maze: Maze) -> Generator[Maze, None, None]:
+        """Replay the recorded steps, one yielded state per frame.
+
+        The maze should be in the starting state, see ``build_maze`` and
+        ``reset``.
+
+        Args:
+            maze: Maze of the replay size
+
+        Returns:
+            Generator yielding the maze at each recorded frame.
+        """
+        for _ in play_steps(maze, self.__steps):
+            yield maze
+
+    def fast_forward(self, maze: Maze) -> Maze:
+        """Jump straight to the final maze.
+
+        Only buffer copies are made, no recorded step is read.
+
+        Args:
+            maze: Maze of the replay size
+
+        Returns:
+            Maze: The maze in its final state, with its shortest path
+        """
+        grid = maze.grid
+        grid.walls[:] = self.__final
+        grid.visited[:] = grid.flags.translate(_VISITED_TABLE)
+        maze.shortest_path = self.shortest_path
+        maze.active_cell = None
+        maze.gen_step = 3
+        return maze
@@ -0,0 +1,425 @@
+"""Random number sources for maze generation.
+
+Generation code never draws from the module-level ``random`` functions:
+every algorithm, the stamp placement and the post-processing stages take a
+``random.Random`` instance, so several mazes can be generated at the same
+time in threads without sharing any state.
+
+Two engines implement that interface:
+
+- ``mt``: Python's Mersenne Twister, ``random.Random`` itself. A seed
+  gives the same stream as ``random.seed`` did, so mazes are the same as
+  in earlier releases, on every platform and Python version that keeps
+  ``random``'s seeding stable (all of them since 3.2).
+- ``pcg``: PCG64 (XSL-RR 128/64) with a SHA-256 seed derivation. Its
+  output is pregenerated in blocks of 32-bit words, by NumPy when it is
+  installed and in pure Python otherwise; both produce the same words, so
+  a seed gives the same maze on every platform, Python version and with
+  or without NumPy. It gives different mazes than ``mt`` for a seed, and
+  its stream may only change in a release that says so.
+
+Constants:
+    ENGINES: Engine name to generator class
+
+Classes:
+    PcgRandom: PCG64 generator serving pregenerated blocks
+
+Functions:
+    create_rng: Create a generator of the given engine
+    ensure_rng: Return the given generator, or a new one
+"""
+
+import hashlib
+import random
+import sys
+from array import array
+from itertools import islice
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+)
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsLenAndGetItem
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+_T = TypeVar("_T")
+
+# PCG64 constants: 128-bit LCG multiplier and masks
+_MULTIPLIER = 0x2360ED051FC65DA44385DF649FCCF645
+_MASK_128 = (1 << 128) - 1
+_MASK_64 = (1 << 64) - 1
+_MASK_32 = 0xFFFFFFFF
+_WORD = 1 << 32
+# 64-bit outputs generated per block, i.e. twice as many words
+_BLOCK = 4096
+# Floats generated per block of random(), one 64-bit output each
+_FLOATS = 1024
+# 2 ** -53, the step between floats with 53 random bits
+_FLOAT_STEP = 1.0 / 9007199254740992.0
+
+
+class PcgRandom(random.Random):
+    """PCG64 generator with block pregeneration.
+
+    The stream is a sequence of 32-bit words: the low then the high half
+    of each PCG64 output. Words are produced a block at a time and handed
+    out through an array iterator, so a draw costs one ``next`` instead of
+    a generator step, and ``randbytes`` copies whole words in bulk.
+    ``random`` has blocks of its own, converted from words in one
+    vectorized step.
+    ``randrange``, ``choice`` and ``shuffle`` reduce one word with
+    Lemire's multiply-shift instead of the bit-count rejection of
+    random.Random, and ``getrandbits(k)`` takes the top k bits of one word
+    for k up to 32: callers wanting many small fields, like 2-bit
+    direction picks, draw them together and split the result.
+
+    Everything else of ``random.Random`` (``sample``, ``uniform``, ...)
+    works on top of ``random``, ``getrandbits`` and ``_randbelow``.
+
+    Attributes:
+        __state: LCG state after the last generated word
+        __inc: LCG increment (odd)
+        __words: Iterator over the words left in the current block
+        __floats: Iterator over the floats left in the current block
+        __generator: NumPy PCG64 bit generator filling the blocks, or None
+    """
+
+    VERSION = 1
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Seed the generator.
+
+        Integers, strings and bytes give a stable stream; None seeds from
+        ``os.urandom`` through ``random.SystemRandom``.
+
+        Args:
+            a: Seed value
+            version: Ignored, kept for the random.Random interface
+
+        Raises:
+            TypeError: If the seed has an unsupported type
+        """
+        if a is None:
+            material = random.SystemRandom().randbytes(32)
+        elif isinstance(a, int):
+            material = b"i" + str(a).encode()
+        elif isinstance(a, str):
+            material = b"s" + a.encode()
+        elif isinstance(a, (bytes, bytearray)):
+            material = b"b" + bytes(a)
+        else:
+            raise TypeError("PcgRandom seed must be an int, str or bytes")
+        digest = hashlib.sha256(material).digest()
+        self.__state = int.from_bytes(digest[:16], "little")
+        self.__inc = int.from_bytes(digest[16:], "little") | 1
+        self.__words: Iterator[int] = iter(())
+        self.__floats: Iterator[float] = iter(())
+        self.__generator: Any = np.random.PCG64(0) if HAS_NUMPY else None
+        self.gauss_next = None
+
+    def __generate(self, outputs: int) -> "array[int]":
+        """Advance the generator and return its next words.
+
+        Args:
+            outputs: Number of 64-bit outputs, i.e. half the words
+
+        Returns:
+            array[int]: The words, in stream order
+        """
+        generator = self.__generator
+        if generator is not None:
+            generator.state = {
+                "bit_generator": "PCG64",
+                "state": {"state": self.__state, "inc": self.__inc},
+                "has_uint32": 0, "uinteger": 0,
+            }
+            words = array("I")
+            words.frombytes(generator.random_raw(outputs)
+                            .astype("<u8").tobytes())
+            if sys.byteorder == "big":
+                words.byteswap()
+            self.__state = generator.state["state"]["state"]
+            return words
+
+        state = self.__state
+        inc = self.__inc
+        values: List[int] = []
+        append = values.append
+        for _ in range(outputs):
+            state = (state * _MULTIPLIER + inc) & _MASK_128
+            mixed = ((state >> 64) ^ state) & _MASK_64
+            rotation = state >> 122
+            value = ((mixed >> rotation)
+                     | (mixed << (64 - rotation))) & _MASK_64
+            append(value & _MASK_32)
+            append(value >> 32)
+        self.__state = state
+        return array("I", values)
+
+    def __refill(self) -> Iterator[int]:
+        """Start the next block of words.
+
+        Returns:
+            Iterator[int]: Iterator over the new block
+        """
+        self.__words = iter(self.__generate(_BLOCK))
+        return self.__words
+
+    def __reject(self, product: int, n: int) -> int:
+        """Finish a multiply-shift draw that landed in the biased zone.
+
+        Args:
+            product: Word times n of the first draw
+            n: Exclusive upper bound
+
+        Returns:
+            int: Uniform integer in [0, n)
+        """
+        threshold = (_WORD - n) % n
+        while product & _MASK_32 < threshold:
+            word = next(self.__words, -1)
+            if word < 0:
+                word = next(self.__refill())
+            product = word * n
+        return product >> 32
+
+    def __refill_floats(self) -> Iterator[float]:
+        """Start the next block of floats.
+
+        Each float takes 27 bits of the first word of an output and 26 of
+        the second, like the Mersenne Twister of random.Random.
+
+        Returns:
+            Iterator[float]: Iterator over the new block
+        """
+        words = self.__generate(_FLOATS)
+        if self.__generator is not None:
+            pairs = np.frombuffer(words, dtype=np.uint32).reshape(-1, 2)
+            floats = (((pairs[:, 0] >> 5) * 67108864.0 + (pairs[:, 1] >> 6))
+                      * _FLOAT_STEP).tolist()
+        else:
+            floats = [((high >> 5) * 67108864.0 + (low >> 6)) * _FLOAT_STEP
+                      for high, low in zip(words[::2], words[1::2])]
+        self.__floats = iter(floats)
+        return self.__floats
+
+    def random(self) -> float:
+        """Return a float in [0, 1) with 53 random bits.
+
+        Floats come from blocks of their own, so word draws in between do
+        not split them.
+
+        Returns:
+            float: The next random float
+        """
+        value = next(self.__floats, -1.0)
+        if value < 0.0:
+            value = next(self.__refill_floats())
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        """Return an integer with k random bits.
+
+        Up to 32 bits come from the top of one word; larger draws join
+        whole words, the first one lowest.
+
+        Args:
+            k: Number of bits
+
+        Returns:
+            int: Uniform integer in [0, 2**k)
+
+        Raises:
+            ValueError: If k is negative
+        """
+        if 0 < k <= 32:
+            word = next(self.__words, -1)
+            if word < 0:
+                word = next(self.__refill())
+            return word >> (32 - k)
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        if k == 0:
+            return 0
+        count = (k + 31) // 32
+        return int.from_bytes(self.randbytes(4 * count),
+                              "little") >> (32 * count - k)
+
+    def _randbelow(self, n: int) -> int:
+        """Return an integer in [0, n) without bias.
+
+        Args:
+            n: Exclusive upper bound
+
+        Returns:
+            int: Uniform integer in [0, n)
+        """
+        if n > _WORD:
+            bits = n.bit_length()
+            value = self.getrandbits(bits)
+            while value >= n:
+                value = self.getrandbits(bits)
+            return value
+        word = next(self.__words, -1)
+        if word < 0:
+            word = next(self.__refill())
+        product = word * n
+        if product & _MASK_32 < n:
+            return self.__reject(product, n)
+        return product >> 32
+
+    def randrange(self, start: int, stop: Optional[int] = None,
+                  step: int = 1) -> int:
+        """Return a random integer from range(start, stop, step).
+
+        The one-argument form skips the argument checks of
+        random.Random.randrange.
+
+        Args:
+            start: Start of the range, or its stop when stop is None
+            stop: Exclusive end of the range
+            step: Step of the range
+
+        Returns:
+            int: A random element of the range
+        """
+        if (stop is None and step == 1 and type(start) is int
+                and 0 < start <= _WORD):
+            word = next(self.__words, -1)
+            if word < 0:
+                word = next(self.__refill())
+            product = word * start
+            if product & _MASK_32 < start:
+                return self.__reject(product, start)
+            return product >> 32
+        return super().randrange(start, stop, step)
+
+    def choice(self, seq: "SupportsLenAndGetItem[_T]") -> _T:
+        """Return a random element of a non-empty sequence.
+
+        Args:
+            seq: Sequence to pick from
+
+        Returns:
+            The picked element
+
+        Raises:
+            IndexError: If the sequence is empty
+        """
+        n = len(seq)
+        if not n:
+            raise IndexError("Cannot choose from an empty sequence")
+        word = next(self.__words, -1)
+        if word < 0:
+            word = next(self.__refill())
+        product = word * n
+        if product & _MASK_32 < n:
+            return seq[self.__reject(product, n)]
+        return seq[product >> 32]
+
+    def randbytes(self, n: int) -> bytes:
+        """Return n random bytes.
+
+        The bytes are the little-endian words of the stream; what the
+        current block lacks is generated in one bulk call.
+
+        Args:
+            n: Number of bytes
+
+        Returns:
+            bytes: The random bytes
+        """
+        count = (n + 3) // 4
+        words = array("I", islice(self.__words, count))
+        missing = count - len(words)
+        if missing:
+            fresh = self.__generate((missing + 1) // 2)
+            words.extend(fresh[:missing])
+            self.__words = iter(fresh[missing:])
+        if sys.byteorder == "big":
+            words.byteswap()
+        return words.tobytes()[:n]
+
+    def getstate(self) -> Tuple[Any, ...]:
+        """Return the internal state of the generator.
+
+        Returns:
+            Tuple[Any, ...]: State accepted by setstate
+        """
+        left = array("I", self.__words)
+        self.__words = iter(left)
+        floats = array("d", self.__floats)
+        self.__floats = iter(floats)
+        return (self.VERSION, self.__state, self.__inc, left.tobytes(),
+                floats.tobytes(), self.gauss_next)
+
+    def setstate(self, state: Tuple[Any, ...]) -> None:
+        """Restore a state returned by getstate.
+
+        Args:
+            state: State tuple
+
+        Raises:
+            ValueError: If the state comes from another version
+        """
+        if state[0] != self.VERSION:
+            raise ValueError(f"PcgRandom state version {state[0]} "
+                             f"is not {self.VERSION}")
+        (_, self.__state, self.__inc, left, floats_left,
+         self.gauss_next) = state
+        words = array("I")
+        words.frombytes(left)
+        self.__words = iter(words)
+        floats = array("d")
+        floats.frombytes(floats_left)
+        self.__floats = iter(floats)
+
+
+# Engine name to generator class
+ENGINES: Dict[str, Type[random.Random]] = {
+    "mt": random.Random,
+    "pcg": PcgRandom,
+}
+
+
+def create_rng(engine: str = "mt", seed: Any = None) -> random.Random:
+    """Create a generator of the given engine.
+
+    Args:
+        engine: Engine name, one of ENGINES
+        seed: Seed of the generator, or None for a random one
+
+    Returns:
+        random.Random: The seeded generator
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown RNG engine '{engine}'. "
+            f"Available: {', '.join(ENGINES)}")
+    return ENGINES[engine](seed)
+
+
+def ensure_rng(rng: Optional[random.Random]) -> random.Random:
+    """Return the given generator, or a new one when it is None.
+
+    The new generator is seeded from the module-level ``random`` state, so
+    callers that only call ``random.seed`` still get reproducible runs.
+
+    Args:
+        rng: Generator to use, or None
+
+    Returns:
+        random.Random: The generator to draw from
+    """
+    if rng is None:
+        return random.Random(random.getrandbits(64))
+    return rng
@@ -0,0 +1,277 @@
+"""Tiled parallel generation for very large mazes.
+
+The grid is cut into square tiles that are carved independently, each in
+a worker process with a generator seeded from the master seed and the
+tile coordinates. The tiles are then stitched into one perfect maze by
+opening one border wall per edge of a random spanning tree over the tile
+graph, drawn from the generator of the run. Nothing depends on which
+worker carves which tile, so the maze only depends on the seed, the tile
+size and the engine, never on the number of workers.
+
+Every tile must be connected on its own, which locked stamp cells could
+break at a tile border. The tiles around the stamp are therefore merged
+into one rectangular block that keeps at least one free cell between the
+stamp and the block border.
+
+Functions:
+    plan_tiles: Cut a grid into tiles
+    carve_tile: Carve one tile, the worker entry point
+    generate_tiled: Carve a maze tile by tile across worker processes
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED
+from mazegen.algorithms.factory import AlgorithmFactory
+from mazegen.utils.disjoint_set import DisjointSet
+from mazegen.utils.kernel import EAST, FREE_TABLE, LOCKED_TABLE, SOUTH, carve
+from mazegen.utils.rng import create_rng
+
+
+# Tile as (x, y, width, height) in cells
+Tile = Tuple[int, int, int, int]
+# Tile to carve: algorithm name, options, engine, seed, width, height
+# and the locked bytes of the tile, or None when nothing is locked
+TileTask = Tuple[str, Dict[str, Any], str, str, int, int, Optional[bytes]]
+
+
+def _span(unit: int, units: int, size: int, total: int) -> Tuple[int, int]:
+    """Return the first cell and the cell count of a tile column or row.
+
+    The last unit also takes the cells left over by the division, so no
+    tile is ever thinner than the tile size.
+
+    Args:
+        unit: Column or row of the unit
+        units: Number of units along the axis
+        size: Tile size in cells
+        total: Maze width or height in cells
+
+    Returns:
+        Tuple[int, int]: First cell and number of cells of the unit
+    """
+    start = unit * size
+    end = total if unit == units - 1 else start + size
+    return start, end - start
+
+
+def plan_tiles(
+    width: int, height: int, size: int, locked: bytearray
+) -> Tuple[List[Tile], List[int], int, int]:
+    """Cut a grid into tiles.
+
+    The grid is divided into units of ``size`` cells, the last column and
+    row taking the remainder. Each unit is a tile, except the units
+    around the locked cells, which form one tile together.
+
+    Args:
+        width: Maze width in cells
+        height: Maze height in cells
+        size: Tile size in cells
+        locked: Flat buffer, 1 for locked cells
+
+    Returns:
+        Tuple[List[Tile], List[int], int, int]: The tiles, the tile of each
+        unit in row-major order, and the number of unit columns and rows
+    """
+    columns = max(width // size, 1)
+    rows = max(height // size, 1)
+
+    # Units covering the locked cells and a one-cell margin
+    block = None
+    first = locked.find(1)
+    if first >= 0:
+        top = first // width
+        bottom = locked.rfind(1) // width
+        left = width
+        right = 0
+        for y in range(top, bottom + 1):
+            row = locked[y * width:(y + 1) * width]
+            x = row.find(1)
+            if x >= 0:
+                left = min(left, x)
+                right = max(right, row.rfind(1))
+        block = (
+            min(max(left - 1, 0) // size, columns - 1),
+            min(max(top - 1, 0) // size, rows - 1),
+            min(min(right + 1, width - 1) // size, columns - 1),
+            min(min(bottom + 1, height - 1) // size, rows - 1),
+        )
+
+    tiles: List[Tile] = []
+    owner = [-1] * (columns * rows)
+    for uy in range(rows):
+        for ux in range(columns):
+            if owner[uy * columns + ux] >= 0:
+                continue
+            x, w = _span(ux, columns, size, width)
+            y, h = _span(uy, rows, size, height)
+            if (block is not None and block[0] <= ux <= block[2]
+                    and block[1] <= uy <= block[3]):
+                x1, w1 = _span(block[2], columns, size, width)
+                y1, h1 = _span(block[3], rows, size, height)
+                w = x1 + w1 - x
+                h = y1 + h1 - y
+                for by in range(block[1], block[3] + 1):
+                    for bx in range(block[0], block[2] + 1):
+                        owner[by * columns + bx] = len(tiles)
+            else:
+                owner[uy * columns + ux] = len(tiles)
+            tiles.append((x, y, w, h))
+    return tiles, owner, columns, rows
+
+
+def carve_tile(task: TileTask) -> bytes:
+    """Carve one tile as a small perfect maze.
+
+    This is the worker entry point, so it only takes picklable values and
+    builds the algorithm through the factory. Algorithms registered at
+    run time are only known to workers started with the ``fork`` method.
+
+    Args:
+        task: Tile to carve, see TileTask
+
+    Returns:
+        bytes: Wall codes of the tile, in row-major order
+    """
+    algorithm, options, engine, seed, width, height, locked = task
+    maze = Maze(width, height, (0, 0), (width - 1, height - 1), True)
+    maze.init_grid()
+    start = 0
+    if locked is not None:
+        flags = maze.grid.flags
+        for index in compress(range(len(locked)), locked):
+            flags[index] |= FLAG_LOCKED
+        start = locked.find(0)
+    carver = AlgorithmFactory.create(algorithm, **options)
+    for _ in carver.generate(maze, start % width, start // width,
+                             rng=create_rng(engine, seed)):
+        pass
+    return bytes(maze.grid.walls)
+
+
+def generate_tiled(
+    maze: Maze, algorithm: str, options: Dict[str, Any], engine: str,
+    seed: str, rng: random.Random, size: int, workers: int = 1
+) -> Generator[Maze, None, None]:
+    """Carve a maze tile by tile across worker processes.
+
+    Tile ``(ux, uy)`` is carved with the generator ``create_rng(engine,
+    f"{seed}:{ux}:{uy}")``. The stitching tree and the loop and braid
+    stages draw from ``rng``, after the stamp placement.
+
+    Args:
+        maze: Maze to carve, with its stamp already locked in
+        algorithm: Registered algorithm name
+        options: Tuning options forwarded to the algorithm
+        engine: Random number engine name of the tile generators
+        seed: Master seed
+        rng: Generator of the run
+        size: Tile size in cells
+        workers: Number of worker processes; 1 carves in this process
+
+    Returns:
+        Generator yielding the final maze.
+    """
+    grid = maze.grid
+    width = grid.width
+    walls = grid.walls
+    locked = grid.flags.translate(LOCKED_TABLE)
+    tiles, owner, columns, rows = plan_tiles(width, grid.height, size,
+                                             locked)
+
+    stamped = locked.find(1) >= 0
+    tasks: List[TileTask] = []
+    for x, y, w, h in tiles:
+        tile_locked = None
+        if stamped:
+            tile_locked = b"".join(
+                locked[row * width + x:row * width + x + w]
+                for row in range(y, y + h))
+            if tile_locked.find(1) < 0:
+                tile_locked = None
+        tasks.append((algorithm, options, engine,
+                      f"{seed}:{x // size}:{y // size}", w, h, tile_locked))
+
+    maze.gen_step = 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _paste(walls, width, tiles,
+                   executor.map(carve_tile, tasks))
+    else:
+        _paste(walls, width, tiles, map(carve_tile, tasks))
+
+    _stitch(walls, width, grid.height, size, len(tiles), owner, columns,
+            rows, rng)
+    grid.visited[:] = locked.translate(FREE_TABLE)
+    carver = AlgorithmFactory.create(algorithm, **options)
+    yield from carver.finish(maze, False, rng=rng)
+
+
+def _paste(walls: bytearray, width: int, tiles: List[Tile],
+           results: Iterable[bytes]) -> None:
+    """Copy carved tiles into the wall buffer of the maze.
+
+    Args:
+        walls: Flat wall buffer of the maze
+        width: Maze width in cells
+        tiles: Tiles, in the order of the results
+        results: Iterable of the wall codes of each tile
+    """
+    for (x, y, w, h), tile_walls in zip(tiles, results):
+        source = memoryview(tile_walls)
+        for row in range(h):
+            start = (y + row) * width + x
+            walls[start:start + w] = source[row * w:(row + 1) * w]
+
+
+def _stitch(walls: bytearray, width: int, height: int, size: int,
+            count: int, owner: List[int], columns: int, rows: int,
+            rng: random.Random) -> None:
+    """Join the tiles along a random spanning tree of the tile graph.
+
+    Unit borders between different tiles are shuffled and taken in turn,
+    Kruskal style; a border joining two tiles not yet connected opens one
+    random wall along it. Each tile is a tree, so the result is a tree.
+
+    Args:
+        walls: Flat wall buffer of the maze
+        width: Maze width in cells
+        height: Maze height in cells
+        size: Tile size in cells
+        count: Number of tiles
+        owner: Tile of each unit, in row-major order
+        columns: Number of unit columns
+        rows: Number of unit rows
+        rng: Generator drawing the tree and the walls
+    """
+    # Borders as (unit, direction) with the unit on the west or north side
+    borders = []
+    for unit, tile in enumerate(owner):
+        ux = unit % columns
+        uy = unit // columns
+        if ux + 1 < columns and owner[unit + 1] != tile:
+            borders.append((unit, EAST))
+        if uy + 1 < rows and owner[unit + columns] != tile:
+            borders.append((unit, SOUTH))
+    rng.shuffle(borders)
+
+    sets = DisjointSet(count)
+    for unit, direction in borders:
+        other = unit + 1 if direction == EAST else unit + columns
+        if not sets.union(owner[unit], owner[other]):
+            continue
+        ux = unit % columns
+        uy = unit // columns
+        if direction == EAST:
+            x = _span(ux + 1, columns, size, width)[0] - 1
+            y, h = _span(uy, rows, size, height)
+            y += rng.randrange(h)
+        else:
+            x, w = _span(ux, columns, size, width)
+            x += rng.randrange(w)
+            y = _span(uy + 1, rows, size, height)[0] - 1
+        carve(walls, width, y * width + x, direction)
@@ -0,0 +1,191 @@
+"""Seekable timeline of an animated generation run.
+
+A timeline records a run like a ReplayRecorder and also keeps compact
+snapshots of the grid (keyframes) every ``interval`` frames. Seeking to a
+frame restores the nearest keyframe at or before it, then applies the
+recorded steps of at most ``interval`` frames, so a seek costs the same
+early or late in a long run.
+
+Keyframes pack the wall codes and the visited marks of each cell into one
+byte, compressed with zlib. Once they exceed the memory budget, every
+other keyframe is dropped and the interval doubles, so memory stays
+bounded and seeks stay proportional to the interval.
+
+Seeking rewrites the grid of the maze in place, which keeps the buffers
+the suspended algorithm holds. Seek back to ``head`` before resuming the
+run: the state of the last frame is restored exactly.
+
+Classes:
+    Timeline: Event sink recording a run with periodic keyframes
+"""
+
+from bisect import bisect_right
+import zlib
+from typing import List, NamedTuple, Optional, Tuple
+from mazegen.maze.maze import Maze
+from mazegen.maze.events import Event
+from mazegen.utils.replay import ReplayRecorder, play_steps
+
+
+# Wall codes and visited marks of a packed keyframe byte
+_WALLS_TABLE = bytes(code & 0xF for code in range(256))
+_VISITED_TABLE = bytes(code >> 4 & 0x1 for code in range(256))
+# Visited mark as a single bit
+_MARK_TABLE = bytes((0,)) + bytes((1,)) * 255
+
+
+class _Keyframe(NamedTuple):
+    """Snapshot of the maze at one frame.
+
+    Attributes:
+        frame: Frame number, 0 before the first frame
+        position: Offset of the next step in the step log
+        grid: Packed and compressed walls and visited marks
+        active_cell: Active cell of the maze
+        gen_step: Generation step of the maze
+    """
+
+    frame: int
+    position: int
+    grid: bytes
+    active_cell: Optional[Tuple[int, int, int]]
+    gen_step: int
+
+
+class Timeline:
+    """Event sink recording a run with periodic keyframes.
+
+    Pass the timeline as the ``events`` sink of ``generate_maze`` and
+    call ``frame`` for each yielded state. Frames are numbered from 1 to
+    ``head``.
+
+    Attributes:
+        recorder: Recorder of the run, which can also save it as a replay
+        __maze: Maze being generated
+        __interval: Frames between two keyframes
+        __budget: Byte cap of the keyframes
+        __keyframes: Keyframes, oldest first
+        __size: Bytes held by the keyframes
+    """
+
+    def __init__(self, maze: Maze, interval: int = 256,
+                 budget: int = 32 << 20) -> None:
+        """Initialize an empty timeline.
+
+        Args:
+            maze: Maze the recorded run generates
+            interval: Frames between two keyframes
+            budget: Byte cap of the keyframes
+
+        Raises:
+            ValueError: If the interval is below 1 or the budget negative
+        """
+        if interval < 1:
+            raise ValueError("Keyframe interval must be at least 1")
+        if budget < 0:
+            raise ValueError("Keyframe budget must not be negative")
+        self.recorder = ReplayRecorder(maze)
+        self.__maze = maze
+        self.__interval = interval
+        self.__budget = budget
+        self.__keyframes: List[_Keyframe] = []
+        self.__size = 0
+
+    @property
+    def head(self) -> int:
+        return self.recorder.frames
+
+    @property
+    def interval(self) -> int:
+        return self.__interval
+
+    @property
+    def keyframe_bytes(self) -> int:
+        return self.__size
+
+    def __call__(self, event: Event) -> None:
+        """Record one event.
+
+        Args:
+            event: Event of the run
+        """
+        if not self.__keyframes:
+            self.__snapshot(0)
+        self.recorder(event)
+
+    def frame(self) -> None:
+        """Mark the end of one yielded state, keyframing it if due."""
+        if not self.__keyframes:
+            self.__snapshot(self.recorder.steps_size)
+        self.recorder.frame()
+        if self.head % self.__interval == 0:
+            self.__snapshot(self.recorder.steps_size)
+
+    def seek(self, frame: int) -> int:
+        """Put the maze in the state of a frame.
+
+        Args:
+            frame: Frame number, clamped to 1..head
+
+        Returns:
+            int: The frame the maze is in, 0 if nothing was recorded yet
+        """
+        if not self.__keyframes or self.head == 0:
+            return 0
+        frame = max(1, min(frame, self.head))
+        frames = [keyframe.frame for keyframe in self.__keyframes]
+        keyframe = self.__keyframes[bisect_right(frames, frame) - 1]
+
+        maze = self.__maze
+        grid = maze.grid
+        # Phase steps set gen_step, which must not reach the sink again
+        events, maze.events = maze.events, None
+        try:
+            packed = zlib.decompress(keyframe.grid)
+            grid.walls[:] = packed.translate(_WALLS_TABLE)
+            grid.visited[:] = packed.translate(_VISITED_TABLE)
+            maze.active_cell = keyframe.active_cell
+            maze.gen_step = keyframe.gen_step
+            current = keyframe.frame
+            if current < frame:
+                with self.recorder.steps_view as steps:
+                    for _ in play_steps(maze, steps, keyframe.position):
+                        current += 1
+                        if current == frame:
+                            break
+        finally:
+            maze.events = events
+        return frame
+
+    def __snapshot(self, position: int) -> None:
+        """Keyframe the current state of the maze.
+
+        Args:
+            position: Offset of the next step in the step log
+        """
+        maze = self.__maze
+        grid = maze.grid
+        size = len(grid.walls)
+        # Visited marks go to bit 4; no carry, wall codes fit in 4 bits
+        packed = (
+            int.from_bytes(grid.visited.translate(_MARK_TABLE), "little") << 4
+            | int.from_bytes(grid.walls, "little")
+        ).to_bytes(size, "little")
+        keyframe = _Keyframe(self.head, position, zlib.compress(packed, 1),
+                             maze.active_cell, maze.gen_step)
+        self.__keyframes.append(keyframe)
+        self.__size += len(keyframe.grid)
+        while self.__size > self.__budget and len(self.__keyframes) > 2:
+            self.__thin()
+
+    def __thin(self) -> None:
+        """Drop every other keyframe and double the interval.
+
+        The first keyframe is the base of every seek and always stays.
+        """
+        self.__interval *= 2
+        kept = [self.__keyframes[0]] + [
+            keyframe for keyframe in self.__keyframes[1:]
+            if keyframe.frame % self.__interval == 0]
+        self.__size = sum(len(keyframe.grid) for keyframe in kept)
+        self.__keyframes = kept
@@ -0,0 +1,83 @@
+"""The maze cache hits, misses, evicts and drops stale versions."""
+
+import os
+from pathlib import Path
+import pytest
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.algorithms import binary_tree
+from mazegen.model import ConfigModel
+from mazegen.utils.cache import CachedMaze, MazeCache
+
+
+def entry(fill: int) -> CachedMaze:
+    """Return an entry of 10 bytes in memory."""
+    return CachedMaze(bytes([fill]) * 8, "ES")
+
+
+def test_memory_hit_and_miss() -> None:
+    cache = MazeCache(memory_bytes=100)
+    assert cache.get("prim", 1, "a") is None
+    cache.put("prim", 1, "a", entry(1))
+    assert cache.get("prim", 1, "a") == entry(1)
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1,
+                             "evictions": 0, "entries": 1, "bytes": 10}
+
+
+def test_memory_evicts_least_recently_used_bytes() -> None:
+    cache = MazeCache(memory_bytes=25)
+    cache.put("prim", 1, "a", entry(1))
+    cache.put("prim", 1, "b", entry(2))
+    cache.get("prim", 1, "a")
+    cache.put("prim", 1, "c", entry(3))
+    assert cache.get("prim", 1, "b") is None
+    assert cache.get("prim", 1, "a") == entry(1)
+    assert cache.get("prim", 1, "c") == entry(3)
+    assert cache.evictions == 1
+    assert cache.stats()["bytes"] == 20
+
+
+def test_disk_hit_from_another_cache(tmp_path: Path) -> None:
+    MazeCache(directory=str(tmp_path)).put("prim", 1, "a", entry(1))
+    cache = MazeCache(directory=str(tmp_path))
+    assert cache.get("prim", 1, "a") == entry(1)
+    assert cache.disk_hits == 1
+    assert cache.get("prim", 1, "a") == entry(1)
+    assert cache.hits == 1
+
+
+def test_new_version_removes_stale_folder(tmp_path: Path) -> None:
+    MazeCache(directory=str(tmp_path)).put("prim", 1, "a", entry(1))
+    MazeCache(directory=str(tmp_path)).put("kruskal", 1, "a", entry(1))
+    cache = MazeCache(directory=str(tmp_path))
+    assert cache.get("prim", 2, "a") is None
+    assert sorted(os.listdir(tmp_path)) == ["kruskal-v1"]
+
+
+def test_disk_evicts_oldest_files(tmp_path: Path) -> None:
+    writer = MazeCache(memory_bytes=0, directory=str(tmp_path))
+    writer.put("prim", 1, "a", entry(1))
+    size = os.path.getsize(tmp_path / "prim-v1" / "a.maze")
+    cache = MazeCache(memory_bytes=0, directory=str(tmp_path),
+                      disk_bytes=2 * size)
+    for index, key in enumerate("bc"):
+        os.utime(tmp_path / "prim-v1" / "a.maze", (index, index))
+        cache.put("prim", 1, key, entry(1))
+    assert sorted(os.listdir(tmp_path / "prim-v1")) == ["b.maze", "c.maze"]
+    assert cache.evictions == 1
+
+
+@pytest.mark.skipif(not binary_tree.HAS_NUMPY, reason="NumPy not installed")
+def test_engines_do_not_share_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = ConfigModel(
+        WIDTH=40, HEIGHT=30, ENTRY=(0, 0), EXIT=(39, 29),
+        OUTPUT_FILE="maze.txt", ALGORITHM="binary_tree", SEED="abc")
+    cache = MazeCache()
+    walls = []
+    for numpy in (True, False):
+        monkeypatch.setattr(binary_tree, "HAS_NUMPY", numpy)
+        generator = MazeGenerator(config, cache=cache)
+        for _ in generator.generate_maze():
+            pass
+        walls.append(bytes(generator.maze.grid.walls))
+    assert cache.misses == 2
+    assert walls[0] != walls[1]
@@ -0,0 +1,45 @@
+"""A replay file plays back the frames of the recorded run."""
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+import pytest
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.algorithms.factory import AlgorithmFactory
+from mazegen.maze.maze import Maze
+from mazegen.model import ConfigModel
+from mazegen.utils.replay import Replay, ReplayRecorder
+
+
+Frame = Tuple[bytes, bytes, Optional[Tuple[int, int, int]], int]
+
+
+def state(maze: Maze) -> Frame:
+    """Return the walls, visited marks, active cell and step of a maze."""
+    return (bytes(maze.grid.walls), bytes(maze.grid.visited),
+            maze.active_cell, maze.gen_step)
+
+
+@pytest.mark.parametrize("algorithm",
+                         AlgorithmFactory.get_available_algorithms())
+@pytest.mark.parametrize("perfect", [True, False])
+def test_play_matches_run(algorithm: str, perfect: bool,
+                          tmp_path: Path) -> None:
+    config = ConfigModel(
+        WIDTH=40, HEIGHT=30, ENTRY=(0, 0), EXIT=(39, 29),
+        OUTPUT_FILE="maze.txt", ALGORITHM=algorithm, MODE_GEN="animated",
+        PERFECT=perfect, SEED="abc", CACHE_MB=0)
+    generator = MazeGenerator(config)
+    recorder = ReplayRecorder(generator.maze)
+    live: List[Frame] = []
+    for maze in generator.generate_maze(events=recorder):
+        recorder.frame()
+        live.append(state(maze))
+    path = str(tmp_path / "run.mzr")
+    recorder.save(path, algorithm, "abc")
+
+    replay = Replay.load(path)
+    played = [state(maze) for maze in replay.play(replay.build_maze())]
+    assert played == live
+    final = replay.fast_forward(replay.build_maze())
+    assert bytes(final.grid.walls) == bytes(generator.maze.grid.walls)
+    assert final.shortest_path == generator.maze.shortest_path
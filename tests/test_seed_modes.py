@@ -0,0 +1,38 @@
+"""A seed gives the same maze whatever the generation mode."""
+
+import pytest
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.algorithms.binary_tree import HAS_NUMPY
+from mazegen.algorithms.factory import AlgorithmFactory
+from mazegen.model import ConfigModel
+
+
+# Static runs of these use the NumPy engine, documented to differ
+NUMPY_ENGINES = ("binary_tree", "sidewinder")
+
+
+def generate(algorithm: str, mode: str, **settings: object) -> bytes:
+    """Generate a 40x30 maze and return its walls."""
+    config = ConfigModel(
+        WIDTH=40, HEIGHT=30, ENTRY=(0, 0), EXIT=(39, 29),
+        OUTPUT_FILE="maze.txt", ALGORITHM=algorithm, MODE_GEN=mode,
+        SEED="abc", CACHE_MB=0, **settings)  # type: ignore[arg-type]
+    generator = MazeGenerator(config)
+    for _ in generator.generate_maze():
+        pass
+    return bytes(generator.maze.grid.walls)
+
+
+@pytest.mark.parametrize("algorithm", [
+    name for name in AlgorithmFactory.get_available_algorithms()
+    if not (HAS_NUMPY and name in NUMPY_ENGINES)])
+@pytest.mark.parametrize("settings", [
+    {"PERFECT": True},
+    {"PERFECT": False},
+    {"PERFECT": False, "LOOP_DENSITY": 0.3},
+    {"PERFECT": False, "BRAID": 0.5},
+])
+def test_static_matches_animated(algorithm: str,
+                                 settings: dict[str, object]) -> None:
+    assert (generate(algorithm, "static", **settings)
+            == generate(algorithm, "animated", **settings))
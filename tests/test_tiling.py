@@ -0,0 +1,23 @@
+"""Tiled generation gives the same maze whatever the number of workers."""
+
+import pytest
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.model import ConfigModel
+
+
+def generate(algorithm: str, workers: int) -> bytes:
+    """Generate a 130x90 maze in tiles of 32 and return its walls."""
+    config = ConfigModel(
+        WIDTH=130, HEIGHT=90, ENTRY=(0, 0), EXIT=(129, 89),
+        OUTPUT_FILE="maze.txt", ALGORITHM=algorithm, SEED="abc",
+        LARGE_MAZE=True, TILE_SIZE=32, WORKERS=workers)
+    generator = MazeGenerator(config)
+    for _ in generator.generate_maze():
+        pass
+    return bytes(generator.maze.grid.walls)
+
+
+@pytest.mark.parametrize("algorithm", [
+    "backtracking", "prim", "kruskal", "wilson", "hunt_and_kill"])
+def test_workers_do_not_change_maze(algorithm: str) -> None:
+    assert generate(algorithm, 1) == generate(algorithm, 2)
@@ -0,0 +1,47 @@
+"""Seeking a timeline restores past frames and resumes the run intact."""
+
+from typing import List, Optional, Tuple
+import pytest
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.algorithms.factory import AlgorithmFactory
+from mazegen.maze.maze import Maze
+from mazegen.model import ConfigModel
+from mazegen.utils.timeline import Timeline
+
+
+Frame = Tuple[bytes, bytes, Optional[Tuple[int, int, int]], int]
+
+
+def state(maze: Maze) -> Frame:
+    """Return the walls, visited marks, active cell and step of a maze."""
+    return (bytes(maze.grid.walls), bytes(maze.grid.visited),
+            maze.active_cell, maze.gen_step)
+
+
+def generator(algorithm: str, perfect: bool) -> MazeGenerator:
+    """Create the generator of a 40x30 animated run."""
+    return MazeGenerator(ConfigModel(
+        WIDTH=40, HEIGHT=30, ENTRY=(0, 0), EXIT=(39, 29),
+        OUTPUT_FILE="maze.txt", ALGORITHM=algorithm, MODE_GEN="animated",
+        PERFECT=perfect, SEED="abc", CACHE_MB=0))
+
+
+@pytest.mark.parametrize("algorithm",
+                         AlgorithmFactory.get_available_algorithms())
+@pytest.mark.parametrize("perfect", [True, False])
+def test_seek_and_resume(algorithm: str, perfect: bool) -> None:
+    live = [state(maze)
+            for maze in generator(algorithm, perfect).generate_maze()]
+
+    run = generator(algorithm, perfect)
+    # A small budget makes the timeline drop keyframes along the way
+    timeline = Timeline(run.maze, interval=7, budget=3000)
+    seen: List[Frame] = []
+    for index, maze in enumerate(run.generate_maze(events=timeline)):
+        timeline.frame()
+        if index % 5 == 4:
+            for frame in (1, index // 2 + 1, timeline.head):
+                assert timeline.seek(frame) == frame
+                assert state(maze) == live[frame - 1]
+        seen.append(state(maze))
+    assert seen == live
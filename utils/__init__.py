@@ -1,5 +1,6 @@
 """Utilities module for the maze generation application."""
 
 from utils.env_check import EnvCheck
+from utils.pacing import FramePacer
 
-__all__ = ["EnvCheck"]
+__all__ = ["EnvCheck", "FramePacer"]
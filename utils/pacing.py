@@ -0,0 +1,106 @@
+"""
+Pace animations by algorithm steps instead of rendered frames.
+
+Rendering every yielded state caps an animation at the frame rate: a run
+of 80k states at 120 FPS takes over ten minutes, and longer still when a
+render is slow. The pacer targets a number of algorithm steps per second
+instead, measures how long a render takes, and tells the caller how many
+steps to run between two renders so the display keeps up.
+"""
+
+import math
+import time
+
+
+# Weight of the newest render time in the running average
+RENDER_SMOOTHING = 0.2
+
+
+class FramePacer():
+    """
+    Decide which algorithm steps get rendered, for a target step rate.
+
+    Call step() for every yielded state: it returns True when that state
+    should be rendered. After rendering, report the render time to
+    rendered(), which plans the next batch of steps and returns how long
+    to wait to stay on schedule.
+
+    Attributes:
+        rate: Target algorithm steps per second
+        __max_fps: Highest number of renders per second
+        __start: Clock time the schedule starts from
+        __steps: Steps taken so far
+        __next: Step count of the next render
+        __shown: Step count of the last render
+        __render_cost: Running average of the render time in seconds
+    """
+
+    def __init__(self, rate: float, max_fps: int) -> None:
+        """
+        Initialize a pacer.
+
+        Args:
+            rate: Target algorithm steps per second
+            max_fps: Highest number of renders per second
+
+        Raises:
+            ValueError: If rate or max_fps is not positive
+        """
+        if rate <= 0 or max_fps <= 0:
+            raise ValueError("Pacing rate and frame rate must be positive")
+        self.rate = rate
+        self.__max_fps = max_fps
+        self.__start = time.perf_counter()
+        self.__steps = 0
+        self.__next = 1
+        self.__shown = 0
+        self.__render_cost = 0.0
+
+    @property
+    def pending(self) -> bool:
+        """Whether steps were taken since the last render."""
+        return self.__steps > self.__shown
+
+    def start(self) -> None:
+        """Start the schedule now, with no step taken."""
+        self.__start = time.perf_counter()
+        self.__steps = 0
+        self.__next = 1
+        self.__shown = 0
+
+    def resync(self) -> None:
+        """Put the schedule back on time after a pause."""
+        self.__start = time.perf_counter() - self.__steps / self.rate
+
+    def step(self) -> bool:
+        """
+        Count one algorithm step.
+
+        Returns:
+            bool: True if the state of this step should be rendered
+        """
+        self.__steps += 1
+        return self.__steps >= self.__next
+
+    def rendered(self, cost: float) -> float:
+        """
+        Record a render and plan the next one.
+
+        The next render comes after enough steps to cover one frame at the
+        target rate, where a frame lasts the average render time but no
+        less than 1 / max_fps, plus the steps the schedule is behind by.
+
+        Args:
+            cost: Duration of the render in seconds
+
+        Returns:
+            float: Seconds to wait before the next step, 0 when late
+        """
+        self.__shown = self.__steps
+        self.__render_cost += RENDER_SMOOTHING * (cost - self.__render_cost)
+        frame = max(self.__render_cost, 1 / self.__max_fps)
+        elapsed = time.perf_counter() - self.__start
+        behind = max(0, int(elapsed * self.rate) - self.__steps)
+        self.__next = self.__steps + max(
+            1, math.ceil(self.rate * frame)) + behind
+        return max(0.0, self.__steps / self.rate - elapsed)
@@ -8,7 +8,7 @@ Classes:
 """
 
 from typing import Optional
-from mazegen.cell.cell import Cell
+from mazegen.maze.grid import GridCell
 from mazegen.maze.maze import Maze
 from view.utils.Colors import ColorsTty
 from mazegen.model import ConfigModel
@@ -76,11 +76,11 @@ class BasicView(View):
 
         self.__active_color = self.__color_list[new_index]
 
-    def view_cell(self, cell: Cell) -> str:
+    def view_cell(self, cell: GridCell) -> str:
         """Generate ASCII art representation of a single cell.
 
         Args:
-            cell: The Cell object to visualize
+            cell: The grid cell accessor to visualize
 
         Returns:
             str: Multi-line ASCII art string representing the cell with walls
@@ -38,6 +38,8 @@ class Anims:
         self.view = view
         self.grid = grid
         self.light = light
+        # Own generator, so the effects never draw from the maze's one
+        self.__rng = random.Random()
         self.__maze = maze
         self.__viewmode = viewmode
         self.x1 = self.view.xoffset
@@ -79,19 +81,20 @@ class Anims:
             self.light.light_cell(x=x, y=y, lit_max=lit,
                                   dim_lit=1 / (2 * lit))
 
+        grid = self.__maze.grid
+        width = self.__maze.width
         for y in range(self.__maze.height):
-            for x in range(self.__maze.width):
-                since = self.__maze.maze_grid[y][x].visited_since
-                if since > 0:
-                    self.__maze.maze_grid[y][x].visited_since = since + 1
+            for x in range(width):
+                index = y * width + x
+                since = grid.get_visited_since(index)
                 if 0 < since <= 50:
                     on_fire += 1
-                if (self.__maze.maze_grid[y][x].visited is True
-                   or self.__maze.maze_grid[y][x].locked is True):
+                if since > 0:
+                    since += 1
+                    grid.set_visited_since(index, since)
+                if grid.visited[index] or grid.is_locked(index):
                     cell_done += 1
-                cell = f"{self.__maze.maze_grid[y][x].view_cell()}"
-                code = int(cell, 16)
-                since = self.__maze.maze_grid[y][x].visited_since
+                code = grid.walls[index]
                 if 0 < since <= 5:
                     ignite(x, y, code, " 💥 ", "🔥", 4.0)
                 elif 5 < since <= 20:
@@ -140,7 +143,7 @@ class Anims:
         interval = 1 / self.view.speed
         gx = cell_x * 6 + self.view.xoffset
         gy = cell_y * 3 + self.view.yoffset
-        rnd = random.randrange(2)
+        rnd = self.__rng.randrange(2)
         if wall_code == 2:
             self.light.light_cell_from_xy(gx, gy, 0.25)
             self.light.light_cell_from_xy(gx + 6, gy, 0.25)
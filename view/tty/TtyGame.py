@@ -66,7 +66,7 @@ class Game:
                 self.endgame()
             return
         x, y = self.x_cell_pc, self.y_cell_pc
-        cell_code = int(self.__maze.maze_grid[y][x].view_cell(), 16)
+        cell_code = self.__maze.maze_grid[y][x].wall
         go_x, go_y = 0, 0
         if key in ("Z", "W") and not cell_code & 1:
             self.y_cell_pc -= 1
@@ -11,6 +11,7 @@ Classes:
 from view.tty.TtyView import TtyView
 from view.tty.TtyUtils import Canvas
 from mazegen.maze.maze import Maze
+from mazegen.maze.grid import FLAG_LOCKED
 from typing import Tuple
 import heapq
 
@@ -40,12 +41,15 @@ class Light:
 
     def reset_light_zone(self, x1: int, y1: int, x2: int, y2: int) -> None:
         ansi_off: str = str(self.grid.color_wall_ground(0))
+        walls = self.__maze.grid.walls
+        flags = self.__maze.grid.flags
+        width = self.__maze.width
         for y in range(y1, y2):
             for x in range(x1, x2):
                 x_cell = int((x - self.xoffset) / 6)
                 y_cell = int((y - self.yoffset) / 3)
-                cell = self.__maze.maze_grid[y_cell][x_cell]
-                if cell.view_cell() == "F" or cell.locked is True:
+                index = y_cell * width + x_cell
+                if walls[index] == 0xF or flags[index] & FLAG_LOCKED:
                     continue
                 self.grid._grid[y][x].color = ansi_off
                 self.grid._grid[y][x].lit = 0
@@ -66,10 +70,10 @@ class Light:
     ) -> None:
 
         def cell_code(mx: int, my: int) -> int:
-            return int(str(maze.maze_grid[my][mx].view_cell()), 16)
+            return walls[my * mw + mx]
 
         def locked(mx: int, my: int) -> bool:
-            return bool(maze.maze_grid[my][mx].locked)
+            return bool(flags[my * mw + mx] & FLAG_LOCKED)
 
         def square_to_canvas(sx: int, sy: int) -> Tuple[int, int]:
             cx = self.xoffset + (sx * 2)
@@ -135,9 +139,11 @@ class Light:
 
         maze = self.__maze
         mw, mh = maze.width, maze.height
+        walls = maze.grid.walls
+        flags = maze.grid.flags
         if not (0 <= x < mw and 0 <= y < mh):
             return
-        if maze.maze_grid[y][x].locked:
+        if locked(x, y):
             return
         if lit_max <= 0:
             return
@@ -158,7 +164,7 @@ class Light:
                 if ox*ox + oy*oy <= 2:
                     mx0 = sx0 // 3
                     my0 = sy0 // 3
-                    if maze.maze_grid[my0][mx0].locked:
+                    if locked(mx0, my0):
                         continue
                     heapq.heappush(heap, (-lit_max, sx0, sy0, -1))
                     for d in range(4):